@@ -0,0 +1,53 @@
+"""
+Benchmark: synchronous WebCrawler vs AsyncWebCrawler on a local fixture site.
+
+Usage:
+    python benchmarks/bench_async_crawl.py [--latency 0.2] [--concurrency 8]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from emailscope.crawler import WebCrawler
+from emailscope.async_crawler import AsyncWebCrawler
+from fixture_site import FixtureSite
+
+def run_crawl(crawler, url):
+    """Run a crawl quietly and return (urls, seconds)."""
+    start = time.perf_counter()
+    with redirect_stdout(StringIO()):
+        urls = crawler.crawl_company_website(url)
+    return urls, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--latency', type=float, default=0.2, help='Server latency per request (s)')
+    parser.add_argument('--delay', type=float, default=0.05, help='Crawler politeness delay (s)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Async fetches in flight')
+    parser.add_argument('--burst', type=int, default=4, help='Per-host rate limiter burst')
+    parser.add_argument('--max-pages', type=int, default=30)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    settings = dict(delay=args.delay, timeout=5, bypass_robots=True,
+                    max_depth=2, max_pages=args.max_pages, rate_limit=args.delay,
+                    rate_burst=args.burst)
+
+    with FixtureSite(latency=args.latency) as site:
+        sync_urls, sync_time = run_crawl(WebCrawler(**settings), site.url)
+        async_urls, async_time = run_crawl(AsyncWebCrawler(concurrency=args.concurrency, **settings), site.url)
+
+    print(f"sync : {len(sync_urls):3d} urls in {sync_time:6.2f}s")
+    print(f"async: {len(async_urls):3d} urls in {async_time:6.2f}s  (concurrency={args.concurrency})")
+    print(f"speedup: {sync_time / async_time:.1f}x, same URL set: {set(sync_urls) == set(async_urls)}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark: per-address normalization and format checks vs BulkValidator.
+
+Usage:
+    python benchmarks/bench_bulk_validate.py [--count 1000000] [--chunk-size 50000]
+
+Addresses are synthetic: mostly plain, some uppercased, spelled with spaces
+around '@' and '.', wrapped in parentheses, or malformed, like a CSV export.
+"""
+
+import argparse
+import os
+import random
+import re
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from emailscope.bulk import BulkValidator
+from emailscope.verifier import EmailVerifier
+
+def legacy_normalize(email):
+    """Normalize as EmailExtractor._normalize_email did before normalize_email."""
+    if not email:
+        return ""
+    email = email.strip('()')
+    email = re.sub(r'\s*@\s*', '@', email)
+    email = re.sub(r'\s*\.\s*', '.', email)
+    email = email.strip()
+    return email.lower()
+
+def synthetic_addresses(count, seed=7):
+    """Generate a mix of clean, messy and invalid addresses."""
+    rng = random.Random(seed)
+    tlds = ['com', 'org', 'io', 'co.uk', 'de', 'x']
+    addresses = []
+    for _ in range(count):
+        local = ''.join(rng.choices(string.ascii_lowercase + '._', k=rng.randint(3, 14))).strip('._') or 'info'
+        domain = ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 12)))
+        email = f"{local}@{domain}.{rng.choice(tlds)}"
+        kind = rng.random()
+        if kind < 0.05:
+            email = email.upper()
+        elif kind < 0.08:
+            email = f" {email.replace('@', ' @ ').replace('.', ' . ')} "
+        elif kind < 0.09:
+            email = f"({email})"
+        elif kind < 0.11:
+            email = email.replace('@', '')
+        elif kind < 0.12:
+            email = ''
+        addresses.append(email)
+    return addresses
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=1000000)
+    parser.add_argument('--chunk-size', type=int, default=50000)
+    args = parser.parse_args()
+
+    addresses = synthetic_addresses(args.count)
+    verifier = EmailVerifier(mock_dns=True)
+
+    start = time.perf_counter()
+    emails = [legacy_normalize(address) for address in addresses]
+    legacy = [verifier._validate_email_format(email) for email in emails]
+    legacy_time = time.perf_counter() - start
+
+    validator = BulkValidator(verifier, chunk_size=args.chunk_size)
+    start = time.perf_counter()
+    result = validator.validate(iter(addresses))
+    bulk_time = time.perf_counter() - start
+
+    same = (emails == result.emails and [ok for ok, _ in legacy] == result.valid
+            and [reason for _, reason in legacy] == result.reasons)
+    print(f"addresses: {len(addresses)}, valid: {sum(result.valid)}, chunk size: {args.chunk_size}")
+    print(f"per address  : {legacy_time:6.2f}s  {len(addresses) / legacy_time:>10,.0f}/s")
+    print(f"BulkValidator: {bulk_time:6.2f}s  {len(addresses) / bulk_time:>10,.0f}/s  "
+          f"({legacy_time / bulk_time:.1f}x, {'identical' if same else 'DIFFERENT'} results)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark: email extraction from raw bytes, parsed vs byte-level scanning.
+
+Usage:
+    python benchmarks/bench_byte_scan.py [--corpus DIR] [--repeat 3]
+
+DIR holds saved pages (*.html / *.htm). Without --corpus a synthetic corpus
+is generated from the fixture site. Each parser backend decodes, parses and
+scans every page; ByteScanner scans the same bytes without a document tree.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_extract_pool import corpus_pages
+from emailscope.charset import CharsetDecoder
+from emailscope.extractor import EmailExtractor
+from emailscope.parsers import available_parsers, get_parser
+
+def parsed_emails(extractor, parser, decoder, pages):
+    """Extract as the crawler and extractor do: decode, parse, scan."""
+    results = []
+    for page in pages:
+        document = parser.parse(decoder.decode(page, 'text/html'))
+        mailto_links = [href for href in document.hrefs if href.lower().startswith('mailto:')]
+        results.append(extractor.extract_page_emails(document.text, mailto_links=mailto_links)[0])
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--corpus', help='Directory of saved HTML pages')
+    parser.add_argument('--repeat', type=int, default=3, help='Passes over the corpus')
+    args = parser.parse_args()
+
+    pages = corpus_pages(args.corpus, args.repeat)
+    extractor = EmailExtractor()
+    print(f"{len(pages)} pages, {sum(len(page) for page in pages) / 1e6:.1f}MB")
+
+    start = time.perf_counter()
+    scanned = [extractor.extract_body_emails(page, 'text/html')[0] for page in pages]
+    byte_time = time.perf_counter() - start
+
+    print(f"{'mode':<20} {'seconds':>8} {'pages/sec':>10} {'emails':>8}")
+    for name in available_parsers():
+        start = time.perf_counter()
+        parsed = parsed_emails(extractor, get_parser(name), CharsetDecoder(), pages)
+        elapsed = time.perf_counter() - start
+        differing = sum(1 for a, b in zip(parsed, scanned) if a != b)
+        print(f"{'parse ' + name:<20} {elapsed:>8.2f} {len(pages) / elapsed:>10.1f} "
+              f"{sum(map(len, parsed)):>8}  ({differing} pages differ from byte scan)")
+    print(f"{'byte scan':<20} {byte_time:>8.2f} {len(pages) / byte_time:>10.1f} {sum(map(len, scanned)):>8}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark: page extraction on threads vs an ExtractionPool of worker processes.
+
+Usage:
+    python benchmarks/bench_extract_pool.py [--corpus DIR] [--repeat 3] [--workers 1,2,4] [--parser lxml]
+
+DIR holds saved pages (*.html / *.htm). Without --corpus a synthetic corpus
+is generated from the fixture site. Every page is decoded, parsed and
+scanned from its raw bytes, as for pages the crawl no longer holds.
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_extractor import contact_page
+from bench_parsers import load_corpus
+from emailscope.extract_pool import ExtractionPool, _Worker
+
+def corpus_pages(corpus_dir, repeat):
+    """Load the corpus; synthetic pages also get a long contact section to scan."""
+    pages = load_corpus(corpus_dir)
+    if not corpus_dir:
+        pages = [page.replace(b'</body>', f'<p>{contact_page(20000, seed=i)}</p></body>'.encode('utf-8'))
+                 for i, page in enumerate(pages)]
+    return pages * repeat
+
+def run_threads(pages, workers, args):
+    """Extract every page on threads sharing one extractor (the dashboard's default)."""
+    worker = _Worker(args.parser, args.regex_engine, None)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda page: worker.extract(page, 'text/html', None, (), None), pages))
+
+def run_processes(pages, workers, args):
+    """Extract every page on an ExtractionPool."""
+    with ExtractionPool(workers, parser=args.parser, regex_engine=args.regex_engine) as pool:
+        # Start the processes before timing, as a long-running dashboard would have them
+        for future in [pool.extract_text('') for _ in range(workers)]:
+            future.result()
+        started = time.perf_counter()
+        results = [future.result() for future in [pool.extract_body(page, 'text/html') for page in pages]]
+        return results, time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--corpus', help='Directory of saved HTML pages')
+    parser.add_argument('--repeat', type=int, default=3, help='Passes over the corpus')
+    parser.add_argument('--workers', default=None,
+                        help='Comma-separated worker counts (default 1, 2, 4, ... up to the CPU count)')
+    parser.add_argument('--parser', default='lxml', help='HTML parser backend')
+    parser.add_argument('--regex-engine', default='re', help='re or re2')
+    args = parser.parse_args()
+
+    cpus = os.cpu_count() or 1
+    if args.workers:
+        counts = [int(count) for count in args.workers.split(',')]
+    else:
+        counts = sorted({min(2 ** power, cpus) for power in range(cpus.bit_length() + 1)})
+
+    pages = corpus_pages(args.corpus, args.repeat)
+    print(f"{len(pages)} pages, {sum(len(page) for page in pages) / 1e6:.1f}MB, {cpus} CPUs, parser {args.parser}")
+
+    started = time.perf_counter()
+    expected = run_threads(pages, 1, args)
+    serial = time.perf_counter() - started
+    expected = [result.records for result in expected]
+    print(f"{'mode':<12} {'workers':>7} {'seconds':>8} {'pages/sec':>10} {'speedup':>8}")
+    print(f"{'serial':<12} {1:>7} {serial:>8.2f} {len(pages) / serial:>10.1f} {1.0:>7.2f}x")
+
+    for workers in counts:
+        started = time.perf_counter()
+        results = run_threads(pages, workers, args)
+        elapsed = time.perf_counter() - started
+        same = '' if [result.records for result in results] == expected else '  DIFFERENT'
+        print(f"{'threads':<12} {workers:>7} {elapsed:>8.2f} {len(pages) / elapsed:>10.1f} "
+              f"{serial / elapsed:>7.2f}x{same}")
+
+        results, elapsed = run_processes(pages, workers, args)
+        same = '' if [result.records for result in results] == expected else '  DIFFERENT'
+        print(f"{'processes':<12} {workers:>7} {elapsed:>8.2f} {len(pages) / elapsed:>10.1f} "
+              f"{serial / elapsed:>7.2f}x{same}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Microbenchmark: legacy per-pattern email extraction vs the single-pass EmailScanner.
+
+Usage:
+    python benchmarks/bench_extractor.py [--size 1000000] [--adversarial-size 20000] [--regex-engine re2]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from emailscope.extractor import EmailExtractor
+
+LEGACY_PATTERNS = [
+    re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+    re.compile(r'\b[A-Za-z0-9._%+-]+\s*@\s*[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+    re.compile(r'\([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\)'),
+    re.compile(r'\b[A-Za-z0-9._%+-]+\s+at\s+[A-Za-z0-9.-]+\s+dot\s+[A-Z|a-z]{2,}\b', re.I),
+    re.compile(r'\b[A-Za-z0-9._%+-]+\s*\[at\]\s*[A-Za-z0-9.-]+\s*\[dot\]\s*[A-Z|a-z]{2,}\b', re.I)
+]
+
+def legacy_extract(extractor, content):
+    """Extract as EmailExtractor.extract_emails_from_content did before EmailScanner."""
+    emails = set()
+    if not content:
+        return emails
+
+    for pattern in LEGACY_PATTERNS:
+        for email in pattern.findall(content):
+            clean_email = extractor._normalize_email(email)
+            if clean_email and extractor._is_valid_email(clean_email):
+                emails.add(clean_email)
+
+    at_dot_pattern = re.compile(r'\b([A-Za-z0-9._%+-]+)\s+at\s+([A-Za-z0-9.-]+)\s+dot\s+([A-Z|a-z]{2,})\b', re.I)
+    bracket_pattern = re.compile(r'\b([A-Za-z0-9._%+-]+)\s*\[at\]\s*([A-Za-z0-9.-]+)\s*\[dot\]\s*([A-Z|a-z]{2,})\b', re.I)
+    for pattern in (at_dot_pattern, bracket_pattern):
+        for user, domain, tld in pattern.findall(content):
+            email = f"{user}@{domain}.{tld}"
+            if extractor._is_valid_email(email):
+                emails.add(email.lower())
+
+    for keyword in extractor.email_context_keywords:
+        context_pattern = re.compile(
+            rf'(?:{re.escape(keyword)}[^@]*?)([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{{2,}})',
+            re.I
+        )
+        for email in context_pattern.findall(content):
+            clean_email = extractor._normalize_email(email)
+            if clean_email and extractor._is_valid_email(clean_email):
+                emails.add(clean_email)
+
+    return emails
+
+WORDS = ['the', 'our', 'team', 'at', 'support', 'contact', 'email', 'services', 'about', 'we',
+         'help', 'clients', 'message', 'products', 'question', 'pricing', 'office', 'hours', 'look']
+
+def contact_page(size, seed=7):
+    """Generate page text with prose, keywords and addresses in every supported form."""
+    rng = random.Random(seed)
+    forms = ['{u}@{d}.com', '{u} @ {d}.org', '({u}@{d}.net)', '{u} at {d} dot com',
+             '{u}[at]{d}[dot]io', 'Email: {u}.{v}@{d}.co.uk']
+    parts = []
+    length = 0
+    while length < size:
+        if rng.random() < 0.02:
+            part = rng.choice(forms).format(u=rng.choice(WORDS), v=rng.choice(WORDS),
+                                            d=f"site{rng.randint(0, 99)}")
+        else:
+            part = rng.choice(WORDS)
+        parts.append(part)
+        length += len(part) + 1
+    return ' '.join(parts)
+
+def adversarial_page(size, seed=11):
+    """Generate text full of context keywords and dotted tokens but no '@'."""
+    rng = random.Random(seed)
+    parts = []
+    length = 0
+    while length < size:
+        part = rng.choice(['contact', 'email', 'mail', 'support', 'help',
+                           '.'.join(rng.choice(WORDS) for _ in range(rng.randint(2, 20)))])
+        parts.append(part)
+        length += len(part) + 1
+    return ' '.join(parts)
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--size', type=int, default=1000000, help='characters in the contact page')
+    parser.add_argument('--adversarial-size', type=int, default=20000,
+                        help='characters in the page without an @ (the legacy time grows quadratically)')
+    parser.add_argument('--regex-engine', default='re', help='engine for EmailScanner (re or re2)')
+    args = parser.parse_args()
+
+    extractor = EmailExtractor(regex_engine=args.regex_engine)
+    pages = [('contact page', contact_page(args.size)),
+             ('no-@ page', adversarial_page(args.adversarial_size))]
+
+    for name, text in pages:
+        legacy, legacy_time = timed(legacy_extract, extractor, text)
+        scanned, scan_time = timed(extractor.extract_emails_from_content, text)
+        same = 'identical' if legacy == scanned else f"DIFFERENT ({len(legacy ^ scanned)} emails)"
+        print(f"{name} ({len(text)} chars):")
+        print(f"  legacy patterns   : {legacy_time:7.3f}s  {len(legacy)} emails")
+        print(f"  EmailScanner ({extractor.regex_engine.name:3}): {scan_time:7.3f}s  {len(scanned)} emails, {same}  "
+              f"({legacy_time / scan_time:.1f}x)")
+
+if __name__ == '__main__':
+    main()
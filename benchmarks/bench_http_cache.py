@@ -0,0 +1,63 @@
+"""
+Benchmark: re-crawling a local fixture site with and without the persistent HTTP cache.
+
+Usage:
+    python benchmarks/bench_http_cache.py [--latency 0.05] [--changed 3]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from emailscope.crawler import WebCrawler
+from emailscope.http_cache import HTTPCache
+from fixture_site import FixtureSite
+
+def run_crawl(crawler, site):
+    """Run a crawl quietly and return (urls, seconds, bytes sent, 304s)."""
+    bytes_before, not_modified_before = site.bytes_sent, site.not_modified_count
+    start = time.perf_counter()
+    with redirect_stdout(StringIO()):
+        urls = crawler.crawl_company_website(site.url)
+    return (urls, time.perf_counter() - start,
+            site.bytes_sent - bytes_before, site.not_modified_count - not_modified_before)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--latency', type=float, default=0.05, help='Server latency per request (s)')
+    parser.add_argument('--changed', type=int, default=3, help='Pages edited between crawls')
+    parser.add_argument('--max-pages', type=int, default=30)
+    parser.add_argument('--max-bytes', type=int, default=10 * 1024 * 1024, help='Cache size limit')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    with tempfile.TemporaryDirectory() as tmp, FixtureSite(latency=args.latency) as site:
+        cache = HTTPCache(os.path.join(tmp, 'http_cache.db'), max_bytes=args.max_bytes)
+        crawler = WebCrawler(delay=0, rate_limit=0, max_pages=args.max_pages, http_cache=cache)
+
+        first_urls, first_time, first_bytes, _ = run_crawl(crawler, site)
+        print(f"first crawl:  {len(first_urls)} pages, {first_bytes} bytes sent, {first_time:.2f}s")
+        print(f"  cache: {crawler.get_http_cache_stats()} ({len(cache)} entries, {cache.size()} bytes)")
+
+        # Edit a few pages so their validators change
+        for path in sorted(site.pages)[:args.changed]:
+            site.pages[path] = site.pages[path].replace('</body>', '<p>Updated.</p></body>')
+
+        cache.reset_stats()
+        second_urls, second_time, second_bytes, not_modified = run_crawl(crawler, site)
+        print(f"re-crawl:     {len(second_urls)} pages, {second_bytes} bytes sent, "
+              f"{not_modified} not modified, {second_time:.2f}s")
+        print(f"  cache: {crawler.get_http_cache_stats()}")
+        print(f"  same URLs: {sorted(first_urls) == sorted(second_urls)}")
+        print(f"  bytes saved: {1 - second_bytes / max(first_bytes, 1):.0%}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""
+Microbenchmark: legacy keyword scans vs KeywordMatcher for link scoring and industry detection.
+
+Usage:
+    python benchmarks/bench_keywords.py [--count 100000] [--sweep]
+
+Links come from the URL filter benchmark; domains are random compounds of
+common company-name words and industry keywords. Each result names the
+path KeywordMatcher took (per keyword or single pass) and, for link
+scoring, also times the path it did not take. --sweep times both paths on
+the links for growing keyword sets, which is how REGEX_MIN_KEYWORDS was set.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_url_filter import synthetic_urls
+from emailscope.crawler import WebCrawler
+from emailscope.extractor import EmailExtractor
+from emailscope.keywords import REGEX_MIN_KEYWORDS, KeywordMatcher
+
+# Further link words for keyword sets larger than the crawler's
+EXTRA_LINK_KEYWORDS = [
+    'blog', 'events', 'partners', 'investors', 'faq', 'location', 'offices', 'directory',
+    'board', 'founders', 'customers', 'service', 'sales', 'legal', 'privacy', 'imprint',
+    'impressum', 'kontakt', 'ueber', 'equipe', 'nous', 'quienes', 'somos', 'equipo',
+    'chi', 'siamo', 'mission', 'history', 'culture', 'values', 'community', 'resources',
+    'downloads', 'newsroom', 'headquarters', 'branches', 'agents', 'dealers', 'stores', 'shop',
+    'advisors', 'experts', 'consultants', 'doctors', 'lawyers', 'authors', 'editors', 'writers',
+    'speakers', 'mentors', 'trainers', 'coaches', 'volunteers', 'donate', 'members', 'alumni',
+    'faculty', 'researchers', 'labs', 'projects',
+]
+
+def legacy_link_priority(link, priority_keywords):
+    """Score as WebCrawler._link_priority did before KeywordMatcher."""
+    score = 0
+    link_lower = link.lower()
+    for keyword in priority_keywords:
+        if keyword in link_lower:
+            score += 10
+    if any(section in link_lower for section in ['/', '/home', '/index']):
+        score += 5
+    path_depth = link.count('/') - 2
+    score -= path_depth
+    return score
+
+def legacy_detect_industry(domain):
+    """Detect as EmailExtractor._detect_industry did before KeywordMatcher."""
+    tech_keywords = ['tech', 'software', 'app', 'dev', 'code', 'digital', 'it', 'computer']
+    media_keywords = ['media', 'news', 'press', 'blog', 'content', 'publishing']
+    finance_keywords = ['bank', 'finance', 'financial', 'investment', 'capital', 'money']
+    healthcare_keywords = ['health', 'medical', 'clinic', 'hospital', 'doctor', 'care']
+    education_keywords = ['edu', 'university', 'college', 'school', 'academy', 'institute']
+    retail_keywords = ['shop', 'store', 'market', 'commerce', 'retail', 'buy']
+
+    if any(keyword in domain for keyword in tech_keywords):
+        return 'tech'
+    elif any(keyword in domain for keyword in media_keywords):
+        return 'media'
+    elif any(keyword in domain for keyword in finance_keywords):
+        return 'finance'
+    elif any(keyword in domain for keyword in healthcare_keywords):
+        return 'healthcare'
+    elif any(keyword in domain for keyword in education_keywords):
+        return 'education'
+    elif any(keyword in domain for keyword in retail_keywords):
+        return 'retail'
+    return 'general'
+
+def synthetic_domains(count, seed=7):
+    """Generate company domains, about half containing an industry keyword."""
+    rng = random.Random(seed)
+    words = ['acme', 'globex', 'north', 'river', 'blue', 'united', 'summit', 'oak', 'delta', 'prime',
+             'soft', 'tech', 'bank', 'shop', 'health', 'news', 'edu', 'care', 'media', 'capital']
+    return [''.join(rng.choices(words, k=rng.randint(1, 3))) + rng.choice(['.com', '.org', '.io', '.co.uk'])
+            for _ in range(count)]
+
+def timed(function, items):
+    start = time.perf_counter()
+    results = [function(item) for item in items]
+    return results, time.perf_counter() - start
+
+def path_name(matcher):
+    return 'single pass' if matcher.single_pass else 'per keyword'
+
+def sweep(links, base_keywords):
+    """Time both matcher paths on the links for growing keyword sets."""
+    keywords = list(dict.fromkeys(base_keywords + EXTRA_LINK_KEYWORDS))
+    print(f"keywords  per keyword  single pass  (threshold {REGEX_MIN_KEYWORDS})")
+    for size in (10, 20, 30, 40, 60, 80):
+        per_keyword = KeywordMatcher(keywords[:size], single_pass=False)
+        single = KeywordMatcher(keywords[:size], single_pass=True)
+        slow, slow_time = timed(per_keyword.count, links)
+        fast, fast_time = timed(single.count, links)
+        print(f"{size:8d}  {slow_time:10.3f}s  {fast_time:10.3f}s"
+              f"{'' if slow == fast else '  DIFFERENT counts'}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=100000)
+    parser.add_argument('--sweep', action='store_true', help='time both matcher paths for 10-80 keywords')
+    args = parser.parse_args()
+
+    crawler = WebCrawler()
+    extractor = EmailExtractor()
+    urls = synthetic_urls(args.count)
+    domains = synthetic_domains(args.count)
+
+    keywords = crawler.priority_keywords
+    legacy, legacy_time = timed(lambda link: legacy_link_priority(link, keywords), urls)
+    matched, matched_time = timed(crawler._link_priority, urls)
+    print(f"links: {len(urls)}, {len(keywords)} priority keywords")
+    print(f"legacy scoring   : {legacy_time:6.3f}s")
+    print(f"KeywordMatcher   : {matched_time:6.3f}s  ({legacy_time / matched_time:.1f}x, "
+          f"{'identical' if legacy == matched else 'DIFFERENT'} scores, {path_name(crawler.priority_matcher)})")
+    other = KeywordMatcher(keywords, single_pass=not crawler.priority_matcher.single_pass)
+    lowered = [url.lower() for url in urls]
+    _, counted_time = timed(crawler.priority_matcher.count, lowered)
+    _, other_time = timed(other.count, lowered)
+    print(f"  count() only   : {counted_time:6.3f}s {path_name(crawler.priority_matcher)}, "
+          f"{other_time:6.3f}s {path_name(other)}")
+
+    legacy, legacy_time = timed(legacy_detect_industry, domains)
+    matched, matched_time = timed(extractor._detect_industry, domains)
+    print(f"domains: {len(domains)}, {len(extractor.industry_matcher.keywords)} industry keywords")
+    print(f"legacy detection : {legacy_time:6.3f}s")
+    print(f"KeywordMatcher   : {matched_time:6.3f}s  ({legacy_time / matched_time:.1f}x, "
+          f"{'identical' if legacy == matched else 'DIFFERENT'} industries, {path_name(extractor.industry_matcher)})")
+
+    if args.sweep:
+        print()
+        sweep([url.lower() for url in urls], keywords)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark: HTML parser backends (pages/sec and peak memory).
+
+Usage:
+    python benchmarks/bench_parsers.py [--corpus DIR] [--repeat 3]
+
+DIR holds saved pages (*.html / *.htm). Without --corpus a synthetic corpus
+is generated from the fixture site. Each backend runs in its own process so
+peak RSS is measured independently.
+"""
+
+import argparse
+import glob
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+def load_corpus(corpus_dir):
+    """Load saved pages as bytes, or build a synthetic corpus."""
+    if corpus_dir:
+        paths = sorted(glob.glob(os.path.join(corpus_dir, '*.htm*')))
+        pages = []
+        for path in paths:
+            with open(path, 'rb') as f:
+                pages.append(f.read())
+        return pages
+
+    from fixture_site import build_site
+    filler = ''.join(
+        f'<div class="card"><h3>Section {i}</h3><p>Lorem ipsum dolor sit amet, consectetur '
+        f'adipiscing elit <a href="/news/post-{i}">read more</a>.</p></div>' for i in range(300)
+    )
+    script = '<script>' + 'var x = "a@b.com";' * 200 + '</script>'
+    return [
+        html.replace('</body>', f'{filler}{script}</body>').encode('utf-8')
+        for html in build_site(pages_per_section=6).values()
+    ]
+
+def run_worker(backend_name, corpus_dir, repeat):
+    """Parse the corpus with one backend and print JSON results."""
+    from emailscope.parsers import get_parser
+
+    pages = load_corpus(corpus_dir)
+    parser = get_parser(backend_name)
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    links = chars = 0
+    for _ in range(repeat):
+        for page in pages:
+            document = parser.parse(page)
+            links += len(document.hrefs)
+            chars += len(document.text)
+    elapsed = time.perf_counter() - start
+
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({
+        'backend': parser.name,
+        'pages': len(pages) * repeat,
+        'seconds': elapsed,
+        'links': links,
+        'chars': chars,
+        'peak_delta_kb': peak_kb - baseline_kb,
+        'peak_kb': peak_kb,
+    }))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--corpus', help='Directory of saved HTML pages')
+    parser.add_argument('--repeat', type=int, default=3, help='Passes over the corpus')
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.corpus, args.repeat)
+        return
+
+    from emailscope.parsers import available_parsers
+
+    print(f"{'backend':<12} {'pages/sec':>10} {'peak RSS':>10} {'+parse':>9} {'links':>8} {'text chars':>11}")
+    for name in available_parsers():
+        command = [sys.executable, os.path.abspath(__file__), '--worker', name, '--repeat', str(args.repeat)]
+        if args.corpus:
+            command += ['--corpus', args.corpus]
+        output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(f"{result['backend']:<12} {result['pages'] / result['seconds']:>10.1f} "
+              f"{result['peak_kb'] / 1024:>8.1f}MB {result['peak_delta_kb'] / 1024:>7.1f}MB "
+              f"{result['links']:>8} {result['chars']:>11}")
+
+if __name__ == '__main__':
+    main()
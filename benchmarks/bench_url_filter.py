@@ -0,0 +1,90 @@
+"""
+Microbenchmark: legacy per-link filter vs the precompiled URLClassifier.
+
+Usage:
+    python benchmarks/bench_url_filter.py [--count 100000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from emailscope.url_filter import URLClassifier, canonicalize_url, site_host
+
+def legacy_filter(links, domain):
+    """Filter as WebCrawler._filter_and_prioritize_links did before URLClassifier."""
+    filtered_links = []
+    domain_parts = domain.replace('https://', '').replace('http://', '').split('/')[0]
+
+    for link in links:
+        if domain_parts not in link:
+            continue
+
+        skip_patterns = [
+            '/wp-admin/', '/admin/', '/login/', '/register/', '/signup/',
+            '/logout/', '/api/', '/ajax/', '/static/', '/assets/', '/css/',
+            '/js/', '/images/', '/img/', '/photos/', '/videos/', '/media/',
+            '/download/', '/files/', '/documents/', '/pdf/', '/doc/',
+            '/search/', '/filter/', '/sort/', '/page/', '/tag/', '/category/',
+            '/archive/', '/feed/', '/rss/', '/sitemap', '/robots.txt',
+            '/favicon.ico', '/apple-touch-icon', '/manifest.json'
+        ]
+        if any(pattern in link.lower() for pattern in skip_patterns):
+            continue
+
+        skip_extensions = ['.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+                           '.zip', '.rar', '.tar', '.gz', '.jpg', '.jpeg', '.png', '.gif',
+                           '.svg', '.ico', '.css', '.js', '.xml', '.json', '.txt']
+        if any(link.lower().endswith(ext) for ext in skip_extensions):
+            continue
+
+        filtered_links.append(link)
+    return filtered_links
+
+def synthetic_urls(count, seed=7):
+    """Generate a mix of content, asset, foreign and duplicate-spelling URLs."""
+    rng = random.Random(seed)
+    hosts = ['example.com', 'www.example.com', 'EXAMPLE.com:443', 'example.com.evil.net', 'cdn.other.org']
+    sections = ['about', 'contact', 'team', 'news', 'blog', 'products', 'static', 'images', 'wp-admin', 'page']
+    suffixes = ['', '/', '.pdf', '.jpg', '.html', '?utm_source=mail', '?b=2&a=1', '#top']
+    urls = []
+    for _ in range(count):
+        host = rng.choice(hosts)
+        path = '/'.join(rng.choice(sections) for _ in range(rng.randint(1, 3)))
+        urls.append(f"https://{host}/{path}/item-{rng.randint(0, 500)}{rng.choice(suffixes)}")
+    return urls
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=100000)
+    args = parser.parse_args()
+
+    urls = synthetic_urls(args.count)
+    domain = 'https://example.com'
+
+    start = time.perf_counter()
+    legacy = legacy_filter(urls, domain)
+    legacy_time = time.perf_counter() - start
+
+    classifier = URLClassifier()
+    start = time.perf_counter()
+    host = site_host(domain)
+    compiled = [url for url in urls if classifier.accept(url, host)]
+    compiled_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    canonical = {canonicalize_url(url) for url in compiled}
+    canonical_time = time.perf_counter() - start
+
+    foreign = sum(1 for url in legacy if site_host(url) != host)
+    print(f"urls: {len(urls)}")
+    print(f"legacy filter  : {legacy_time:6.3f}s  kept {len(legacy)} ({foreign} on foreign hosts)")
+    print(f"URLClassifier  : {compiled_time:6.3f}s  kept {len(compiled)}  ({legacy_time / compiled_time:.1f}x)")
+    print(f"canonicalize   : {canonical_time:6.3f}s  {len(set(compiled))} spellings -> {len(canonical)} canonical URLs")
+
+if __name__ == '__main__':
+    main()
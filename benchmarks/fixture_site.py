@@ -0,0 +1,202 @@
+"""
+Local fixture website for EmailScope benchmarks.
+Serves a small generated company site over http.server with artificial latency.
+"""
+
+import gzip
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+
+# Fixed Last-Modified date for every fixture page
+LAST_MODIFIED = 'Mon, 01 Jan 2024 00:00:00 GMT'
+
+SECTIONS = ['about', 'contact', 'team', 'services', 'products', 'news', 'careers', 'support']
+
+def build_site(pages_per_section: int = 4) -> Dict[str, str]:
+    """
+    Build the fixture site as a mapping of path to HTML.
+
+    Args:
+        pages_per_section: Number of detail pages under each section
+
+    Returns:
+        Dict mapping URL path to HTML body
+    """
+    site = {}
+    nav = ''.join(f'<a href="/{section}/">{section.title()}</a>' for section in SECTIONS)
+
+    site['/'] = (
+        f'<html><head><title>Fixture Co</title></head><body><nav>{nav}</nav>'
+        '<p>Welcome to Fixture Co. Write to info@fixture.test for details.</p></body></html>'
+    )
+
+    for section in SECTIONS:
+        detail_links = ''.join(
+            f'<a href="/{section}/item-{i}">{section} item {i}</a>' for i in range(pages_per_section)
+        )
+        site[f'/{section}/'] = (
+            f'<html><body><nav>{nav}</nav><h1>{section.title()}</h1>{detail_links}'
+            f'<p>Email {section}@fixture.test or <a href="mailto:{section}.desk@fixture.test">our desk</a>.</p>'
+            '</body></html>'
+        )
+        for i in range(pages_per_section):
+            site[f'/{section}/item-{i}'] = (
+                f'<html><body><nav>{nav}</nav><h2>{section} item {i}</h2>'
+                f'<p>Contact {section}{i} at fixture dot test, or person{i}@fixture.test.</p>'
+                '<script>var ignored = "script@fixture.test";</script></body></html>'
+            )
+
+    return site
+
+def build_sitemaps(paths, base_url: str) -> Dict[str, bytes]:
+    """
+    Build robots.txt and a sitemap index with one gzipped child sitemap.
+
+    Args:
+        paths: Page paths to list
+        base_url: Absolute site URL used in <loc> entries
+
+    Returns:
+        Dict mapping URL path to response body
+    """
+    ns = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+    paths = sorted(paths)
+    half = len(paths) // 2
+
+    def urlset(subset):
+        entries = ''.join(f'<url><loc>{base_url}{path}</loc></url>' for path in subset)
+        return f'<?xml version="1.0" encoding="UTF-8"?><urlset xmlns="{ns}">{entries}</urlset>'.encode('utf-8')
+
+    index = (
+        f'<?xml version="1.0" encoding="UTF-8"?><sitemapindex xmlns="{ns}">'
+        f'<sitemap><loc>{base_url}/sitemap-1.xml</loc></sitemap>'
+        f'<sitemap><loc>{base_url}/sitemap-2.xml.gz</loc></sitemap>'
+        '</sitemapindex>'
+    )
+    return {
+        '/robots.txt': f'User-agent: *\nAllow: /\nSitemap: {base_url}/sitemap_index.xml\n'.encode('utf-8'),
+        '/sitemap_index.xml': index.encode('utf-8'),
+        '/sitemap-1.xml': urlset(paths[:half]),
+        '/sitemap-2.xml.gz': gzip.compress(urlset(paths[half:])),
+    }
+
+class FixtureSite:
+    """Threaded local HTTP server serving the generated fixture site."""
+
+    def __init__(self, latency: float = 0.05, pages_per_section: int = 4, sitemaps: bool = False):
+        """
+        Initialize the fixture site.
+
+        Args:
+            latency: Artificial per-request latency in seconds
+            pages_per_section: Number of detail pages under each section
+            sitemaps: Serve robots.txt with a Sitemap entry and a sitemap index
+        """
+        self.latency = latency
+        self.pages = build_site(pages_per_section)
+        self.sitemaps = sitemaps
+        self.files: Dict[str, bytes] = {}
+        self.request_count = 0
+        self.not_modified_count = 0
+        self.redirect_count = 0
+        self.bytes_sent = 0
+        # Headers of the latest request for each path
+        self.last_headers: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _make_handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                path = self.path.split('?')[0]
+                with site._lock:
+                    site.request_count += 1
+                    site.last_headers[path] = dict(self.headers)
+                time.sleep(site.latency)
+
+                if path in site.files:
+                    data = site.files[path]
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/x-gzip' if path.endswith('.gz') else 'text/plain')
+                    self.send_header('Content-Length', str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                    return
+
+                body = site.pages.get(path)
+                if body is None and f"{path}/" in site.pages:
+                    # Redirect to the directory form, like most web servers
+                    with site._lock:
+                        site.redirect_count += 1
+                    self.send_response(301)
+                    self.send_header('Location', f"{path}/")
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                if body is None:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                data = body.encode('utf-8')
+                etag = f'"{hashlib.md5(data).hexdigest()}"'
+                if self.headers.get('If-None-Match') == etag:
+                    # Unchanged since the client's cached copy
+                    with site._lock:
+                        site.not_modified_count += 1
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+
+                with site._lock:
+                    site.bytes_sent += len(data)
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                self.send_header('ETag', etag)
+                self.send_header('Last-Modified', LAST_MODIFIED)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        """Start serving on an ephemeral localhost port."""
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        if self.sitemaps:
+            self.files = build_sitemaps(self.pages, self.url)
+        return self
+
+    def stop(self):
+        """Stop the server."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,363 @@
+"""
+Asynchronous crawl engine for EmailScope.
+Keeps several page fetches in flight while staying polite to each host.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Awaitable, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+import requests
+
+from .budget import Deadline
+from .crawler import CrawlState, WebCrawler
+from .frontier import ContactPageStopCondition, CrawlCheckpoint
+from .page_cache import CrawledPage
+from .parsers import ParsedDocument
+from .retry import CircuitOpenError
+
+class AsyncWebCrawler(WebCrawler):
+    """
+    Asyncio variant of WebCrawler.
+
+    Crawls with the same depth, max_pages and prioritization semantics as
+    WebCrawler.crawl_company_website, but keeps up to `concurrency` fetches
+    in flight. Politeness comes from the shared per-host rate limiter and a
+    per-host cap on concurrent fetches. The synchronous WebCrawler remains the
+    reference implementation.
+    """
+
+    def __init__(self, *args, concurrency: int = 5, per_host_concurrency: Optional[int] = None, **kwargs):
+        """
+        Initialize the async crawler.
+
+        Args:
+            *args: Positional arguments passed to WebCrawler
+            concurrency: Maximum number of fetches in flight
+            per_host_concurrency: Maximum fetches in flight to a single host
+                (defaults to `concurrency`)
+            **kwargs: Keyword arguments passed to WebCrawler
+        """
+        # Every fetch in flight needs its own pooled connection
+        kwargs['pool_size'] = max(kwargs.get('pool_size', 0), concurrency)
+        super().__init__(*args, **kwargs)
+        self.concurrency = max(1, concurrency)
+        self.per_host_concurrency = max(1, per_host_concurrency or self.concurrency)
+
+    def crawl_company_website(self, domain: str,
+                              on_page: Optional[Callable[[CrawledPage], None]] = None,
+                              stop_condition: Optional[ContactPageStopCondition] = None,
+                              deadline: Optional[Deadline] = None) -> List[str]:
+        """
+        Crawl a company website using the asyncio engine.
+
+        Args:
+            domain: Company domain (e.g., 'example.com')
+            on_page: Optional callback receiving each parsed page as it is visited
+            stop_condition: Optional condition that ends the crawl early
+            deadline: Optional time budget for the whole crawl
+
+        Returns:
+            List of URLs found on the website
+        """
+        return asyncio.run(self.crawl_company_website_async(domain, on_page, stop_condition, deadline))
+
+    async def crawl_company_website_async(self, domain: str,
+                                          on_page: Optional[Callable[[CrawledPage], None]] = None,
+                                          stop_condition: Optional[ContactPageStopCondition] = None,
+                                          deadline: Optional[Deadline] = None) -> List[str]:
+        """
+        Crawl a company website with concurrent fetches.
+
+        Pages are fetched through a sliding window of `concurrency` requests
+        and processed in scheduling order, so a BFS crawl discovers the same
+        URLs as the synchronous crawler. Once the deadline expires no new
+        fetches start, and the pages fetched so far are returned.
+
+        Args:
+            domain: Company domain (e.g., 'example.com')
+            on_page: Optional callback receiving each parsed page as it is visited
+            stop_condition: Optional condition that ends the crawl early
+            deadline: Optional time budget for the whole crawl
+
+        Returns:
+            List of URLs found on the website
+        """
+        # Fresh state for this job
+        state = self._start_job(deadline)
+
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=self.concurrency)
+
+        # Per-host concurrency caps; semaphores belong to this crawl's event loop
+        semaphores: Dict[str, asyncio.Semaphore] = {}
+        fetch = partial(self._fetch_page_async, executor=executor, semaphores=semaphores, job=state)
+
+        try:
+            requested = domain
+            # Job state is per thread, so the checkpoint is loaded on the loop's thread
+            checkpoint = self._resume_job(requested)
+            if checkpoint and checkpoint.complete:
+                print(f"[CRAWL] Resuming {requested}: crawl already finished with {len(checkpoint.urls)} pages")
+                return checkpoint.urls
+
+            if checkpoint:
+                domain, cached_origin = checkpoint.start_url, False
+            else:
+                domain, cached_origin = await loop.run_in_executor(
+                    executor, self._in_job, state, self._start_url, domain
+                )
+            if domain is None:
+                print(f"[CRAWL] No origin answered for {requested}")
+                return []
+
+            print(f"[CRAWL] Starting async crawl for {domain} ({self.concurrency} concurrent fetches)")
+
+            # Check robots.txt first
+            allowed = await loop.run_in_executor(
+                executor, self._in_job, state, self._check_robots_txt, domain
+            )
+            if not allowed:
+                self.logger.warning(f"Robots.txt disallows crawling for {domain}")
+                print(f"[CRAWL] Robots.txt blocks crawling for {domain}")
+                return []
+
+            if stop_condition:
+                stop_condition.reset()
+
+            seeds = []
+            if self.use_sitemaps and not checkpoint:
+                seeds = await loop.run_in_executor(
+                    executor, self._in_job, state, self._discover_sitemap_urls, domain
+                )
+
+            if self.crawl_strategy == 'best_first':
+                final_urls = await self._crawl_best_first_async(domain, on_page, stop_condition, fetch,
+                                                                seeds, checkpoint)
+            else:
+                final_urls = await self._crawl_breadth_first_async(domain, on_page, stop_condition, fetch,
+                                                                   seeds, checkpoint)
+
+            if cached_origin and not self.crawled_urls and not self.crawl_interrupted:
+                self._forget_origin(requested)
+            if not self.crawl_interrupted:
+                self._finish_checkpoint(domain, final_urls)
+
+            self.logger.info(f"Async crawl completed for {domain}: {len(final_urls)} pages")
+            print(f"[CRAWL] Completed for {domain}: {len(final_urls)} pages, {len(self.failed_urls)} failed")
+            return final_urls
+
+        except Exception as e:
+            self.logger.error(f"Error in async crawl for {domain}: {str(e)}")
+            print(f"[CRAWL] Error crawling {domain}: {str(e)}")
+            return []
+
+        finally:
+            executor.shutdown(wait=False)
+
+    async def _crawl_breadth_first_async(self, domain: str, on_page: Optional[Callable[[CrawledPage], None]],
+                                         stop_condition: Optional[ContactPageStopCondition],
+                                         fetch: Callable[[str], Awaitable[Optional[ParsedDocument]]],
+                                         seeds: List[str] = (),
+                                         resume: Optional[CrawlCheckpoint] = None) -> List[str]:
+        """
+        Crawl level by level; returns every discovered URL up to max_pages.
+
+        Sitemap seeds are crawled at depth 1, ahead of the homepage links.
+        A resumed crawl continues with the shallowest saved level.
+        """
+        start_depth, urls_to_crawl, next_level, discovered_urls = self._breadth_first_start(domain, seeds, resume)
+
+        for depth in range(start_depth, self.max_depth + 1):
+            if not urls_to_crawl or len(discovered_urls) >= self.max_pages:
+                break
+
+            print(f"[CRAWL] Depth {depth}: Processing {len(urls_to_crawl)} URLs")
+            current_batch = [url for url in urls_to_crawl if url not in self.visited_urls]
+            urls_to_crawl = next_level if depth < self.max_depth else []
+            next_level = []
+
+            # Links of duplicate pages wait until the rest of the level is done
+            deferred_links = []
+
+            in_flight = deque()
+            next_index = 0
+            exhausted = False
+
+            try:
+                while in_flight or not exhausted:
+                    # Top up the window while there is room for more pages
+                    while not exhausted and len(in_flight) < self.concurrency:
+                        if (len(discovered_urls) >= self.max_pages or next_index >= len(current_batch)
+                                or self._out_of_time()):
+                            exhausted = True
+                            break
+                        url = current_batch[next_index]
+                        next_index += 1
+                        task = asyncio.ensure_future(fetch(url))
+                        in_flight.append((url, task))
+
+                    if not in_flight:
+                        break
+
+                    if self._checkpoint_due():
+                        # Fetches in flight are not done yet and stay pending
+                        pending = [(entry[0], depth) for entry in in_flight]
+                        pending += [(u, depth) for u in current_batch[next_index:]]
+                        pending += [(u, depth + 1) for u in urls_to_crawl]
+                        self._save_checkpoint(domain, pending, discovered_urls)
+
+                    # Process results in order to keep discovery deterministic
+                    url, task = in_flight.popleft()
+                    content = await task
+                    if not content:
+                        self.failed_urls.add(url)
+                        continue
+
+                    self.visited_urls.add(url)
+                    self.crawled_urls.add(url)
+
+                    page = self._parse_page(url, content, domain)
+                    if on_page:
+                        on_page(page)
+                    filtered_links = self._filter_and_prioritize_links(page.links, domain)
+
+                    if page.duplicate_of:
+                        deferred_links.extend(filtered_links)
+                    else:
+                        self._discover_links(filtered_links, discovered_urls, urls_to_crawl, depth)
+
+                    print(f"[CRAWL] Processed {url}: found {len(filtered_links)} new links")
+
+                    # Early stop returns only pages already fetched
+                    if stop_condition and self._should_stop(page, stop_condition):
+                        return self._prioritize_urls(list(self.crawled_urls), domain)
+            finally:
+                self._cancel_in_flight(in_flight)
+
+            self._discover_links(deferred_links, discovered_urls, urls_to_crawl, depth)
+
+            if self.crawl_interrupted:
+                # Unfetched URLs are left to the next run
+                pending = [(u, depth) for u in current_batch[next_index:]] + [(u, depth + 1) for u in urls_to_crawl]
+                self._save_checkpoint(domain, pending, discovered_urls)
+                return self._prioritize_urls(list(self.crawled_urls), domain)
+
+        return self._prioritize_urls(list(discovered_urls), domain)
+
+    async def _crawl_best_first_async(self, domain: str, on_page: Optional[Callable[[CrawledPage], None]],
+                                      stop_condition: Optional[ContactPageStopCondition],
+                                      fetch: Callable[[str], Awaitable[Optional[ParsedDocument]]],
+                                      seeds: List[str] = (),
+                                      resume: Optional[CrawlCheckpoint] = None) -> List[str]:
+        """
+        Crawl the most relevant known pages first, `concurrency` at a time.
+
+        Follows the same depth, seeding and resume rules as WebCrawler._crawl_best_first.
+
+        Returns:
+            Fetched URLs in priority order
+        """
+        frontier = self._best_first_frontier(domain, seeds, resume)
+        in_flight = deque()
+
+        try:
+            while True:
+                # Top up the window with the best URLs known so far
+                while (frontier and len(in_flight) < self.concurrency
+                       and len(self.crawled_urls) + len(in_flight) < self.max_pages
+                       and not self._out_of_time()):
+                    url, depth = frontier.pop()
+                    task = asyncio.ensure_future(fetch(url))
+                    in_flight.append((url, depth, task))
+
+                if not in_flight:
+                    break
+
+                if self._checkpoint_due():
+                    pending = [(entry[0], entry[1]) for entry in in_flight] + frontier.pending()
+                    self._save_checkpoint(domain, pending, frontier.seen)
+
+                url, depth, task = in_flight.popleft()
+                content = await task
+                if not content:
+                    self.failed_urls.add(url)
+                    continue
+
+                self.visited_urls.add(url)
+                self.crawled_urls.add(url)
+
+                page = self._parse_page(url, content, domain)
+                if on_page:
+                    on_page(page)
+
+                new_links = 0
+                if depth <= self.max_depth:
+                    new_links = self._queue_links(frontier, page, domain, depth + 1)
+
+                print(f"[CRAWL] Processed {url} (depth {depth}): queued {new_links} new links")
+
+                if stop_condition and self._should_stop(page, stop_condition):
+                    break
+        finally:
+            self._cancel_in_flight(in_flight)
+
+        if self.crawl_interrupted:
+            self._save_checkpoint(domain, frontier.pending(), frontier.seen)
+        return self._prioritize_urls(list(self.crawled_urls), domain)
+
+    @staticmethod
+    def _cancel_in_flight(in_flight: deque):
+        """Cancel fetches that are no longer needed."""
+        for entry in in_flight:
+            entry[-1].cancel()
+
+    async def _fetch_page_async(self, url: str, executor: ThreadPoolExecutor,
+                                semaphores: Dict[str, asyncio.Semaphore],
+                                job: CrawlState) -> Optional[ParsedDocument]:
+        """
+        Fetch a page in the executor once the host's rate limiter allows it.
+
+        Args:
+            url: URL to fetch
+            executor: The crawl's thread pool for blocking downloads
+            semaphores: The crawl's per-host concurrency caps
+            job: The crawl's state, for the download's counters
+        """
+        host = urlparse(url).netloc
+        semaphore = semaphores.get(host)
+        if semaphore is None:
+            semaphore = semaphores[host] = asyncio.Semaphore(self.per_host_concurrency)
+
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            try:
+                attempt = 0
+                while True:
+                    self._check_circuit(url)
+                    await self.rate_limiter.acquire_async(url, job.rate_stats)
+                    try:
+                        download = await loop.run_in_executor(
+                            executor, self._in_job, job, self._download_page, url, None, self._request_timeout()
+                        )
+                        break
+                    except requests.RequestException as e:
+                        wait = self._retry_delay(url, e, attempt)
+                        if wait is None:
+                            raise
+                        await asyncio.sleep(wait)
+                        attempt += 1
+
+                self.circuit_breaker.record_success(url)
+                if download is None:
+                    return None
+                return self._parse_body(*download)
+            except CircuitOpenError as e:
+                self.logger.debug(str(e))
+                return None
+            except requests.RequestException as e:
+                self.logger.warning(f"Failed to fetch {url}: {str(e)}")
+                return None
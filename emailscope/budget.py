@@ -0,0 +1,80 @@
+"""
+Time budget module for EmailScope.
+Deadlines shared by the crawl, extraction and verification stages of a job.
+"""
+
+import time
+from typing import Optional
+
+# Shortest timeout handed to a blocking call (0 is rejected by requests)
+MIN_TIMEOUT = 0.01
+
+class Deadline:
+    """
+    Point in time by which a job has to be done.
+
+    Stages check expired() between units of work and cap blocking calls with
+    timeout(), so they return partial results on time instead of overrunning.
+    A deadline without a budget never expires.
+    """
+
+    def __init__(self, seconds: Optional[float] = None):
+        """
+        Initialize the deadline.
+
+        Args:
+            seconds: Budget from now, or None for no limit
+        """
+        self.started_at = time.monotonic()
+        self.expires_at = None if seconds is None else self.started_at + max(0.0, seconds)
+
+    @property
+    def limited(self) -> bool:
+        """True if the deadline can expire."""
+        return self.expires_at is not None
+
+    def remaining(self) -> float:
+        """Return the seconds left (infinite without a budget)."""
+        if self.expires_at is None:
+            return float('inf')
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def elapsed(self) -> float:
+        """Return the seconds since the deadline was created."""
+        return time.monotonic() - self.started_at
+
+    def expired(self) -> bool:
+        """Check whether the budget is used up."""
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def timeout(self, default: Optional[float] = None) -> Optional[float]:
+        """
+        Cap a blocking call's timeout to the time left.
+
+        Args:
+            default: The call's usual timeout (None for no timeout)
+
+        Returns:
+            The smaller of default and the time left (at least MIN_TIMEOUT),
+            or None if neither bounds the call
+        """
+        if self.expires_at is None:
+            return default
+        remaining = self.remaining()
+        if default is not None:
+            remaining = min(default, remaining)
+        return max(MIN_TIMEOUT, remaining)
+
+    def share(self, fraction: float) -> 'Deadline':
+        """
+        Carve a stage budget out of the time left.
+
+        Args:
+            fraction: Share of the remaining time the stage may use (0-1)
+
+        Returns:
+            A deadline expiring no later than this one
+        """
+        if self.expires_at is None:
+            return Deadline()
+        return Deadline(self.remaining() * min(1.0, max(0.0, fraction)))
@@ -0,0 +1,137 @@
+"""
+Bulk validation module for EmailScope.
+Normalizes and format-checks large lists of addresses (e.g. CSV imports to
+re-verify) chunk by chunk.
+"""
+
+import re
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+
+from .extractor import normalize_email
+from .verifier import EmailVerifier
+
+# Same language as EmailVerifier.email_pattern, written without nested
+# ambiguous repeats, so re matches it without backtracking over the input
+_ALNUM = r'[a-zA-Z0-9]'
+_FORMAT_PATTERN = re.compile(
+    rf'{_ALNUM}+(?:[._+-]+{_ALNUM}+)*@{_ALNUM}+(?:[.-]+{_ALNUM}+)*\.[a-zA-Z]{{2,}}'
+)
+
+DEFAULT_CHUNK_SIZE = 50000
+
+class BulkValidation:
+    """Results for a list of addresses, in input order."""
+
+    __slots__ = ('emails', 'valid', 'reasons')
+
+    def __init__(self, emails: List[str], valid: List[bool], reasons: List[str]):
+        """
+        Initialize a result.
+
+        Args:
+            emails: Normalized addresses ('' for empty or non-string input)
+            valid: Validity mask, True where the format is valid
+            reasons: Format check result for each address ('Valid format' or why not)
+        """
+        self.emails = emails
+        self.valid = valid
+        self.reasons = reasons
+
+    def __len__(self) -> int:
+        return len(self.emails)
+
+    def valid_emails(self) -> List[str]:
+        """Return the normalized addresses that passed."""
+        return [email for email, ok in zip(self.emails, self.valid) if ok]
+
+    def extend(self, other: 'BulkValidation'):
+        """Append another chunk's results."""
+        self.emails.extend(other.emails)
+        self.valid.extend(other.valid)
+        self.reasons.extend(other.reasons)
+
+class BulkValidator:
+    """
+    Normalize and format-check addresses in bulk.
+
+    Gives the same addresses, validity and reasons as normalizing each
+    address and calling EmailVerifier._validate_email_format on it, at a
+    fraction of the cost: normalization skips its substitutions for
+    addresses without whitespace, one precompiled pattern plus a few string
+    checks accept typical valid addresses, and only the rest go through the
+    step-by-step check, which also names the reason. Input is consumed
+    chunk by chunk, so a generator over a CSV file is never held in memory
+    whole.
+
+    The pattern always runs on re, whatever the verifier's engine: it
+    cannot backtrack, and on short strings RE2's per-call overhead costs
+    more than the match.
+    """
+
+    def __init__(self, verifier: Optional[EmailVerifier] = None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the validator.
+
+        Args:
+            verifier: Verifier whose format check names rejection reasons
+                (a DNS-free one by default; no lookups are made)
+            chunk_size: Addresses processed per chunk
+        """
+        self.verifier = verifier or EmailVerifier(mock_dns=True)
+        self.chunk_size = chunk_size
+
+    def validate(self, addresses: Iterable) -> BulkValidation:
+        """
+        Normalize and check every address.
+
+        Args:
+            addresses: Iterable of addresses, e.g. a list or a CSV column
+
+        Returns:
+            Results for all addresses, in input order
+        """
+        result = BulkValidation([], [], [])
+        for chunk in self.iter_chunks(addresses):
+            result.extend(chunk)
+        return result
+
+    def iter_chunks(self, addresses: Iterable) -> Iterator[BulkValidation]:
+        """
+        Normalize and check addresses one chunk at a time.
+
+        Args:
+            addresses: Iterable of addresses; read chunk_size at a time
+
+        Yields:
+            Results for each chunk, in input order
+        """
+        iterator = iter(addresses)
+        while True:
+            chunk = list(islice(iterator, self.chunk_size))
+            if not chunk:
+                return
+            yield self.validate_chunk(chunk)
+
+    def validate_chunk(self, addresses: List) -> BulkValidation:
+        """
+        Normalize and check one chunk of addresses.
+
+        Args:
+            addresses: Addresses; anything that is not a string is invalid
+
+        Returns:
+            Results for the chunk, in input order
+        """
+        emails = [normalize_email(address) if isinstance(address, str) else '' for address in addresses]
+
+        # Accepted here only if every check would pass: the pattern, no '..',
+        # a local part of at most 64 and an address of at most 254 characters
+        # (so the domain is at most 253)
+        valid = [match is not None and len(email) <= 254 and '..' not in email and email.find('@', 0, 65) >= 0
+                 for email, match in zip(emails, map(_FORMAT_PATTERN.fullmatch, emails))]
+        reasons = ['Valid format'] * len(emails)
+        for index, ok in enumerate(valid):
+            if not ok:
+                valid[index], reasons[index] = self.verifier._validate_email_format(emails[index])
+        return BulkValidation(emails, valid, reasons)
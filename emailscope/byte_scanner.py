@@ -0,0 +1,182 @@
+"""
+Byte-level page scanning module for EmailScope.
+Pulls visible text, mailto hrefs and Cloudflare-protected addresses out of a
+raw response body with compiled byte patterns, without building a document
+tree.
+"""
+
+import html
+import re
+from typing import List, Optional, Tuple
+
+from .charset import CharsetDecoder, ascii_compatible, declared_encoding
+
+# Markup that get_text() and text_content() leave out: script and style
+# elements with their content, comments, and tags. A tag has to start with
+# a letter, '/', '!' or '?' (so 'a < b' stays text) and cannot contain
+# another '<', which keeps every match attempt short.
+_INVISIBLE_PATTERN = (r'<script\b[^>]*>.*?</script\s*>|<style\b[^>]*>.*?</style\s*>'
+                      r'|<!--.*?-->|<[A-Za-z/!?][^<>]*>')
+_INVISIBLE_BYTES = re.compile(_INVISIBLE_PATTERN.encode('ascii'), re.I | re.S)
+_INVISIBLE_TEXT = re.compile(_INVISIBLE_PATTERN, re.I | re.S)
+
+_MAILTO_PATTERN = r'''href\s*=\s*(?:"\s*(mailto:[^"]*)"|'\s*(mailto:[^']*)'|(mailto:[^\s>]*))'''
+_MAILTO_BYTES = re.compile(_MAILTO_PATTERN.encode('ascii'), re.I)
+_MAILTO_TEXT = re.compile(_MAILTO_PATTERN, re.I)
+
+# Cloudflare email obfuscation: <span data-cfemail="HEX"> replaces an
+# address in the text, /cdn-cgi/l/email-protection#HEX replaces a mailto href
+_CFEMAIL_PATTERN = r'data-cfemail\s*=\s*["\']?([0-9a-fA-F]+)|/cdn-cgi/l/email-protection#([0-9a-fA-F]+)'
+_CFEMAIL_BYTES = re.compile(_CFEMAIL_PATTERN.encode('ascii'), re.I)
+_CFEMAIL_TEXT = re.compile(_CFEMAIL_PATTERN, re.I)
+
+def decode_cfemail(encoded: str) -> Optional[str]:
+    """
+    Decode a Cloudflare-protected address.
+
+    The first byte is an XOR key for the UTF-8 bytes that follow.
+
+    Args:
+        encoded: Hex string from data-cfemail or an email-protection link
+
+    Returns:
+        Decoded address, or None if the string is malformed
+    """
+    if len(encoded) < 4 or len(encoded) % 2:
+        return None
+    try:
+        data = bytes.fromhex(encoded)
+    except ValueError:
+        return None
+    key = data[0]
+    return bytes(byte ^ key for byte in data[1:]).decode('utf-8', 'replace')
+
+class ScannedBody:
+    """What a body holds for email extraction: visible text and address markup."""
+
+    __slots__ = ('text', 'mailto_links', 'protected_text', 'protected_links')
+
+    def __init__(self, text: str, mailto_links: List[str], protected_text: List[str], protected_links: List[str]):
+        """
+        Initialize a scanned body.
+
+        Args:
+            text: Visible text with entities decoded
+            mailto_links: Raw mailto href values, entities decoded
+            protected_text: Addresses decoded from data-cfemail attributes
+            protected_links: Addresses decoded from email-protection links
+        """
+        self.text = text
+        self.mailto_links = mailto_links
+        self.protected_text = protected_text
+        self.protected_links = protected_links
+
+class ByteScanner:
+    """
+    Extract email-bearing content from raw page bytes.
+
+    Parser backends build a tree (or at least a full token stream) and
+    join its text nodes into a new string, although extraction only needs
+    the visible text and a few attributes. Here compiled byte patterns run
+    over the response body as downloaded: one substitution drops scripts,
+    styles, comments and tags, and two searches collect mailto hrefs and
+    Cloudflare data-cfemail / email-protection values. Only the visible
+    text is decoded, and entities are unescaped only when present.
+
+    Bodies in encodings where markup bytes can occur inside characters
+    (UTF-16, UTF-32, UTF-7, ISO-2022) are decoded first and matched as
+    text instead.
+    """
+
+    def __init__(self, decoder: Optional[CharsetDecoder] = None):
+        """
+        Initialize the scanner.
+
+        Args:
+            decoder: Charset decoder (one with its own counters by default)
+        """
+        self.decoder = decoder or CharsetDecoder()
+
+    def scan(self, body: bytes, content_type: Optional[str] = None) -> ScannedBody:
+        """
+        Scan a raw page body.
+
+        Args:
+            body: Raw response body
+            content_type: Content-Type response header
+
+        Returns:
+            Visible text, mailto hrefs and Cloudflare-protected addresses
+        """
+        if not body:
+            return ScannedBody('', [], [], [])
+
+        declared = declared_encoding(body, content_type)
+        encoding = declared[0]
+        if not ascii_compatible(encoding):
+            return self.scan_markup(self.decoder.decode(body, content_type, declared))
+
+        # Case-insensitive patterns cannot skip ahead to a literal, so they
+        # only run on pages that contain one (checked with a lowercased copy,
+        # which is several times faster than one case-insensitive search)
+        lowered = body.lower()
+        mailto_links, protected_text, protected_links = [], [], []
+        if b'mailto:' in lowered:
+            # Attribute values are ASCII in practice; anything else is replaced
+            attribute_encoding = encoding or 'utf-8'
+            mailto_links = [html.unescape(self._group(match).decode(attribute_encoding, 'replace'))
+                            for match in _MAILTO_BYTES.finditer(body)]
+        if b'cfemail' in lowered or b'email-protection' in lowered:
+            protected_text, protected_links = self._protected(
+                (match.group(1), match.group(2)) for match in _CFEMAIL_BYTES.finditer(body)
+            )
+        del lowered
+
+        text = self.decoder.decode(_INVISIBLE_BYTES.sub(b'', body), content_type, declared)
+        return ScannedBody(self._unescape(text), mailto_links, protected_text, protected_links)
+
+    def scan_markup(self, markup: str) -> ScannedBody:
+        """
+        Scan markup that is already decoded.
+
+        Args:
+            markup: HTML text (a whole page, or a part of one that does not
+                split a tag, comment, script or style element)
+
+        Returns:
+            Visible text, mailto hrefs and Cloudflare-protected addresses
+        """
+        lowered = markup.lower()
+        mailto_links, protected_text, protected_links = [], [], []
+        if 'mailto:' in lowered:
+            mailto_links = [html.unescape(self._group(match)) for match in _MAILTO_TEXT.finditer(markup)]
+        if 'cfemail' in lowered or 'email-protection' in lowered:
+            protected_text, protected_links = self._protected(
+                (match.group(1), match.group(2)) for match in _CFEMAIL_TEXT.finditer(markup)
+            )
+        del lowered
+
+        text = self._unescape(_INVISIBLE_TEXT.sub('', markup))
+        return ScannedBody(text, mailto_links, protected_text, protected_links)
+
+    @staticmethod
+    def _group(match):
+        """Return whichever quoting alternative of the mailto pattern matched."""
+        return match.group(1) or match.group(2) or match.group(3)
+
+    @staticmethod
+    def _protected(matches) -> Tuple[List[str], List[str]]:
+        """Decode (data-cfemail, email-protection) value pairs."""
+        protected_text, protected_links = [], []
+        for attribute, link in matches:
+            encoded = attribute or link
+            if isinstance(encoded, bytes):
+                encoded = encoded.decode('ascii')
+            email = decode_cfemail(encoded)
+            if email:
+                (protected_text if attribute else protected_links).append(email)
+        return protected_text, protected_links
+
+    @staticmethod
+    def _unescape(text: str) -> str:
+        return html.unescape(text) if '&' in text else text
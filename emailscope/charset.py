@@ -0,0 +1,173 @@
+"""
+Charset decoding module for EmailScope.
+Decodes page bodies using the declared encoding and only falls back to
+statistical detection when nothing usable was declared.
+"""
+
+import codecs
+import re
+import threading
+from typing import Dict, Optional, Tuple
+
+# Optional statistical detector (installed with requests)
+try:
+    from charset_normalizer import from_bytes as detect_charset
+except ImportError:
+    detect_charset = None
+
+# Browsers only look at the first 1024 bytes for a <meta> charset
+META_PRESCAN_BYTES = 1024
+
+HEADER_CHARSET_PATTERN = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.I)
+META_CHARSET_PATTERN = re.compile(
+    rb'<meta[^>]+?charset\s*=\s*["\']?\s*([\w.:-]+)',
+    re.I
+)
+
+BOMS = (
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+)
+
+# Encodings in which markup bytes ('<', '>', quotes, '=') can occur inside
+# other characters, so HTML cannot be tokenized before decoding
+ASCII_INCOMPATIBLE = frozenset(['utf-16', 'utf-16-le', 'utf-16-be', 'utf-32', 'utf-32-le', 'utf-32-be',
+                                'utf-7', 'iso2022_jp', 'iso2022_jp_1', 'iso2022_jp_2', 'iso2022_jp_2004',
+                                'iso2022_jp_3', 'iso2022_jp_ext', 'iso2022_kr'])
+
+# Labels that browsers decode as windows-1252 (a superset of both)
+WINDOWS_1252_ALIASES = frozenset(['iso-8859-1', 'iso8859-1', 'latin-1', 'latin1', 'us-ascii', 'ascii'])
+
+def _normalize_encoding(label: Optional[str]) -> Optional[str]:
+    """Return the Python codec name for a charset label, or None if unknown."""
+    if not label:
+        return None
+    label = label.strip().lower()
+    if label in WINDOWS_1252_ALIASES:
+        label = 'cp1252'
+    try:
+        return codecs.lookup(label).name
+    except LookupError:
+        return None
+
+def header_charset(content_type: Optional[str]) -> Optional[str]:
+    """Return the codec named by a Content-Type header, if any."""
+    if not content_type:
+        return None
+    match = HEADER_CHARSET_PATTERN.search(content_type)
+    return _normalize_encoding(match.group(1)) if match else None
+
+def meta_charset(body: bytes) -> Optional[str]:
+    """Return the codec named by a <meta> tag near the start of the body, if any."""
+    match = META_CHARSET_PATTERN.search(body, 0, META_PRESCAN_BYTES)
+    if not match:
+        return None
+    return _normalize_encoding(match.group(1).decode('ascii', 'ignore'))
+
+def declared_encoding(body: bytes, content_type: Optional[str] = None) -> Tuple[Optional[str], str]:
+    """
+    Find the encoding a body declares: byte order mark, Content-Type
+    charset, then <meta> charset.
+
+    Args:
+        body: Raw response body
+        content_type: Content-Type response header
+
+    Returns:
+        Tuple of (codec name or None, 'bom', 'header', 'meta' or 'undeclared')
+    """
+    for bom, encoding in BOMS:
+        if body.startswith(bom):
+            return encoding, 'bom'
+
+    encoding = header_charset(content_type)
+    if encoding:
+        return encoding, 'header'
+
+    encoding = meta_charset(body)
+    if encoding:
+        return encoding, 'meta'
+
+    return None, 'undeclared'
+
+def ascii_compatible(encoding: Optional[str]) -> bool:
+    """Check whether markup can be matched as ASCII bytes before decoding (None: undeclared)."""
+    return encoding is None or encoding not in ASCII_INCOMPATIBLE
+
+def _strip_bom(body: bytes) -> bytes:
+    for bom, _ in BOMS:
+        if body.startswith(bom):
+            return body[len(bom):]
+    return body
+
+class CharsetDecoder:
+    """
+    Decode page bodies with a cheap-first encoding strategy.
+
+    The order is: byte order mark, Content-Type charset, <meta> charset,
+    strict UTF-8, and only then statistical detection. Counters record which
+    step decoded each page, so the detection rate can be monitored.
+    """
+
+    def __init__(self):
+        """Initialize the decoder."""
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {}
+        self.reset_stats()
+
+    def decode(self, body: bytes, content_type: Optional[str] = None,
+               declared: Optional[Tuple[Optional[str], str]] = None) -> str:
+        """
+        Decode a page body to text.
+
+        Args:
+            body: Raw response body
+            content_type: Content-Type response header
+            declared: declared_encoding() result, if already looked up (e.g.
+                on the full body before decoding only part of it)
+
+        Returns:
+            Decoded text (undecodable bytes are replaced)
+        """
+        text, source = self._decode(body, content_type, declared)
+        with self._lock:
+            self._stats[source] += 1
+        return text
+
+    def _decode(self, body: bytes, content_type: Optional[str],
+                declared: Optional[Tuple[Optional[str], str]] = None) -> Tuple[str, str]:
+        """Decode a body and report which step chose the encoding."""
+        encoding, source = declared or declared_encoding(body, content_type)
+        if encoding:
+            if source == 'bom':
+                body = _strip_bom(body)
+            return body.decode(encoding, 'replace'), source
+
+        # Most undeclared pages are UTF-8, and a strict decode is cheap
+        try:
+            return body.decode('utf-8'), 'utf8'
+        except UnicodeDecodeError:
+            pass
+
+        if detect_charset is not None:
+            best = detect_charset(body).best()
+            if best is not None:
+                return str(best), 'detected'
+
+        return body.decode('cp1252', 'replace'), 'detected'
+
+    def reset_stats(self):
+        """Reset decoding counters."""
+        with self._lock:
+            self._stats = {'bom': 0, 'header': 0, 'meta': 0, 'utf8': 0, 'detected': 0}
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get decoding statistics.
+
+        Returns:
+            Pages decoded by each step; 'detected' counts detector runs
+        """
+        with self._lock:
+            return dict(self._stats)
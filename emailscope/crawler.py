@@ -4,18 +4,130 @@ Handles respectful web scraping of company websites.
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from urllib.parse import urljoin, urlparse
+import heapq
+import random
 import time
 import logging
-from typing import List, Set, Optional
+import threading
+from contextlib import contextmanager
+from functools import partial
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Optional, Tuple
 import re
 
+from .budget import Deadline
+from .charset import CharsetDecoder
+from .fingerprint import ContentDeduplicator
+from .frontier import ContactPageStopCondition, CrawlCheckpoint, CrawlFrontier
+from .http_cache import HTTPCache
+from .keywords import KeywordMatcher
+from .origin import OriginResolver
+from .page_cache import CrawledPage, PageCache
+from .parsers import ParsedDocument, get_parser
+from .rate_limiter import HostRateLimiter, WaitStats
+from .retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+from .robots import RobotsCache
+from .sitemap import SitemapDiscovery
+from .url_filter import URLClassifier, canonicalize_url, site_host
+
+# Content types worth parsing for links and emails
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+# Size of the chunks read from a streamed response body
+FETCH_CHUNK_SIZE = 64 * 1024
+
+# Hosts whose connection pools are kept alive at once
+POOL_HOSTS = 32
+
+# Priority taken off links found on duplicate pages (one keyword's worth)
+DUPLICATE_LINK_PENALTY = 10
+
+class CrawlState:
+    """
+    Everything that belongs to a single crawl job.
+    
+    Each job gets its own URL sets, page cache, fingerprints and counters,
+    so jobs running at the same time on one crawler never clear or count
+    into each other's. The session, rate limiter buckets, circuit breaker
+    and the robots, origin and HTTP caches stay shared by the crawler.
+    """
+    
+    def __init__(self, page_cache: Optional[PageCache] = None,
+                 deduplicator: Optional[ContentDeduplicator] = None,
+                 sitemap_discovery: Optional[SitemapDiscovery] = None):
+        """
+        Initialize a job.
+        
+        Args:
+            page_cache: Cache for the job's parsed pages
+            deduplicator: Fingerprints of the job's pages (None disables
+                duplicate detection)
+            sitemap_discovery: Sitemap reader, whose counters also cap the
+                sitemaps read by the job
+        """
+        self.visited_urls: Set[str] = set()
+        self.crawled_urls: Set[str] = set()
+        self.failed_urls: Set[str] = set()
+        
+        # Store key and last save time when the job is checkpointed
+        self.checkpoint_key: Optional[str] = None
+        self.checkpoint_saved_at = 0.0
+        # Whether the job continues (or returns) a saved checkpoint
+        self.resumed = False
+        
+        # Time budget, and whether the job stopped because it ran out
+        self.deadline = Deadline()
+        self.interrupted = False
+        
+        # Parsed pages, so extraction reuses the body fetched while crawling
+        self.page_cache = page_cache if page_cache is not None else PageCache()
+        self.deduplicator = deduplicator
+        self.sitemap_discovery = sitemap_discovery
+        
+        # Decoding, politeness and download counters of this job's fetches
+        self.charset_decoder = CharsetDecoder()
+        self.rate_stats = WaitStats()
+        self._fetch_stats_lock = threading.Lock()
+        self.reset_fetch_stats()
+    
+    def reset_fetch_stats(self):
+        """Reset download counters."""
+        with self._fetch_stats_lock:
+            self._fetch_stats = {
+                'pages': 0,
+                'bytes_read': 0,
+                'rejected_content_type': 0,
+                'rejected_too_large': 0,
+                'truncated': 0,
+                'bytes_saved': 0,
+                'retries': 0,
+            }
+    
+    def count_fetch(self, key: str, amount: int = 1):
+        """Increment a download counter (called from fetch threads)."""
+        with self._fetch_stats_lock:
+            self._fetch_stats[key] += amount
+    
+    def get_fetch_stats(self) -> Dict[str, int]:
+        """Get a copy of the download counters."""
+        with self._fetch_stats_lock:
+            return dict(self._fetch_stats)
+
 class WebCrawler:
     """Advanced web crawler with intelligent page discovery and rate limiting."""
     
     def __init__(self, delay: float = 0.5, timeout: int = 10, bypass_robots: bool = True, 
-                 max_depth: int = 2, max_pages: int = 50, rate_limit: float = 1.0):
+                 max_depth: int = 2, max_pages: int = 50, rate_limit: float = 1.0,
+                 page_cache_size: int = 256, rate_burst: int = 1, crawl_strategy: str = 'bfs',
+                 parser: str = 'html.parser', max_page_bytes: int = 2 * 1024 * 1024,
+                 http_cache: Optional[HTTPCache] = None, use_sitemaps: bool = False,
+                 max_sitemaps: int = 10, robots_cache: Optional[RobotsCache] = None,
+                 robots_user_agent: str = 'EmailScope', pool_size: int = 10,
+                 retries: int = 2, retry_backoff: float = 0.5, breaker_threshold: int = 3,
+                 breaker_reset: float = 60.0, resolve_origin: bool = True, origin_store=None,
+                 checkpoint_store=None, checkpoint_interval: float = 2.0,
+                 checkpoint_max_age: float = 24 * 3600, detect_duplicates: bool = True):
         """
         Initialize the advanced crawler.
         
@@ -25,7 +137,33 @@ class WebCrawler:
             bypass_robots: Whether to bypass robots.txt restrictions
             max_depth: Maximum crawling depth
             max_pages: Maximum pages to crawl
-            rate_limit: Rate limiting factor (requests per second)
+            rate_limit: Minimum average seconds between requests to one host
+            page_cache_size: Maximum number of parsed pages kept in memory
+            rate_burst: Requests a host may receive back to back before rate_limit applies
+            crawl_strategy: 'bfs' (level by level) or 'best_first' (most relevant page first)
+            parser: HTML parser backend ('html.parser', 'lxml' or 'selectolax')
+            max_page_bytes: Maximum body size read per page (0 disables the cap)
+            http_cache: Persistent cache used to revalidate pages on re-crawls
+            use_sitemaps: Seed the crawl with the most relevant sitemap URLs
+            max_sitemaps: Maximum sitemap documents read per site
+            robots_cache: robots.txt cache to share with other crawlers
+            robots_user_agent: Product token matched against robots.txt groups
+            pool_size: Connections kept per host; size it to the number of
+                threads fetching through this crawler
+            retries: Retries for transient errors (429, 5xx, connection resets)
+            retry_backoff: Base backoff in seconds, doubled per retry with full jitter
+            breaker_threshold: Consecutive timeouts/connection failures that stop
+                requests to a host (0 disables the circuit breaker)
+            breaker_reset: Seconds before a tripped host gets a trial request
+            resolve_origin: Race https/http and apex/www variants of a bare domain
+            origin_store: Persistent origin cache with get_origin/set_origin
+                (e.g., EmailScopeDB)
+            checkpoint_store: Store with save/load/clear_crawl_checkpoint
+                (e.g., EmailScopeDB); crawls resume from their last checkpoint
+            checkpoint_interval: Minimum seconds between checkpoints of a crawl
+            checkpoint_max_age: Seconds after which a checkpoint is ignored
+            detect_duplicates: Fingerprint pages to flag duplicates and
+                near-duplicates, and crawl their links last
         """
         self.delay = delay
         self.timeout = timeout
@@ -33,8 +171,17 @@ class WebCrawler:
         self.max_depth = max_depth
         self.max_pages = max_pages
         self.rate_limit = rate_limit
+        self.crawl_strategy = crawl_strategy
+        self.max_page_bytes = max_page_bytes
+        self.pool_size = pool_size
         self.session = requests.Session()
         
+        # One pool shared by every thread using this crawler, big enough that
+        # concurrent fetches do not open and discard connections
+        self._adapter = HTTPAdapter(pool_connections=POOL_HOSTS, pool_maxsize=pool_size)
+        self.session.mount('http://', self._adapter)
+        self.session.mount('https://', self._adapter)
+        
         # Enhanced headers with rotation
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
@@ -54,32 +201,98 @@ class WebCrawler:
             'Pragma': 'no-cache'
         })
         
-        # Crawling state
-        self.visited_urls = set()
-        self.crawled_urls = set()
-        self.failed_urls = set()
-        self.rate_limiter = time.time()
+        # Keywords that make a link relevant for email discovery
+        self.priority_keywords = [
+            'contact', 'about', 'team', 'staff', 'people', 'leadership', 'management',
+            'support', 'help', 'info', 'news', 'press', 'media', 'company',
+            'services', 'products', 'solutions', 'careers', 'jobs', 'hiring'
+        ]
+        self.priority_matcher = KeywordMatcher(self.priority_keywords)
+        
+        # HTML parser backend shared by crawl and extraction
+        self.parser = get_parser(parser)
+        
+        # Link filter compiled once per crawler
+        self.url_classifier = URLClassifier()
+        
+        # Crawl state is per job and per thread, so concurrent crawls never
+        # share URL sets, cached pages or counters; extraction threads are
+        # handed the job they work for
+        self._job = threading.local()
+        self.page_cache_size = page_cache_size
+        self.detect_duplicates = detect_duplicates
+        self.max_sitemaps = max_sitemaps
+        self.rate_limiter = HostRateLimiter(
+            rate=1.0 / rate_limit if rate_limit > 0 else 0,
+            burst=rate_burst
+        )
+        
+        # Transient failures are retried; dead hosts are cut off
+        self.retry_policy = RetryPolicy(retries=retries, backoff=retry_backoff)
+        self.circuit_breaker = CircuitBreaker(failure_threshold=breaker_threshold, reset_timeout=breaker_reset)
+        
+        # Bodies from earlier crawls, revalidated with ETag/Last-Modified
+        self.http_cache = http_cache
+        
+        # robots.txt rules per origin, kept across crawls
+        self.robots_cache = robots_cache if robots_cache is not None else RobotsCache(
+            self._fetch_any_status, user_agent=robots_user_agent
+        )
+        
+        # Bare domains are resolved to the origin that actually answers
+        self.resolve_origin = resolve_origin
+        self.origin_resolver = OriginResolver(self._fetch_any_status, timeout=timeout, store=origin_store)
+        
+        # Interrupted crawls continue from their saved frontier
+        self.checkpoint_store = checkpoint_store
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoint_max_age = checkpoint_max_age
+        
+        # Sitemap discovery shares the crawler's rate limiter and session
+        self.use_sitemaps = use_sitemaps
         
         self.logger = logging.getLogger(__name__)
         
-    def crawl_company_website(self, domain: str) -> List[str]:
+    def crawl_company_website(self, domain: str,
+                              on_page: Optional[Callable[[CrawledPage], None]] = None,
+                              stop_condition: Optional[ContactPageStopCondition] = None,
+                              deadline: Optional[Deadline] = None) -> List[str]:
         """
         Advanced crawl a company website with intelligent page discovery.
         
+        With a deadline, request timeouts and retries are capped to the time
+        left and the crawl stops when it expires, returning the pages fetched
+        so far (see crawl_interrupted).
+        
+        With a checkpoint store, progress is saved while crawling and a crawl
+        of the same domain continues from the saved frontier (or returns the
+        saved result if it had finished) until clear_checkpoint() is called.
+        
         Args:
             domain: Company domain (e.g., 'example.com')
+            on_page: Optional callback receiving each parsed page as it is visited
+            stop_condition: Optional condition that ends the crawl early
+            deadline: Optional time budget for the whole crawl
             
         Returns:
             List of URLs found on the website
         """
-        # Reset crawling state
-        self.visited_urls.clear()
-        self.crawled_urls.clear()
-        self.failed_urls.clear()
+        # Fresh state for this job
+        self._start_job(deadline)
+        
+        requested = domain
+        checkpoint = self._resume_job(requested)
+        if checkpoint and checkpoint.complete:
+            print(f"[CRAWL] Resuming {requested}: crawl already finished with {len(checkpoint.urls)} pages")
+            return checkpoint.urls
         
-        # Ensure domain has protocol
-        if not domain.startswith(('http://', 'https://')):
-            domain = f"https://{domain}"
+        if checkpoint:
+            domain, cached_origin = checkpoint.start_url, False
+        else:
+            domain, cached_origin = self._start_url(domain)
+        if domain is None:
+            print(f"[CRAWL] No origin answered for {requested}")
+            return []
             
         try:
             print(f"[CRAWL] Starting advanced crawl for {domain}")
@@ -90,58 +303,22 @@ class WebCrawler:
                 print(f"[CRAWL] Robots.txt blocks crawling for {domain}")
                 return []
             
-            # Start with homepage
-            urls_to_crawl = [domain]
-            discovered_urls = set([domain])
+            if stop_condition:
+                stop_condition.reset()
             
-            # Intelligent crawling with depth control
-            for depth in range(self.max_depth + 1):
-                if not urls_to_crawl or len(discovered_urls) >= self.max_pages:
-                    break
-                    
-                print(f"[CRAWL] Depth {depth}: Processing {len(urls_to_crawl)} URLs")
-                current_batch = urls_to_crawl.copy()
-                urls_to_crawl.clear()
-                
-                for url in current_batch:
-                    if len(discovered_urls) >= self.max_pages:
-                        break
-                        
-                    if url in self.visited_urls:
-                        continue
-                        
-                    # Rate limiting
-                    self._apply_rate_limit()
-                    
-                    # Rotate user agent
-                    self._rotate_user_agent()
-                    
-                    # Fetch page content
-                    content = self._fetch_page(url)
-                    if not content:
-                        self.failed_urls.add(url)
-                        continue
-                        
-                    self.visited_urls.add(url)
-                    self.crawled_urls.add(url)
-                    
-                    # Extract links from current page
-                    page_links = self._extract_links(content, domain)
-                    
-                    # Filter and prioritize links
-                    filtered_links = self._filter_and_prioritize_links(page_links, domain)
-                    
-                    # Add new links for next depth
-                    for link in filtered_links:
-                        if link not in discovered_urls and len(discovered_urls) < self.max_pages:
-                            discovered_urls.add(link)
-                            if depth < self.max_depth:
-                                urls_to_crawl.append(link)
-                    
-                    print(f"[CRAWL] Processed {url}: found {len(filtered_links)} new links")
+            seeds = []
+            if self.use_sitemaps and not checkpoint:
+                seeds = self._discover_sitemap_urls(domain)
             
-            # Final URL list with prioritization
-            final_urls = self._prioritize_urls(list(discovered_urls), domain)
+            if self.crawl_strategy == 'best_first':
+                final_urls = self._crawl_best_first(domain, on_page, stop_condition, seeds, checkpoint)
+            else:
+                final_urls = self._crawl_breadth_first(domain, on_page, stop_condition, seeds, checkpoint)
+            
+            if cached_origin and not self.crawled_urls and not self.crawl_interrupted:
+                self._forget_origin(requested)
+            if not self.crawl_interrupted:
+                self._finish_checkpoint(domain, final_urls)
             
             self.logger.info(f"Advanced crawl completed for {domain}: {len(final_urls)} pages")
             print(f"[CRAWL] Completed for {domain}: {len(final_urls)} pages, {len(self.failed_urls)} failed")
@@ -152,92 +329,587 @@ class WebCrawler:
             print(f"[CRAWL] Error crawling {domain}: {str(e)}")
             return []
     
-    def _apply_rate_limit(self):
-        """Apply rate limiting to prevent overwhelming servers."""
-        current_time = time.time()
-        time_since_last = current_time - self.rate_limiter
+    def _start_url(self, domain: str) -> Tuple[Optional[str], bool]:
+        """
+        Turn the requested domain into the crawl's start URL.
         
-        if time_since_last < self.rate_limit:
-            sleep_time = self.rate_limit - time_since_last
-            time.sleep(sleep_time)
+        URLs with a scheme are used as given. Bare domains are resolved to
+        the origin that answers (cached per domain), unless resolution is
+        disabled, in which case https:// is assumed.
+        
+        Args:
+            domain: Bare domain or URL
             
-        self.rate_limiter = time.time()
+        Returns:
+            Tuple of (canonical start URL or None if nothing answered,
+            whether the origin came from the cache)
+        """
+        if domain.startswith(('http://', 'https://')):
+            return canonicalize_url(domain), False
+        if not self.resolve_origin:
+            return canonicalize_url(f"https://{domain}"), False
+        
+        host, _, path = domain.partition('/')
+        origin = self.origin_resolver.cached(host)
+        cached = origin is not None
+        if not cached:
+            # Probes run on the resolver's threads, bound to this job
+            origin = self.origin_resolver.resolve(host, use_cache=False, timeout=self._request_timeout(),
+                                                  fetch=partial(self._in_job, self._state(), self._fetch_any_status))
+            if origin is None:
+                return None, False
+            print(f"[CRAWL] Resolved {host} to {origin}")
+        return canonicalize_url(origin + path), cached
     
-    def _rotate_user_agent(self):
-        """Rotate user agent to avoid detection."""
-        import random
-        user_agent = random.choice(self.user_agents)
-        self.session.headers.update({'User-Agent': user_agent})
+    def _forget_origin(self, domain: str):
+        """Drop a cached origin that yielded no pages so the next job re-resolves it."""
+        host = domain.partition('/')[0]
+        self.logger.warning(f"Cached origin for {host} yielded no pages; it will be resolved again")
+        self.origin_resolver.forget(host)
     
-    def _filter_and_prioritize_links(self, links: List[str], domain: str) -> List[str]:
-        """Filter and prioritize links based on relevance."""
-        filtered_links = []
-        domain_parts = domain.replace('https://', '').replace('http://', '').split('/')[0]
+    def _resume_job(self, domain: str) -> Optional[CrawlCheckpoint]:
+        """
+        Load the domain's checkpoint into the current job.
         
-        for link in links:
-            # Skip if already visited or failed
-            if link in self.visited_urls or link in self.failed_urls:
-                continue
+        Args:
+            domain: Domain as requested (the checkpoint key)
+            
+        Returns:
+            The checkpoint, or None if the crawl starts from scratch
+        """
+        if self.checkpoint_store is None:
+            return None
+        state = self._state()
+        state.checkpoint_key = domain
+        state.checkpoint_saved_at = time.monotonic()
+        
+        try:
+            data = self.checkpoint_store.load_crawl_checkpoint(domain, max_age=self.checkpoint_max_age)
+            checkpoint = CrawlCheckpoint.from_dict(data) if data else None
+        except Exception as e:
+            self.logger.warning(f"Could not load crawl checkpoint for {domain}: {e}")
+            return None
+        if checkpoint is None:
+            return None
+        
+        state.resumed = True
+        state.visited_urls.update(checkpoint.crawled)
+        state.crawled_urls.update(checkpoint.crawled)
+        state.failed_urls.update(checkpoint.failed)
+        if not checkpoint.complete:
+            print(f"[CRAWL] Resuming {domain}: {len(checkpoint.crawled)} pages crawled, "
+                  f"{len(checkpoint.pending)} queued")
+        return checkpoint
+    
+    def _checkpoint_due(self) -> bool:
+        """Check whether the current job should save its progress now."""
+        state = self._state()
+        return (state.checkpoint_key is not None
+                and time.monotonic() - state.checkpoint_saved_at >= self.checkpoint_interval)
+    
+    def _save_checkpoint(self, start_url: str, pending: Iterable[Tuple[str, int]],
+                         discovered: Iterable[str], urls: Optional[List[str]] = None):
+        """
+        Save the current job's progress.
+        
+        Args:
+            start_url: Canonical start URL of the crawl
+            pending: Queued (url, depth) pairs, in crawl order
+            discovered: URLs already scheduled once
+            urls: Result of the crawl, once it has finished
+        """
+        state = self._state()
+        if state.checkpoint_key is None:
+            return
+        checkpoint = CrawlCheckpoint(start_url, pending, discovered, state.crawled_urls,
+                                     state.failed_urls, urls)
+        try:
+            self.checkpoint_store.save_crawl_checkpoint(state.checkpoint_key, checkpoint.to_dict())
+        except Exception as e:
+            # A lost checkpoint only costs work on the next run
+            self.logger.warning(f"Could not save crawl checkpoint for {state.checkpoint_key}: {e}")
+        state.checkpoint_saved_at = time.monotonic()
+    
+    def _finish_checkpoint(self, start_url: str, urls: List[str]):
+        """Record a finished crawl's result, or drop a checkpoint that found nothing."""
+        state = self._state()
+        if state.checkpoint_key is None:
+            return
+        if self.crawled_urls:
+            self._save_checkpoint(start_url, (), (), urls)
+        else:
+            self.clear_checkpoint(state.checkpoint_key)
+    
+    def clear_checkpoint(self, domain: str):
+        """
+        Forget a domain's saved crawl, so the next crawl starts from scratch.
+        
+        Call this once everything depending on the crawl result is done.
+        
+        Args:
+            domain: Domain as passed to crawl_company_website
+        """
+        if self.checkpoint_store is None:
+            return
+        try:
+            self.checkpoint_store.clear_crawl_checkpoint(domain)
+        except Exception as e:
+            self.logger.warning(f"Could not clear crawl checkpoint for {domain}: {e}")
+    
+    def _start_job(self, deadline: Optional[Deadline] = None) -> CrawlState:
+        """Give the calling thread a fresh crawl state."""
+        self._job.state = CrawlState(
+            page_cache=PageCache(max_entries=self.page_cache_size),
+            deduplicator=ContentDeduplicator() if self.detect_duplicates else None,
+            sitemap_discovery=SitemapDiscovery(self._fetch_sitemap, max_sitemaps=self.max_sitemaps)
+        )
+        if deadline is not None:
+            self._job.state.deadline = deadline
+        return self._job.state
+    
+    def _state(self) -> CrawlState:
+        """
+        Return the calling thread's crawl state.
+        
+        Raises:
+            RuntimeError: If the thread works for no job; worker threads
+                must be handed one (see _in_job), or their requests would
+                escape the job's deadline and counters
+        """
+        state = getattr(self._job, 'state', None)
+        if state is None:
+            raise RuntimeError(f"No crawl job on thread {threading.current_thread().name}")
+        return state
+    
+    @contextmanager
+    def _using_job(self, job: Optional[CrawlState]) -> Iterator[CrawlState]:
+        """Make a job the calling thread's current one for the duration of a block."""
+        if job is None:
+            yield self.job
+            return
+        previous = getattr(self._job, 'state', None)
+        self._job.state = job
+        try:
+            yield job
+        finally:
+            self._job.state = previous
+    
+    @property
+    def job(self) -> CrawlState:
+        """
+        The calling thread's current crawl job.
+        
+        Take it after crawl_company_website returns and pass it to
+        get_page, fetch_body and the stats getters from other threads, so
+        they use that crawl's pages and counters. A thread that has not
+        crawled yet gets a fresh job.
+        """
+        state = getattr(self._job, 'state', None)
+        return state if state is not None else self._start_job()
+    
+    @property
+    def page_cache(self) -> PageCache:
+        """Parsed pages of the current job."""
+        return self.job.page_cache
+    
+    @property
+    def deduplicator(self) -> Optional[ContentDeduplicator]:
+        """Content fingerprints of the current job's pages (None when disabled)."""
+        return self.job.deduplicator
+    
+    @property
+    def charset_decoder(self) -> CharsetDecoder:
+        """Decoder counting the current job's pages."""
+        return self.job.charset_decoder
+    
+    @property
+    def sitemap_discovery(self) -> SitemapDiscovery:
+        """Sitemap reader of the current job."""
+        return self.job.sitemap_discovery
+    
+    @property
+    def visited_urls(self) -> Set[str]:
+        """URLs fetched successfully by the current job."""
+        return self.job.visited_urls
+    
+    @property
+    def crawled_urls(self) -> Set[str]:
+        """URLs fetched and parsed by the current job."""
+        return self.job.crawled_urls
+    
+    @property
+    def failed_urls(self) -> Set[str]:
+        """URLs the current job could not fetch."""
+        return self.job.failed_urls
+    
+    @property
+    def crawl_interrupted(self) -> bool:
+        """True if the current job's deadline ended the crawl before it was done."""
+        return self.job.interrupted
+    
+    def _deadline(self) -> Deadline:
+        """Return the calling thread's job deadline."""
+        return self._state().deadline
+    
+    def _in_job(self, job: CrawlState, func: Callable, *args):
+        """Run a function as part of a crawl job (for executor threads)."""
+        with self._using_job(job):
+            return func(*args)
+    
+    def _request_timeout(self, deadline: Optional[Deadline] = None) -> float:
+        """Return the request timeout, capped to the time left."""
+        return (deadline or self._deadline()).timeout(self.timeout)
+    
+    def _out_of_time(self) -> bool:
+        """Check the job deadline and mark the crawl interrupted once it has expired."""
+        state = self._state()
+        if not state.interrupted and state.deadline.expired():
+            state.interrupted = True
+            print(f"[CRAWL] Time budget used up after {len(state.crawled_urls)} pages "
+                  f"({state.deadline.elapsed():.1f}s)")
+        return state.interrupted
+    
+    def _crawl_breadth_first(self, domain: str, on_page: Optional[Callable[[CrawledPage], None]],
+                             stop_condition: Optional[ContactPageStopCondition],
+                             seeds: List[str] = (), resume: Optional[CrawlCheckpoint] = None) -> List[str]:
+        """
+        Crawl level by level; returns every discovered URL up to max_pages.
+        
+        Sitemap seeds are crawled at depth 1, ahead of the homepage links.
+        A resumed crawl continues with the shallowest saved level.
+        """
+        start_depth, urls_to_crawl, next_level, discovered_urls = self._breadth_first_start(domain, seeds, resume)
+        
+        # Intelligent crawling with depth control
+        for depth in range(start_depth, self.max_depth + 1):
+            if not urls_to_crawl or len(discovered_urls) >= self.max_pages:
+                break
                 
-            # Must be from same domain
-            if domain_parts not in link:
-                continue
+            print(f"[CRAWL] Depth {depth}: Processing {len(urls_to_crawl)} URLs")
+            current_batch = urls_to_crawl
+            urls_to_crawl = next_level if depth < self.max_depth else []
+            next_level = []
+            
+            # Links of duplicate pages wait until the rest of the level is done
+            deferred_links = []
+            
+            for index, url in enumerate(current_batch):
+                if len(discovered_urls) >= self.max_pages:
+                    break
+                    
+                if url in self.visited_urls:
+                    continue
                 
-            # Skip common non-content URLs
-            skip_patterns = [
-                '/wp-admin/', '/admin/', '/login/', '/register/', '/signup/',
-                '/logout/', '/api/', '/ajax/', '/static/', '/assets/', '/css/',
-                '/js/', '/images/', '/img/', '/photos/', '/videos/', '/media/',
-                '/download/', '/files/', '/documents/', '/pdf/', '/doc/',
-                '/search/', '/filter/', '/sort/', '/page/', '/tag/', '/category/',
-                '/archive/', '/feed/', '/rss/', '/sitemap', '/robots.txt',
-                '/favicon.ico', '/apple-touch-icon', '/manifest.json'
-            ]
-            
-            if any(pattern in link.lower() for pattern in skip_patterns):
-                continue
+                out_of_time = self._out_of_time()
+                if out_of_time or self._checkpoint_due():
+                    pending = [(u, depth) for u in current_batch[index:]] + [(u, depth + 1) for u in urls_to_crawl]
+                    self._save_checkpoint(domain, pending, discovered_urls)
+                if out_of_time:
+                    # Unfetched URLs are left to the next run
+                    return self._prioritize_urls(list(self.crawled_urls), domain)
+                    
+                # Fetch page content
+                content = self._fetch_page(url)
+                if not content:
+                    self.failed_urls.add(url)
+                    continue
+                    
+                self.visited_urls.add(url)
+                self.crawled_urls.add(url)
+                
+                # Parse once: links, text and mailto hrefs
+                page = self._parse_page(url, content, domain)
+                if on_page:
+                    on_page(page)
+                page_links = page.links
                 
-            # Skip file extensions
-            skip_extensions = ['.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
-                             '.zip', '.rar', '.tar', '.gz', '.jpg', '.jpeg', '.png', '.gif',
-                             '.svg', '.ico', '.css', '.js', '.xml', '.json', '.txt']
+                # Filter and prioritize links
+                filtered_links = self._filter_and_prioritize_links(page_links, domain)
+                
+                # Add new links for next depth
+                if page.duplicate_of:
+                    deferred_links.extend(filtered_links)
+                else:
+                    self._discover_links(filtered_links, discovered_urls, urls_to_crawl, depth)
+                
+                print(f"[CRAWL] Processed {url}: found {len(filtered_links)} new links")
+                
+                # Early stop returns only pages already fetched
+                if stop_condition and self._should_stop(page, stop_condition):
+                    return self._prioritize_urls(list(self.crawled_urls), domain)
+            
+            self._discover_links(deferred_links, discovered_urls, urls_to_crawl, depth)
+        
+        # Final URL list with prioritization
+        return self._prioritize_urls(list(discovered_urls), domain)
+    
+    def _discover_links(self, links: List[str], discovered_urls: Set[str], urls_to_crawl: List[str], depth: int):
+        """Record new links within max_pages and queue them for the next depth."""
+        for link in links:
+            if link not in discovered_urls and len(discovered_urls) < self.max_pages:
+                discovered_urls.add(link)
+                if depth < self.max_depth:
+                    urls_to_crawl.append(link)
+    
+    def _breadth_first_start(self, domain: str, seeds: List[str],
+                             resume: Optional[CrawlCheckpoint]) -> Tuple[int, List[str], List[str], Set[str]]:
+        """
+        Build the initial BFS queues, from scratch or from a checkpoint.
+        
+        Returns:
+            Tuple of (first depth, URLs at that depth, URLs one level deeper,
+            discovered URLs)
+        """
+        if resume is not None:
+            start_depth = min((depth for _, depth in resume.pending), default=0)
+            current = [url for url, depth in resume.pending if depth == start_depth]
+            deeper = [url for url, depth in resume.pending if depth > start_depth]
+            return start_depth, current, deeper, set(resume.discovered)
+        
+        # Start with homepage; sitemap seeds wait for depth 1
+        seeds = seeds[:max(0, self.max_pages - 1)]
+        return 0, [domain], list(seeds), {domain, *seeds}
+    
+    def _crawl_best_first(self, domain: str, on_page: Optional[Callable[[CrawledPage], None]],
+                          stop_condition: Optional[ContactPageStopCondition],
+                          seeds: List[str] = (), resume: Optional[CrawlCheckpoint] = None) -> List[str]:
+        """
+        Crawl the most relevant known page first.
+        
+        Pages up to max_depth + 1 links from the homepage are fetched (the
+        same pages the BFS crawl returns), but only pages within max_depth
+        are expanded. Every returned URL has already been fetched and parsed.
+        Sitemap seeds enter the frontier as depth-1 links.
+        
+        Returns:
+            Fetched URLs in priority order
+        """
+        frontier = self._best_first_frontier(domain, seeds, resume)
+        
+        while frontier and len(self.crawled_urls) < self.max_pages:
+            out_of_time = self._out_of_time()
+            if out_of_time or self._checkpoint_due():
+                self._save_checkpoint(domain, frontier.pending(), frontier.seen)
+            if out_of_time:
+                break
+            url, depth = frontier.pop()
             
-            if any(link.lower().endswith(ext) for ext in skip_extensions):
+            content = self._fetch_page(url)
+            if not content:
+                self.failed_urls.add(url)
                 continue
-                
-            filtered_links.append(link)
+            
+            self.visited_urls.add(url)
+            self.crawled_urls.add(url)
+            
+            page = self._parse_page(url, content, domain)
+            if on_page:
+                on_page(page)
+            
+            new_links = 0
+            if depth <= self.max_depth:
+                new_links = self._queue_links(frontier, page, domain, depth + 1)
+            
+            print(f"[CRAWL] Processed {url} (depth {depth}): queued {new_links} new links")
+            
+            if stop_condition and self._should_stop(page, stop_condition):
+                break
+        
+        return self._prioritize_urls(list(self.crawled_urls), domain)
+    
+    def _queue_links(self, frontier: CrawlFrontier, page: CrawledPage, domain: str, depth: int) -> int:
+        """Push a page's new links, ranking those of duplicate pages lower."""
+        links = self._filter_links(page.links, domain)
+        if not page.duplicate_of:
+            return frontier.push_many(links, depth)
+        return sum(1 for link in links
+                   if frontier.push(link, depth, score=self._link_priority(link) - DUPLICATE_LINK_PENALTY))
+    
+    def _best_first_frontier(self, domain: str, seeds: List[str],
+                             resume: Optional[CrawlCheckpoint]) -> CrawlFrontier:
+        """Build the best-first frontier, from scratch or from a checkpoint."""
+        frontier = CrawlFrontier(self._link_priority)
+        if resume is not None:
+            frontier.restore(resume.pending, resume.discovered)
+        else:
+            frontier.push(domain, 0, score=float('inf'))
+            frontier.push_many(seeds, 1)
+        return frontier
+    
+    def _discover_sitemap_urls(self, domain: str) -> List[str]:
+        """
+        Read the site's sitemaps and return the most relevant page URLs.
+        
+        Only the best max_pages URLs are kept while streaming; the set used
+        to skip duplicates is bounded by the discovery's max_urls.
+        
+        Args:
+            domain: Site root URL
+            
+        Returns:
+            Canonical on-site URLs, most relevant first
+        """
+        host = site_host(domain)
+        seen = {domain}
+        
+        # Sitemap entries come from the cached robots.txt when it was read
+        declared = None if self.bypass_robots else self.robots_cache.get(domain).sitemaps
+        
+        deadline = self._deadline()
+        
+        def candidates():
+            for url in self.sitemap_discovery.iter_urls(domain, declared):
+                if deadline.expired():
+                    # Crawl with the seeds found so far
+                    break
+                if not (self.url_classifier.accept(url, host) and self._allowed_by_robots(url)):
+                    continue
+                url = canonicalize_url(url)
+                if url not in seen:
+                    seen.add(url)
+                    yield url
+        
+        best = heapq.nlargest(self.max_pages, candidates(), key=self._link_priority)
+        
+        stats = self.sitemap_discovery.stats
+        print(f"[CRAWL] Sitemaps: {stats['sitemaps']} read, {stats['urls']} URLs listed, {len(best)} seeded")
+        return best
+    
+    def _fetch_sitemap(self, url: str) -> requests.Response:
+        """Request a sitemap or robots.txt through the rate limiter."""
+        self._apply_rate_limit(url)
+        return self._request_page(url, timeout=self._request_timeout())
+    
+    def _should_stop(self, page: CrawledPage, stop_condition: ContactPageStopCondition) -> bool:
+        """Feed a page to the stop condition and report whether to end the crawl."""
+        stop_condition.update(page)
+        if stop_condition.should_stop():
+            print(f"[CRAWL] Stop condition met after {len(self.crawled_urls)} pages "
+                  f"({len(stop_condition.emails_seen)} emails seen)")
+            return True
+        return False
+    
+    def _apply_rate_limit(self, url: str):
+        """Apply per-host rate limiting to prevent overwhelming servers."""
+        self.rate_limiter.acquire(url, self._state().rate_stats)
+    
+    def reset_fetch_stats(self, job: Optional[CrawlState] = None):
+        """Reset download counters of a job (the current one by default)."""
+        (job or self.job).reset_fetch_stats()
+    
+    def _count_fetch(self, key: str, amount: int = 1):
+        """Increment a download counter of the current job."""
+        self._state().count_fetch(key, amount)
+    
+    def get_fetch_stats(self, job: Optional[CrawlState] = None) -> Dict[str, int]:
+        """
+        Get download statistics for a crawl.
+        
+        Args:
+            job: Crawl job (the current one by default)
+        
+        Returns:
+            Dict with pages read, bytes read, rejected/truncated pages and the
+            number of bytes that were not downloaded (known from Content-Length
+            or from the cached copy of a page that was not modified)
+        """
+        return (job or self.job).get_fetch_stats()
+    
+    def get_charset_stats(self, job: Optional[CrawlState] = None) -> Dict[str, int]:
+        """Get how many pages each decoding step handled in a crawl (the current one by default)."""
+        return (job or self.job).charset_decoder.get_stats()
+    
+    def get_http_cache_stats(self) -> Dict[str, int]:
+        """Get persistent HTTP cache counters (empty without a cache)."""
+        return self.http_cache.get_stats() if self.http_cache is not None else {}
+    
+    def get_duplicate_stats(self, job: Optional[CrawlState] = None) -> Dict[str, float]:
+        """Get a crawl's duplicate page counters and extraction time saved (empty when disabled)."""
+        deduplicator = (job or self.job).deduplicator
+        return deduplicator.get_stats() if deduplicator is not None else {}
+    
+    def get_circuit_breaker_stats(self) -> Dict[str, object]:
+        """Get circuits opened, requests refused and currently cut-off hosts."""
+        return self.circuit_breaker.get_stats()
+    
+    def get_rate_limit_stats(self, job: Optional[CrawlState] = None) -> dict:
+        """Get politeness wait-time statistics for a crawl (the current one by default)."""
+        return (job or self.job).rate_stats.get_stats()
+    
+    def get_connection_stats(self) -> Dict[str, object]:
+        """
+        Get connection reuse statistics for the shared pool.
+        
+        Counts cover the per-host pools currently held by the session.
+        
+        Returns:
+            Dict with requests sent, connections opened, reused requests,
+            the reuse ratio and the pool size
+        """
+        pools = self._adapter.poolmanager.pools
+        requests_sent = 0
+        connections = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                requests_sent += pool.num_requests
+                connections += pool.num_connections
+        reused = max(0, requests_sent - connections)
+        return {
+            'requests': requests_sent,
+            'connections': connections,
+            'reused': reused,
+            'reuse_ratio': round(reused / requests_sent, 3) if requests_sent else 0.0,
+            'pool_size': self.pool_size,
+        }
+    
+    def _request_headers(self) -> Dict[str, str]:
+        """
+        Build per-request headers with a rotated user agent.
         
-        # Prioritize by relevance
-        return self._prioritize_links_by_relevance(filtered_links, domain)
+        The user agent is passed with each request instead of being written
+        to the shared session headers, which other threads are reading.
+        """
+        return {'User-Agent': random.choice(self.user_agents)}
+    
+    def _filter_and_prioritize_links(self, links: List[str], domain: str) -> List[str]:
+        """Filter and prioritize links based on relevance."""
+        return self._prioritize_links_by_relevance(self._filter_links(links, domain), domain)
+    
+    def _filter_links(self, links: List[str], domain: str) -> List[str]:
+        """Filter out visited, foreign and non-content links."""
+        host = site_host(domain)
+        classifier = self.url_classifier
+        
+        return [
+            link for link in links
+            # Skip if already visited or failed
+            if link not in self.visited_urls and link not in self.failed_urls
+            # Must be on the same site and look like content
+            and classifier.accept(link, host)
+            and self._allowed_by_robots(link)
+        ]
     
     def _prioritize_links_by_relevance(self, links: List[str], domain: str) -> List[str]:
         """Prioritize links by relevance for email discovery."""
-        priority_keywords = [
-            'contact', 'about', 'team', 'staff', 'people', 'leadership', 'management',
-            'support', 'help', 'info', 'news', 'press', 'media', 'company',
-            'services', 'products', 'solutions', 'careers', 'jobs', 'hiring'
-        ]
+        return sorted(links, key=self._link_priority, reverse=True)
+    
+    def _link_priority(self, link: str) -> int:
+        """Score a link by relevance for email discovery."""
+        link_lower = link.lower()
         
-        def link_priority(link):
-            score = 0
-            link_lower = link.lower()
-            
-            # High priority for contact-related pages
-            for keyword in priority_keywords:
-                if keyword in link_lower:
-                    score += 10
-            
-            # Medium priority for main sections
-            if any(section in link_lower for section in ['/', '/home', '/index']):
-                score += 5
-                
-            # Lower priority for deep paths
-            path_depth = link.count('/') - 2  # Subtract domain slashes
-            score -= path_depth
+        # High priority for contact-related pages
+        score = 10 * self.priority_matcher.count(link_lower)
+        
+        # Medium priority for main sections ('/home' and '/index' contain '/')
+        if '/' in link_lower:
+            score += 5
             
-            return score
+        # Lower priority for deep paths
+        path_depth = link.count('/') - 2  # Subtract domain slashes
+        score -= path_depth
         
-        return sorted(links, key=link_priority, reverse=True)
+        return score
     
     def _prioritize_urls(self, urls: List[str], domain: str) -> List[str]:
         """Final prioritization of URLs for crawling."""
@@ -256,83 +928,364 @@ class WebCrawler:
         return prioritized[:self.max_pages]
     
     def _check_robots_txt(self, domain: str) -> bool:
-        """Check if crawling is allowed by robots.txt."""
+        """
+        Check if the homepage may be crawled and apply the site's Crawl-delay.
+        
+        robots.txt comes from the shared TTL cache, so repeated jobs for the
+        same site do not refetch it.
+        """
         if self.bypass_robots:
             # BYPASS ROBOTS.TXT - Always return True to ignore robots.txt
             # WARNING: This bypasses website crawling restrictions
             return True
         
-        # Original robots.txt checking code:
-        try:
-            robots_url = urljoin(domain, '/robots.txt')
-            response = self.session.get(robots_url, timeout=self.timeout)
-            
-            if response.status_code == 200:
-                robots_content = response.text.lower()
-                # Simple check - look for disallow patterns
-                if 'disallow: /' in robots_content:
-                    return False
-            return True
-        except:
-            return True  # If we can't check, assume it's okay
+        rules = self.robots_cache.get(domain)
+        if rules.crawl_delay:
+            self._apply_crawl_delay(domain, rules.crawl_delay)
+        return rules.can_fetch(domain)
+    
+    def _allowed_by_robots(self, url: str) -> bool:
+        """Check a single URL against its origin's robots.txt rules."""
+        return self.bypass_robots or self.robots_cache.get(url).can_fetch(url)
+    
+    def _apply_crawl_delay(self, url: str, crawl_delay: float):
+        """Slow the host's rate limit down to its Crawl-delay (never speed it up)."""
+        rate = 1.0 / crawl_delay
+        if self.rate_limiter.rate <= 0 or rate < self.rate_limiter.rate:
+            self.rate_limiter.set_host_rate(url, rate, burst=1)
+            print(f"[CRAWL] Honoring Crawl-delay of {crawl_delay}s for {urlparse(url).netloc}")
+    
+    def _fetch_any_status(self, url: str, timeout: Optional[float] = None) -> requests.Response:
+        """
+        Request a URL through the rate limiter, returning any status.
+        
+        Args:
+            url: URL to request
+            timeout: Request timeout (defaults to the job's, capped to its time left)
+        """
+        self._apply_rate_limit(url)
+        if timeout is None:
+            timeout = self._request_timeout()
+        return self.session.get(url, timeout=timeout, headers=self._request_headers(), stream=True)
+    
+    def _fetch_page(self, url: str, deadline: Optional[Deadline] = None) -> Optional[ParsedDocument]:
+        """
+        Fetch a single page and return its hrefs and text.
+        
+        Args:
+            url: URL to fetch
+            deadline: Time budget (defaults to the current job's)
+        """
+        download = self.fetch_body(url, deadline)
+        if download is None:
+            return None
+        return self._parse_body(*download)
     
-    def _fetch_page(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch a single page and return BeautifulSoup object."""
+    def fetch_body(self, url: str, deadline: Optional[Deadline] = None,
+                   feeder=None, job: Optional[CrawlState] = None) -> Optional[Tuple[bytes, str]]:
+        """
+        Fetch a single page without decoding or parsing it.
+        
+        Retries, circuit breaking and rate limiting apply as for crawled
+        pages. The body is left for the caller to parse, e.g. in another
+        process.
+        
+        Args:
+            url: URL to fetch
+            deadline: Time budget (defaults to the current job's)
+            feeder: Optional EmailFeeder (or any object with feed(chunk,
+                content_type) and restart()) that receives the body chunk
+                by chunk as it arrives; the body is then not kept
+            job: Crawl job whose counters the fetch goes into (the current
+                one by default)
+            
+        Returns:
+            Tuple of (body, content_type), or None if the page could not be
+            fetched or is not HTML. With a feeder the body is empty.
+        """
+        with self._using_job(job):
+            return self._fetch_body(url, deadline, feeder)
+    
+    def _fetch_body(self, url: str, deadline: Optional[Deadline], feeder) -> Optional[Tuple[bytes, str]]:
+        """Fetch a page body for the current job (see fetch_body)."""
+        deadline = deadline or self._deadline()
         try:
-            self.logger.debug(f"Fetching: {url}")
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
+            attempt = 0
+            while True:
+                self._check_circuit(url)
+                
+                # Rate limiting (per host, shared by all threads)
+                self._apply_rate_limit(url)
+                try:
+                    download = self._download_page(url, timeout=self._request_timeout(deadline), feeder=feeder)
+                    break
+                except requests.RequestException as e:
+                    wait = self._retry_delay(url, e, attempt, deadline)
+                    if wait is None:
+                        raise
+                    time.sleep(wait)
+                    attempt += 1
+                    if feeder is not None:
+                        # The retry streams the body from the start again
+                        feeder.restart()
+            
+            self.circuit_breaker.record_success(url)
             
             # Add delay between requests
-            time.sleep(self.delay)
+            time.sleep(min(self.delay, deadline.remaining()))
             
-            return BeautifulSoup(response.content, 'html.parser')
+            return download
             
+        except CircuitOpenError as e:
+            self.logger.debug(str(e))
+            return None
         except requests.RequestException as e:
             self.logger.warning(f"Failed to fetch {url}: {str(e)}")
             return None
     
-    def _extract_links(self, soup: BeautifulSoup, base_url: str) -> Set[str]:
+    def _check_circuit(self, url: str):
+        """
+        Refuse to request a host whose circuit breaker is open.
+        
+        Raises:
+            CircuitOpenError: If the host is cut off
+        """
+        if not self.circuit_breaker.allow(url):
+            raise CircuitOpenError(f"Skipping {url}: host circuit open after repeated failures")
+    
+    def _retry_delay(self, url: str, error: requests.RequestException, attempt: int,
+                     deadline: Optional[Deadline] = None) -> Optional[float]:
+        """
+        Record a failed attempt and decide whether to retry it.
+        
+        Args:
+            url: URL that failed
+            error: The error it failed with
+            attempt: Zero-based attempt number
+            deadline: Time budget (defaults to the current job's); a retry
+                that could not start before it expires is not attempted
+            
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        self.circuit_breaker.record_failure(url, error)
+        if self.circuit_breaker.is_open(url):
+            return None
+        
+        wait = self.retry_policy.get_delay(attempt, error)
+        if wait is not None and wait >= (deadline or self._deadline()).remaining():
+            return None
+        if wait is not None:
+            self._count_fetch('retries')
+            self.logger.info(f"Retrying {url} in {wait:.2f}s after: {error}")
+        return wait
+    
+    def _request_page(self, url: str, headers: Optional[dict] = None,
+                      timeout: Optional[float] = None) -> requests.Response:
+        """
+        Perform the blocking HTTP request for a page.
+        
+        Args:
+            url: URL to request
+            headers: Extra headers for this request only (a rotated user
+                agent is added unless one is given)
+            timeout: Request timeout (defaults to the crawler's)
+            
+        Returns:
+            Response with a successful status code
+            
+        Raises:
+            requests.RequestException: On network errors or HTTP error status
+        """
+        self.logger.debug(f"Fetching: {url}")
+        headers = dict(self._request_headers(), **(headers or {}))
+        response = self.session.get(url, timeout=timeout or self.timeout, headers=headers, stream=True)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            response.close()
+            raise
+        return response
+    
+    def _download_page(self, url: str, headers: Optional[dict] = None,
+                       timeout: Optional[float] = None, feeder=None) -> Optional[Tuple[bytes, str]]:
+        """
+        Download a page body, rejecting non-HTML and oversized responses early.
+        
+        Content-Type and Content-Length are checked before the body is read,
+        and the body is streamed so at most `max_page_bytes` are held in
+        memory. A body without Content-Length that exceeds the cap is cut off
+        at the cap.
+        
+        With an HTTP cache, a cached page is requested conditionally and its
+        stored body is reused when the server answers 304 Not Modified.
+        
+        With a feeder, chunks are handed to it as they arrive instead of
+        being kept, so only one chunk is held at a time; such bodies are not
+        stored in the HTTP cache.
+        
+        Args:
+            url: URL to request
+            headers: Extra headers for this request only
+            timeout: Request timeout (defaults to the crawler's)
+            feeder: Optional object with feed(chunk, content_type) (e.g. EmailFeeder)
+            
+        Returns:
+            Tuple of (body bytes, Content-Type header), or None if the
+            response was rejected. The body is empty with a feeder.
+            
+        Raises:
+            requests.RequestException: On network errors or HTTP error status
+        """
+        cache_key = canonicalize_url(url)
+        cached = self.http_cache.get(cache_key) if self.http_cache is not None else None
+        if cached:
+            headers = dict(headers or {}, **cached.conditional_headers())
+        
+        response = self._request_page(url, headers, timeout)
+        try:
+            if cached:
+                not_modified = response.status_code == 304
+                self.http_cache.record_revalidation(cache_key, not_modified)
+                if not_modified:
+                    self._count_fetch('pages')
+                    self._count_fetch('bytes_saved', len(cached.body))
+                    if feeder is not None:
+                        feeder.feed(cached.body, cached.content_type)
+                        return b'', cached.content_type
+                    return cached.body, cached.content_type
+            
+            declared_length = self._declared_length(response)
+            
+            content_type = response.headers.get('Content-Type', '')
+            media_type = content_type.split(';')[0].strip().lower()
+            if media_type and media_type not in HTML_CONTENT_TYPES:
+                self._count_fetch('rejected_content_type')
+                self._count_fetch('bytes_saved', declared_length or 0)
+                self.logger.debug(f"Skipping {url}: content type {media_type}")
+                return None
+            
+            if self.max_page_bytes and declared_length and declared_length > self.max_page_bytes:
+                self._count_fetch('rejected_too_large')
+                self._count_fetch('bytes_saved', declared_length)
+                self.logger.debug(f"Skipping {url}: {declared_length} bytes exceeds the page cap")
+                return None
+            
+            chunks = []
+            size = 0
+            truncated = False
+            # Chunks go to the feeder, if any, instead of being kept
+            keep = chunks.append if feeder is None else (lambda chunk: feeder.feed(chunk, content_type))
+            for chunk in response.iter_content(chunk_size=FETCH_CHUNK_SIZE):
+                if self.max_page_bytes and size + len(chunk) > self.max_page_bytes:
+                    keep(chunk[:self.max_page_bytes - size])
+                    size = self.max_page_bytes
+                    truncated = True
+                    self._count_fetch('truncated')
+                    self.logger.debug(f"Truncated {url} at {self.max_page_bytes} bytes")
+                    break
+                keep(chunk)
+                size += len(chunk)
+            
+            self._count_fetch('pages')
+            self._count_fetch('bytes_read', size)
+            body = b''.join(chunks)
+            
+            if self.http_cache is not None and not truncated and feeder is None:
+                self.http_cache.put(cache_key, body, content_type,
+                                    response.headers.get('ETag'), response.headers.get('Last-Modified'))
+            return body, content_type
+        finally:
+            # Closing before the body is exhausted drops the connection
+            # instead of draining the rest of it
+            response.close()
+    
+    def _parse_body(self, body: bytes, content_type: str) -> ParsedDocument:
+        """Decode a downloaded body and parse it."""
+        return self.parser.parse(self.charset_decoder.decode(body, content_type))
+    
+    @staticmethod
+    def _declared_length(response: requests.Response) -> Optional[int]:
+        """Return the Content-Length header as an int, if present and valid."""
+        try:
+            return int(response.headers['Content-Length'])
+        except (KeyError, ValueError):
+            return None
+    
+    def _extract_links(self, document: ParsedDocument, base_url: str) -> Set[str]:
         """Extract relevant links from a page."""
         links = set()
         
-        for link in soup.find_all('a', href=True):
-            href = link['href']
+        for href in document.hrefs:
             full_url = urljoin(base_url, href)
             
             # Only include internal links
             if self._is_internal_link(full_url, base_url):
-                # Clean URL (remove fragments and query params for email pages)
-                clean_url = self._clean_url(full_url)
-                links.add(clean_url)
+                # Canonicalize so equivalent spellings are crawled once
+                links.add(self._clean_url(full_url))
         
         return links
     
     def _is_internal_link(self, url: str, base_url: str) -> bool:
         """Check if URL is internal to the domain."""
         try:
-            parsed_url = urlparse(url)
-            parsed_base = urlparse(base_url)
-            return parsed_url.netloc == parsed_base.netloc
-        except:
+            if not url.lower().startswith(('http://', 'https://')):
+                return False
+            return site_host(url) == site_host(base_url)
+        except ValueError:
             return False
     
     def _clean_url(self, url: str) -> str:
-        """Clean URL by removing fragments and unnecessary query params."""
-        parsed = urlparse(url)
-        # Remove fragment
-        clean_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-        if parsed.query:
-            clean_url += f"?{parsed.query}"
-        return clean_url
+        """Canonicalize URL (case, default port, tracking params, fragment)."""
+        return canonicalize_url(url)
+    
     
+    def _parse_page(self, url: str, document: ParsedDocument, base_url: str) -> CrawledPage:
+        """
+        Turn a parsed document into links, text and mailto hrefs, and cache it.
+        
+        Args:
+            url: URL the page was fetched from
+            document: Parser backend output
+            base_url: Base URL used to resolve relative links
+            
+        Returns:
+            Parsed page
+        """
+        links = self._extract_links(document, base_url)
+        mailto_links = [href for href in document.hrefs if href.lower().startswith('mailto:')]
+        duplicate_of = self.deduplicator.add(url, document.text) if self.deduplicator is not None else None
+        
+        page = CrawledPage(url, links, document.text, mailto_links, duplicate_of)
+        self.page_cache.put(page)
+        return page
+    
+    def get_page(self, url: str, deadline: Optional[Deadline] = None,
+                 job: Optional[CrawlState] = None) -> Optional[CrawledPage]:
+        """
+        Get a parsed page, reusing the crawl's copy when available.
+        
+        Args:
+            url: Page URL
+            deadline: Time budget for fetching an uncached page; None is
+                returned once it has expired
+            job: Crawl job whose pages to use (the current one by default)
+        """
+        with self._using_job(job) as job:
+            page = job.page_cache.get(url)
+            if page:
+                return page
+            
+            if deadline is not None and deadline.expired():
+                return None
+            document = self._fetch_page(url, deadline)
+            if document:
+                return self._parse_page(url, document, url)
+            return None
     
-    def get_page_content(self, url: str) -> Optional[str]:
+    def get_page_content(self, url: str, job: Optional[CrawlState] = None) -> Optional[str]:
         """Get text content from a specific page."""
-        soup = self._fetch_page(url)
-        if soup:
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            return soup.get_text()
+        page = self.get_page(url, job=job)
+        if page:
+            return page.text
         return None
@@ -6,6 +6,7 @@ Handles data persistence using SQLite.
 import sqlite3
 import json
 import threading
+import time
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pathlib import Path
@@ -89,6 +90,39 @@ class EmailScopeDB:
                 )
             ''')
             
+            # Create domain_origins table (origin each domain resolved to)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS domain_origins (
+                    domain TEXT PRIMARY KEY,
+                    origin TEXT NOT NULL,
+                    resolved_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Create crawl_checkpoints table (progress of unfinished scrapes)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS crawl_checkpoints (
+                    domain TEXT PRIMARY KEY,
+                    state TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            ''')
+            
+            # Create checkpoint_pages table (emails extracted per page so far)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS checkpoint_pages (
+                    domain TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    emails TEXT NOT NULL,
+                    updated_at REAL NOT NULL DEFAULT 0,
+                    PRIMARY KEY (domain, url)
+                )
+            ''')
+            # Tables from before updated_at existed: their rows count as stale
+            columns = [row[1] for row in cursor.execute('PRAGMA table_info(checkpoint_pages)')]
+            if 'updated_at' not in columns:
+                cursor.execute('ALTER TABLE checkpoint_pages ADD COLUMN updated_at REAL NOT NULL DEFAULT 0')
+            
             # Create indexes for better performance
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_domains_domain ON domains(domain)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_emails_domain_id ON emails(domain_id)')
@@ -266,6 +300,125 @@ class EmailScopeDB:
             row = cursor.fetchone()
             return dict(row) if row else None
     
+    def get_origin(self, domain: str) -> Optional[str]:
+        """Get the cached origin (e.g., 'https://www.example.com/') for a domain."""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT origin FROM domain_origins WHERE domain = ?', (domain,))
+            row = cursor.fetchone()
+            return row[0] if row else None
+    
+    def set_origin(self, domain: str, origin: Optional[str]):
+        """
+        Cache the origin a domain resolved to.
+        
+        Args:
+            domain: Bare domain
+            origin: Winning origin URL, or None to forget it
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            if origin is None:
+                cursor.execute('DELETE FROM domain_origins WHERE domain = ?', (domain,))
+            else:
+                cursor.execute('''
+                    INSERT OR REPLACE INTO domain_origins (domain, origin, resolved_at)
+                    VALUES (?, ?, CURRENT_TIMESTAMP)
+                ''', (domain, origin))
+            conn.commit()
+    
+    def save_crawl_checkpoint(self, domain: str, state: Dict[str, Any]):
+        """
+        Save the progress of a crawl so a later run can continue it.
+        
+        Args:
+            domain: Domain as requested
+            state: JSON-serializable crawl state (see CrawlCheckpoint.to_dict)
+        """
+        with self._lock:
+            with sqlite3.connect(self.db_path, timeout=30.0) as conn:
+                conn.execute('''
+                    INSERT OR REPLACE INTO crawl_checkpoints (domain, state, updated_at)
+                    VALUES (?, ?, ?)
+                ''', (domain.lower(), json.dumps(state), time.time()))
+                conn.commit()
+    
+    def load_crawl_checkpoint(self, domain: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Load the saved progress of a crawl.
+        
+        A checkpoint older than max_age is deleted, together with the
+        emails saved for its pages.
+        
+        Args:
+            domain: Domain as requested
+            max_age: Ignore checkpoints older than this many seconds
+            
+        Returns:
+            Saved crawl state, or None if there is no recent checkpoint
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT state, updated_at FROM crawl_checkpoints WHERE domain = ?', (domain.lower(),))
+            row = cursor.fetchone()
+        if not row:
+            return None
+        if max_age is not None and time.time() - row[1] > max_age:
+            self.logger.info(f"Dropping stale crawl checkpoint for {domain}")
+            self.clear_crawl_checkpoint(domain)
+            return None
+        return json.loads(row[0])
+    
+    def save_page_emails(self, domain: str, url: str, emails: List[str]):
+        """
+        Record the emails extracted from one page of an unfinished scrape.
+        
+        Args:
+            domain: Domain as requested
+            url: Page URL
+            emails: Emails found or generated for the page
+        """
+        with self._lock:
+            with sqlite3.connect(self.db_path, timeout=30.0) as conn:
+                conn.execute('''
+                    INSERT OR REPLACE INTO checkpoint_pages (domain, url, emails, updated_at)
+                    VALUES (?, ?, ?, ?)
+                ''', (domain.lower(), url, json.dumps(sorted(emails)), time.time()))
+                conn.commit()
+    
+    def get_page_emails(self, domain: str, max_age: Optional[float] = None) -> Dict[str, List[str]]:
+        """
+        Get the emails recorded per page for an unfinished scrape.
+        
+        Args:
+            domain: Domain as requested
+            max_age: Ignore pages recorded more than this many seconds ago
+            
+        Returns:
+            Dict mapping page URL to its emails
+        """
+        oldest = time.time() - max_age if max_age is not None else float('-inf')
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT url, emails FROM checkpoint_pages WHERE domain = ? AND updated_at >= ?',
+                           (domain.lower(), oldest))
+            return {url: json.loads(emails) for url, emails in cursor.fetchall()}
+    
+    def clear_page_emails(self, domain: str):
+        """Drop the emails recorded per page for a domain, keeping its crawl checkpoint."""
+        with self._lock:
+            with sqlite3.connect(self.db_path, timeout=30.0) as conn:
+                conn.execute('DELETE FROM checkpoint_pages WHERE domain = ?', (domain.lower(),))
+                conn.commit()
+    
+    def clear_crawl_checkpoint(self, domain: str):
+        """Drop the saved crawl and extraction progress of a domain."""
+        with self._lock:
+            with sqlite3.connect(self.db_path, timeout=30.0) as conn:
+                conn.execute('DELETE FROM crawl_checkpoints WHERE domain = ?', (domain.lower(),))
+                conn.execute('DELETE FROM checkpoint_pages WHERE domain = ?', (domain.lower(),))
+                conn.commit()
+    
     def get_emails_by_domain(self, domain: str) -> List[Dict[str, Any]]:
         """Get all emails for a domain."""
         with sqlite3.connect(self.db_path) as conn:
@@ -0,0 +1,196 @@
+"""
+Process-pool extraction module for EmailScope.
+Decodes, parses and scans pages in worker processes, so extraction uses
+every core instead of taking turns on the GIL.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from .budget import Deadline
+from .charset import CharsetDecoder
+from .extractor import EmailExtractor
+from .parsers import get_parser
+
+class PageEmails:
+    """Compact extraction result for one page, cheap to send between processes."""
+
+    __slots__ = ('records', 'chars', 'cut_off', 'seconds')
+
+    def __init__(self, records: Tuple[Tuple[str, str], ...], chars: int, cut_off: bool, seconds: float):
+        """
+        Initialize a result.
+
+        Args:
+            records: (email, source) pairs, source being 'found' or 'mailto_link'
+            chars: Characters of text scanned
+            cut_off: True if the per-page time limit or the deadline stopped the scan
+            seconds: CPU seconds the worker spent on the page
+        """
+        self.records = records
+        self.chars = chars
+        self.cut_off = cut_off
+        self.seconds = seconds
+
+    @property
+    def emails(self) -> Set[str]:
+        """Emails found on the page."""
+        return {email for email, _ in self.records}
+
+    @property
+    def sources(self) -> Dict[str, str]:
+        """Source of each email found on the page."""
+        return dict(self.records)
+
+class _Worker:
+    """Per-process extraction state, built once when the process starts."""
+
+    def __init__(self, parser: str, regex_engine: str, max_page_seconds: Optional[float], scan_bytes: bool = False):
+        self.parser = get_parser(parser)
+        self.decoder = CharsetDecoder()
+        self.extractor = EmailExtractor(regex_engine=regex_engine, max_page_seconds=max_page_seconds)
+        self.scan_bytes = scan_bytes
+
+    def extract(self, body: Optional[bytes], content_type: Optional[str], text: Optional[str],
+                mailto_links: Iterable[str], expires_at: Optional[float]) -> PageEmails:
+        started = time.process_time()
+        # Wall-clock expiry: the monotonic clock is not comparable across processes
+        deadline = Deadline(expires_at - time.time()) if expires_at is not None else None
+
+        stats_before = self.extractor.get_stats()
+        if body is not None and self.scan_bytes:
+            _, sources = self.extractor.extract_body_emails(body, content_type, deadline=deadline)
+        else:
+            if body is not None:
+                document = self.parser.parse(self.decoder.decode(body, content_type))
+                text = document.text
+                mailto_links = [href for href in document.hrefs if href.lower().startswith('mailto:')]
+            _, sources = self.extractor.extract_page_emails(text, mailto_links=mailto_links, deadline=deadline)
+        stats = self.extractor.get_stats()
+        return PageEmails(tuple(sorted(sources.items())), stats['chars'] - stats_before['chars'],
+                          stats['pages_cut_off'] > stats_before['pages_cut_off'], time.process_time() - started)
+
+_worker: Optional[_Worker] = None
+
+def _init_worker(parser: str, regex_engine: str, max_page_seconds: Optional[float], scan_bytes: bool):
+    global _worker
+    _worker = _Worker(parser, regex_engine, max_page_seconds, scan_bytes)
+
+def _extract(body: Optional[bytes], content_type: Optional[str], text: Optional[str],
+             mailto_links: Iterable[str], expires_at: Optional[float]) -> PageEmails:
+    return _worker.extract(body, content_type, text, mailto_links, expires_at)
+
+class ExtractionPool:
+    """
+    Email extraction on a pool of worker processes.
+
+    Parsing with BeautifulSoup or lxml, text extraction and the email scan
+    are CPU-bound and hold the GIL, so extraction threads mostly wait for
+    each other. Here each page is handled by a worker process that keeps its
+    own parser, decoder and compiled patterns, and only the page (raw bytes
+    or text) and a compact PageEmails record cross the process boundary.
+
+    The number of processes is independent of how many threads fetch pages:
+    fetch threads submit pages and wait on the returned futures without
+    holding the GIL.
+    """
+
+    def __init__(self, workers: Optional[int] = None, parser: str = 'html.parser', regex_engine: str = 're',
+                 max_page_seconds: Optional[float] = None, scan_bytes: bool = False,
+                 start_method: str = 'spawn'):
+        """
+        Initialize the pool. Processes start on the first submitted page.
+
+        Args:
+            workers: Worker processes (defaults to the number of CPUs)
+            parser: HTML parser backend used for raw bodies
+            regex_engine: 're' or 're2'
+            max_page_seconds: Time limit for scanning one page (None for no limit)
+            scan_bytes: Scan raw bodies with ByteScanner instead of parsing them
+            start_method: multiprocessing start method; 'spawn' is safe to use
+                from a threaded server, where forking can copy held locks
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_page_seconds = max_page_seconds
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker,
+            initargs=(parser, regex_engine, max_page_seconds, scan_bytes)
+        )
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    def extract_body(self, body: bytes, content_type: Optional[str] = None,
+                     deadline: Optional[Deadline] = None) -> 'Future[PageEmails]':
+        """
+        Decode, parse and scan a raw page body in a worker (or scan its
+        bytes directly, with scan_bytes).
+
+        Args:
+            body: Raw response body
+            content_type: Content-Type response header
+            deadline: Optional job deadline bounding the scan
+
+        Returns:
+            Future resolving to the page's PageEmails
+        """
+        return self._submit(body, content_type, None, (), deadline)
+
+    def extract_text(self, text: str, mailto_links: Iterable[str] = (),
+                     deadline: Optional[Deadline] = None) -> 'Future[PageEmails]':
+        """
+        Scan already parsed page text in a worker.
+
+        Args:
+            text: Visible page text
+            mailto_links: Raw mailto hrefs of the page
+            deadline: Optional job deadline bounding the scan
+
+        Returns:
+            Future resolving to the page's PageEmails
+        """
+        return self._submit(None, None, text, list(mailto_links), deadline)
+
+    def _submit(self, body, content_type, text, mailto_links, deadline) -> 'Future[PageEmails]':
+        expires_at = None
+        if deadline is not None and deadline.limited:
+            expires_at = time.time() + deadline.remaining()
+        future = self._executor.submit(_extract, body, content_type, text, mailto_links, expires_at)
+        future.add_done_callback(self._record)
+        return future
+
+    def _record(self, future: Future):
+        """Count a finished page."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        result = future.result()
+        with self._stats_lock:
+            self.stats['pages'] += 1
+            self.stats['chars'] += result.chars
+            if result.cut_off:
+                self.stats['pages_cut_off'] += 1
+
+    def reset_stats(self):
+        """Reset extraction counters."""
+        with self._stats_lock:
+            self.stats: Dict[str, int] = {'pages': 0, 'chars': 0, 'pages_cut_off': 0}
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get pages and characters scanned, and pages cut off by the time limit."""
+        with self._stats_lock:
+            return dict(self.stats)
+
+    def close(self):
+        """Stop the worker processes after the submitted pages are done."""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'ExtractionPool':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -5,29 +5,77 @@ Finds and extracts email addresses from web content.
 
 import re
 import logging
-from typing import List, Set, Optional, Tuple, Dict
+import threading
+from typing import Callable, Iterable, List, Set, Optional, Tuple, Dict
 from urllib.parse import urlparse
 
+from .budget import Deadline
+from .byte_scanner import ByteScanner
+from .feeder import EmailFeeder
+from .keywords import KeywordMatcher
+from .regex_engine import get_regex_engine
+from .scanner import EmailScanner
+
+# Whitespace around '@' and '.' in spelled-out candidates ('info @ acme . com')
+_SPACED_AT = re.compile(r'\s*@\s*')
+_SPACED_DOT = re.compile(r'\s*\.\s*')
+
+def normalize_email(email: str) -> str:
+    """
+    Normalize an email address by cleaning spaces and special characters.
+    
+    Args:
+        email: Raw address or candidate
+        
+    Returns:
+        Lowercased address without surrounding parentheses or inner spaces
+        around '@' and '.' ('' for empty input)
+    """
+    if not email:
+        return ""
+    
+    # Remove parentheses
+    email = email.strip('()')
+    
+    # Clean spaces around @ symbol and dots; most addresses have none
+    # (every whitespace character but ' ' is unprintable)
+    if ' ' in email or not email.isprintable():
+        email = _SPACED_AT.sub('@', email)
+        email = _SPACED_DOT.sub('.', email)
+        
+        # Remove extra spaces
+        email = email.strip()
+    
+    return email.lower()
+
 class EmailExtractor:
     """Advanced email extractor with intelligent discovery and pattern recognition."""
     
-    def __init__(self):
-        """Initialize the advanced email extractor."""
+    def __init__(self, regex_engine: str = 're', max_page_seconds: Optional[float] = None):
+        """
+        Initialize the advanced email extractor.
+        
+        Args:
+            regex_engine: 're' or 're2' (linear-time, needs google-re2;
+                falls back to re when missing)
+            max_page_seconds: Time limit for scanning one page; pages that
+                hit it keep the emails found so far (None for no limit)
+        """
         self.logger = logging.getLogger(__name__)
+        self.regex_engine = get_regex_engine(regex_engine)
+        self.max_page_seconds = max_page_seconds
         
-        # Enhanced email regex patterns
-        self.email_patterns = [
-            # Standard email pattern
-            re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
-            # Pattern for emails with spaces (common in HTML)
-            re.compile(r'\b[A-Za-z0-9._%+-]+\s*@\s*[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
-            # Pattern for emails in parentheses
-            re.compile(r'\([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\)'),
-            # Pattern for emails with "at" and "dot" obfuscation
-            re.compile(r'\b[A-Za-z0-9._%+-]+\s+at\s+[A-Za-z0-9.-]+\s+dot\s+[A-Z|a-z]{2,}\b', re.I),
-            # Pattern for emails with [at] and [dot] obfuscation
-            re.compile(r'\b[A-Za-z0-9._%+-]+\s*\[at\]\s*[A-Za-z0-9.-]+\s*\[dot\]\s*[A-Z|a-z]{2,}\b', re.I)
-        ]
+        # Validation patterns, compiled once with the chosen engine
+        self._local_part_pattern = self.regex_engine.compile(r'^[A-Za-z0-9._%+-]+$')
+        self._domain_pattern = self.regex_engine.compile(r'^[A-Za-z0-9.-]+\.[A-Za-z]{2,}$')
+        
+        # Extraction counters
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+        
+        # Generated candidates per cleaned domain; they depend only on the domain
+        self._generated: Dict[str, Tuple[str, ...]] = {}
+        self._generated_lock = threading.Lock()
         
         # Advanced common email formats with context
         self.common_formats = [
@@ -57,110 +105,103 @@ class EmailExtractor:
             'retail': ['store@{domain}', 'shop@{domain}', 'orders@{domain}', 'customers@{domain}']
         }
         
+        # Domain keywords per industry, in detection priority order
+        self.industry_keywords = {
+            'tech': ['tech', 'software', 'app', 'dev', 'code', 'digital', 'it', 'computer'],
+            'media': ['media', 'news', 'press', 'blog', 'content', 'publishing'],
+            'finance': ['bank', 'finance', 'financial', 'investment', 'capital', 'money'],
+            'healthcare': ['health', 'medical', 'clinic', 'hospital', 'doctor', 'care'],
+            'education': ['edu', 'university', 'college', 'school', 'academy', 'institute'],
+            'retail': ['shop', 'store', 'market', 'commerce', 'retail', 'buy']
+        }
+        # All industries' keywords are found in one pass over the domain
+        self.industry_matcher = KeywordMatcher(
+            keyword for keywords in self.industry_keywords.values() for keyword in keywords
+        )
+        
         # Email context keywords for better discovery
         self.email_context_keywords = [
             'email', 'contact', 'reach', 'get in touch', 'write to', 'send to',
             'mail', 'message', 'inquiry', 'question', 'support', 'help'
         ]
+        
+        # Plain, spaced, parenthesized, obfuscated and keyword-context
+        # addresses, found in one pass
+        self.scanner = EmailScanner(self.email_context_keywords, engine=self.regex_engine)
+        
+        # Visible text and address markup straight from raw page bytes
+        self.byte_scanner = ByteScanner()
     
-    def extract_emails_from_content(self, content: str) -> Set[str]:
+    def extract_emails_from_content(self, content: str, deadline: Optional[Deadline] = None) -> Set[str]:
         """
         Advanced email extraction with multiple patterns and obfuscation handling.
         
         Args:
             content: Text content to search
+            deadline: Optional job deadline; scanning stops when it or the
+                per-page time limit expires
             
         Returns:
             Set of found email addresses
         """
-        emails = set()
-        
         if not content:
-            return emails
+            return set()
         
-        # Try all email patterns
-        for pattern in self.email_patterns:
-            matches = pattern.findall(content)
-            for email in matches:
-                # Clean and normalize email
-                clean_email = self._normalize_email(email)
-                if clean_email and self._is_valid_email(clean_email):
-                    emails.add(clean_email)
-        
-        # Handle obfuscated emails
-        obfuscated_emails = self._extract_obfuscated_emails(content)
-        emails.update(obfuscated_emails)
-        
-        # Extract emails from context
-        context_emails = self._extract_emails_from_context(content)
-        emails.update(context_emails)
+        page_deadline = self._page_deadline(deadline)
+        emails = self._scan_content(content, page_deadline)
+        cut_off = page_deadline is not None and page_deadline.expired()
+        self._record_page(len(content), cut_off)
+        if cut_off:
+            self.logger.warning(f"Extraction cut off after {page_deadline.elapsed():.2f}s on a "
+                                f"{len(content)}-char page; keeping {len(emails)} emails found so far")
         
         self.logger.debug(f"Extracted {len(emails)} emails from content")
         return emails
     
-    def _normalize_email(self, email: str) -> str:
-        """Normalize email address by cleaning spaces and special characters."""
-        if not email:
-            return ""
-        
-        # Remove parentheses
-        email = email.strip('()')
-        
-        # Clean spaces around @ symbol
-        email = re.sub(r'\s*@\s*', '@', email)
-        
-        # Clean spaces around dots
-        email = re.sub(r'\s*\.\s*', '.', email)
-        
-        # Remove extra spaces
-        email = email.strip()
-        
-        return email.lower()
-    
-    def _extract_obfuscated_emails(self, content: str) -> Set[str]:
-        """Extract emails that are obfuscated with 'at' and 'dot'."""
-        emails = set()
-        
-        # Pattern for "user at domain dot com" format
-        at_dot_pattern = re.compile(r'\b([A-Za-z0-9._%+-]+)\s+at\s+([A-Za-z0-9.-]+)\s+dot\s+([A-Z|a-z]{2,})\b', re.I)
-        matches = at_dot_pattern.findall(content)
-        
-        for user, domain, tld in matches:
-            email = f"{user}@{domain}.{tld}"
-            if self._is_valid_email(email):
-                emails.add(email.lower())
-        
-        # Pattern for "user[at]domain[dot]com" format
-        bracket_pattern = re.compile(r'\b([A-Za-z0-9._%+-]+)\s*\[at\]\s*([A-Za-z0-9.-]+)\s*\[dot\]\s*([A-Z|a-z]{2,})\b', re.I)
-        matches = bracket_pattern.findall(content)
-        
-        for user, domain, tld in matches:
-            email = f"{user}@{domain}.{tld}"
-            if self._is_valid_email(email):
-                emails.add(email.lower())
-        
-        return emails
-    
-    def _extract_emails_from_context(self, content: str) -> Set[str]:
-        """Extract emails based on surrounding context."""
+    def _scan_content(self, content: str, page_deadline: Optional[Deadline] = None, min_end: int = 0) -> Set[str]:
+        """Scan text for candidates (ending after min_end) and return the valid, normalized emails."""
         emails = set()
-        
-        # Look for email patterns near context keywords
-        for keyword in self.email_context_keywords:
-            # Find context around keywords
-            context_pattern = re.compile(
-                rf'(?:{re.escape(keyword)}[^@]*?)([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{{2,}})',
-                re.I
-            )
-            matches = context_pattern.findall(content)
+        for candidate, obfuscated in set(self.scanner.scan(content, page_deadline, min_end)):
+            if obfuscated:
+                # Already rewritten as user@domain.tld
+                if self._is_valid_email(candidate):
+                    emails.add(candidate.lower())
+                continue
             
-            for email in matches:
-                clean_email = self._normalize_email(email)
-                if clean_email and self._is_valid_email(clean_email):
-                    emails.add(clean_email)
-        
+            # Clean and normalize email
+            clean_email = self._normalize_email(candidate)
+            if clean_email and self._is_valid_email(clean_email):
+                emails.add(clean_email)
         return emails
     
+    def _record_page(self, chars: int, cut_off: bool):
+        """Count a scanned page."""
+        with self._stats_lock:
+            self.stats['pages'] += 1
+            self.stats['chars'] += chars
+            if cut_off:
+                self.stats['pages_cut_off'] += 1
+    
+    def _page_deadline(self, deadline: Optional[Deadline]) -> Optional[Deadline]:
+        """Combine the per-page time limit with the job deadline."""
+        limits = [seconds for seconds in (self.max_page_seconds, deadline.remaining() if deadline else None)
+                  if seconds is not None and seconds != float('inf')]
+        return Deadline(min(limits)) if limits else None
+    
+    def reset_stats(self):
+        """Reset extraction counters."""
+        with self._stats_lock:
+            self.stats: Dict[str, int] = {'pages': 0, 'chars': 0, 'pages_cut_off': 0}
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Get pages and characters scanned, and pages cut off by the time limit."""
+        with self._stats_lock:
+            return dict(self.stats)
+    
+    def _normalize_email(self, email: str) -> str:
+        """Normalize email address by cleaning spaces and special characters."""
+        return normalize_email(email)
+    
     def extract_emails_from_links(self, soup) -> Set[str]:
         """
         Extract emails from mailto links.
@@ -178,9 +219,24 @@ class EmailExtractor:
         
         # Find mailto links
         mailto_links = soup.find_all('a', href=re.compile(r'^mailto:', re.I))
+        emails = self.extract_emails_from_mailto_hrefs(link.get('href', '') for link in mailto_links)
+        
+        self.logger.debug(f"Extracted {len(emails)} emails from mailto links")
+        return emails
+    
+    def extract_emails_from_mailto_hrefs(self, hrefs: Iterable[str]) -> Set[str]:
+        """
+        Extract emails from raw mailto href values.
+        
+        Args:
+            hrefs: href attribute values (e.g., 'mailto:info@example.com?subject=Hi')
+            
+        Returns:
+            Set of found email addresses
+        """
+        emails = set()
         
-        for link in mailto_links:
-            href = link.get('href', '')
+        for href in hrefs:
             if href.startswith('mailto:'):
                 email = href[7:]  # Remove 'mailto:' prefix
                 # Remove query parameters
@@ -189,26 +245,38 @@ class EmailExtractor:
                 if self._is_valid_email(clean_email):
                     emails.add(clean_email)
         
-        self.logger.debug(f"Extracted {len(emails)} emails from mailto links")
         return emails
     
     def generate_common_emails(self, domain: str) -> List[str]:
         """
         Generate intelligent email formats for a domain.
         
+        Candidates depend only on the domain, so they are built once per
+        domain and served from memory afterwards.
+        
         Args:
             domain: Domain name (e.g., 'example.com')
             
         Returns:
             List of generated email addresses
         """
-        emails = []
-        
         # Clean domain
         clean_domain = domain.lower().strip()
         if clean_domain.startswith('www.'):
             clean_domain = clean_domain[4:]
         
+        with self._generated_lock:
+            emails = self._generated.get(clean_domain)
+        if emails is None:
+            emails = tuple(self._build_common_emails(clean_domain))
+            with self._generated_lock:
+                self._generated[clean_domain] = emails
+        return list(emails)
+    
+    def _build_common_emails(self, clean_domain: str) -> List[str]:
+        """Build the generated candidates for a cleaned domain."""
+        emails = []
+        
         # Generate standard common emails
         for format_template in self.common_formats:
             email = format_template.format(domain=clean_domain)
@@ -241,25 +309,12 @@ class EmailExtractor:
     
     def _detect_industry(self, domain: str) -> str:
         """Detect industry based on domain name and keywords."""
-        tech_keywords = ['tech', 'software', 'app', 'dev', 'code', 'digital', 'it', 'computer']
-        media_keywords = ['media', 'news', 'press', 'blog', 'content', 'publishing']
-        finance_keywords = ['bank', 'finance', 'financial', 'investment', 'capital', 'money']
-        healthcare_keywords = ['health', 'medical', 'clinic', 'hospital', 'doctor', 'care']
-        education_keywords = ['edu', 'university', 'college', 'school', 'academy', 'institute']
-        retail_keywords = ['shop', 'store', 'market', 'commerce', 'retail', 'buy']
-        
-        if any(keyword in domain for keyword in tech_keywords):
-            return 'tech'
-        elif any(keyword in domain for keyword in media_keywords):
-            return 'media'
-        elif any(keyword in domain for keyword in finance_keywords):
-            return 'finance'
-        elif any(keyword in domain for keyword in healthcare_keywords):
-            return 'healthcare'
-        elif any(keyword in domain for keyword in education_keywords):
-            return 'education'
-        elif any(keyword in domain for keyword in retail_keywords):
-            return 'retail'
+        hits = self.industry_matcher.hits(domain)
+        if hits:
+            # The first industry in priority order with a keyword in the domain
+            for industry, keywords in self.industry_keywords.items():
+                if not hits.isdisjoint(keywords):
+                    return industry
         
         return 'general'
     
@@ -318,44 +373,128 @@ class EmailExtractor:
             return False
         
         # Check for valid characters
-        if not re.match(r'^[A-Za-z0-9._%+-]+$', local):
+        if not self._local_part_pattern.match(local):
             return False
         
-        if not re.match(r'^[A-Za-z0-9.-]+\.[A-Za-z]{2,}$', domain):
+        if not self._domain_pattern.match(domain):
             return False
         
         return True
     
-    def extract_all_emails(self, content: str, soup=None, domain: str = None) -> Tuple[Set[str], Set[str], Dict[str, str]]:
+    def extract_page_emails(self, content: str, soup=None,
+                            mailto_links: Optional[Iterable[str]] = None,
+                            deadline: Optional[Deadline] = None,
+                            content_emails: Optional[Set[str]] = None) -> Tuple[Set[str], Dict[str, str]]:
         """
-        Extract all emails from content and links with source tracking.
+        Extract the emails present on one page.
+        
+        Depends only on the page, not on the domain being crawled, so pages
+        can be processed in any order or batch. Generated candidates are a
+        separate per-domain step (generate_common_emails).
         
         Args:
             content: Text content
             soup: BeautifulSoup object (optional)
-            domain: Domain for generating common emails (optional)
+            mailto_links: Raw mailto hrefs already collected by the crawler (optional)
+            deadline: Job deadline that also bounds the content scan (optional)
+            content_emails: Emails extract_emails_from_content already found in
+                the content (e.g. during the crawl); the content is then not
+                scanned again (optional)
             
         Returns:
-            Tuple of (found_emails, generated_emails, email_sources)
+            Tuple of (found_emails, email_sources)
         """
         found_emails = set()
-        generated_emails = set()
         email_sources = {}
         
         # Extract from content
-        content_emails = self.extract_emails_from_content(content)
+        if content_emails is None:
+            content_emails = self.extract_emails_from_content(content, deadline)
         found_emails.update(content_emails)
         for email in content_emails:
             email_sources[email] = "found"
         
         # Extract from links
+        link_emails = set()
         if soup:
-            link_emails = self.extract_emails_from_links(soup)
-            found_emails.update(link_emails)
-            for email in link_emails:
-                email_sources[email] = "mailto_link"
+            link_emails.update(self.extract_emails_from_links(soup))
+        if mailto_links:
+            link_emails.update(self.extract_emails_from_mailto_hrefs(mailto_links))
+        found_emails.update(link_emails)
+        for email in link_emails:
+            email_sources[email] = "mailto_link"
+        
+        return found_emails, email_sources
+    
+    def extract_body_emails(self, body: bytes, content_type: Optional[str] = None,
+                            deadline: Optional[Deadline] = None) -> Tuple[Set[str], Dict[str, str]]:
+        """
+        Extract the emails of one page from its raw bytes, without parsing it.
+        
+        Covers the visible text, mailto hrefs and Cloudflare-protected
+        addresses (data-cfemail spans count as found, email-protection links
+        as mailto links).
+        
+        Args:
+            body: Raw response body
+            content_type: Content-Type response header (optional)
+            deadline: Job deadline that also bounds the text scan (optional)
+            
+        Returns:
+            Tuple of (found_emails, email_sources)
+        """
+        scanned = self.byte_scanner.scan(body, content_type)
+        found_emails, email_sources = self.extract_page_emails(scanned.text, mailto_links=scanned.mailto_links,
+                                                               deadline=deadline)
+        
+        for emails, source in ((scanned.protected_text, "found"), (scanned.protected_links, "mailto_link")):
+            for email in emails:
+                clean_email = email.strip().lower()
+                if self._is_valid_email(clean_email):
+                    found_emails.add(clean_email)
+                    email_sources[clean_email] = source
+        
+        return found_emails, email_sources
+    
+    def feeder(self, content_type: Optional[str] = None, deadline: Optional[Deadline] = None,
+               on_email: Optional[Callable[[str, str], None]] = None) -> EmailFeeder:
+        """
+        Start extracting from a body that arrives in chunks.
+        
+        Call feed() with each chunk as it is received and close() at the
+        end; both return the emails found for the first time, and on_email
+        is called with each as soon as it is matched.
+        
+        Args:
+            content_type: Content-Type response header (optional)
+            deadline: Job deadline that also bounds the scan (optional)
+            on_email: Callback receiving (email, source) (optional)
+            
+        Returns:
+            Feeder for one body
+        """
+        return EmailFeeder(self, content_type, deadline, on_email)
+    
+    def extract_all_emails(self, content: str, soup=None, domain: str = None,
+                           mailto_links: Optional[Iterable[str]] = None,
+                           deadline: Optional[Deadline] = None) -> Tuple[Set[str], Set[str], Dict[str, str]]:
+        """
+        Extract all emails from content and links with source tracking.
+        
+        Args:
+            content: Text content
+            soup: BeautifulSoup object (optional)
+            domain: Domain for generating common emails (optional)
+            mailto_links: Raw mailto hrefs already collected by the crawler (optional)
+            deadline: Job deadline that also bounds the content scan (optional)
+            
+        Returns:
+            Tuple of (found_emails, generated_emails, email_sources)
+        """
+        found_emails, email_sources = self.extract_page_emails(content, soup, mailto_links, deadline)
+        generated_emails = set()
         
-        # Generate common emails if domain provided
+        # Generate common emails if domain provided (cached per domain)
         if domain:
             generated_emails_list = self.generate_common_emails(domain)
             generated_emails.update(generated_emails_list)
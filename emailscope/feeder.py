@@ -0,0 +1,282 @@
+"""
+Incremental extraction module for EmailScope.
+Finds emails in an HTML body while it is still being downloaded.
+"""
+
+import codecs
+import re
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+
+from .budget import Deadline
+from .charset import BOMS, META_PRESCAN_BYTES, declared_encoding
+
+if TYPE_CHECKING:
+    from .extractor import EmailExtractor
+
+# Visible text kept from one chunk to the next, so an address split across
+# chunks is matched whole. Longer than any address with the surrounding
+# ' at ' / ' dot ' spelling and a context keyword.
+DEFAULT_OVERLAP = 512
+
+# Markup held back while waiting for a tag, script, style or comment to
+# close; beyond this it is processed as it is
+DEFAULT_MAX_CARRY = 1024 * 1024
+
+# Elements and comments whose content is not visible text
+_BLOCK_START = re.compile(r'<(script|style)\b|<!--', re.I)
+_BLOCK_END = {
+    'script': re.compile(r'</script\s*>', re.I),
+    'style': re.compile(r'</style\s*>', re.I),
+    None: re.compile(r'-->'),
+}
+
+# Longest character reference ('&CounterClockwiseContourIntegral;' is 33)
+_MAX_ENTITY = 40
+
+class EmailFeeder:
+    """
+    Incremental email extraction from a streamed HTML body.
+
+    Chunks are decoded with an incremental decoder once the encoding is
+    known (from the BOM, Content-Type, or a <meta> charset in the first
+    1024 bytes). Markup is processed up to the last complete tag, script,
+    style or comment, with the same patterns ByteScanner uses on whole
+    bodies. Visible text is scanned up to its last whitespace, and the
+    last `overlap` characters are scanned again with the next chunk, so
+    addresses split across chunks are found whole. Memory is bounded by
+    the chunk size, the overlap and any markup still open, not by the page.
+
+    Results can differ from a whole-page scan only where a context keyword
+    and its address are further apart than the overlap. Undeclared bodies
+    that are not UTF-8 switch to windows-1252 where the first invalid byte
+    is seen, since statistical detection needs the whole body.
+    """
+
+    def __init__(self, extractor: 'EmailExtractor', content_type: Optional[str] = None,
+                 deadline: Optional[Deadline] = None, on_email: Optional[Callable[[str, str], None]] = None,
+                 overlap: int = DEFAULT_OVERLAP, max_carry: int = DEFAULT_MAX_CARRY):
+        """
+        Initialize the feeder.
+
+        Args:
+            extractor: Extractor whose scanner, validation and counters are used
+            content_type: Content-Type response header, if already known
+            deadline: Optional job deadline; with the extractor's per-page
+                time limit it bounds the scanning of the whole body
+            on_email: Optional callback receiving (email, source) as soon as
+                an email is matched
+            overlap: Characters of visible text scanned again with the next chunk
+            max_carry: Most markup held back waiting for a tag to close
+        """
+        self.extractor = extractor
+        self.content_type = content_type
+        self.deadline = extractor._page_deadline(deadline)
+        self.on_email = on_email
+        self.overlap = overlap
+        self.max_carry = max_carry
+
+        # Every email found so far, with its source ('found' or 'mailto_link')
+        self.sources: Dict[str, str] = {}
+        self.chars = 0
+        self.cut_off = False
+        self.closed = False
+
+        # Stream state; see restart()
+        self._head = b''
+        self._decoder = None
+        self._strict_utf8 = False
+        self._markup = ''
+        self._text = ''
+        # Length of the kept text that was already scanned
+        self._scanned = 0
+
+    def feed(self, chunk: bytes, content_type: Optional[str] = None) -> Dict[str, str]:
+        """
+        Process the next chunk of the body.
+
+        Args:
+            chunk: Raw bytes as received
+            content_type: Content-Type response header (used if not given before)
+
+        Returns:
+            Emails found for the first time, with their sources
+        """
+        if self.content_type is None:
+            self.content_type = content_type
+        if self._decoder is None:
+            # The encoding may be declared anywhere in the first 1024 bytes
+            self._head += chunk
+            if len(self._head) < META_PRESCAN_BYTES:
+                return {}
+            chunk, self._head = self._head, b''
+            chunk = self._start_decoding(chunk)
+        return self._process(self._decode(chunk, final=False), final=False)
+
+    def close(self) -> Dict[str, str]:
+        """
+        Process whatever is left once the body is complete.
+
+        Returns:
+            Emails found for the first time, with their sources
+        """
+        if self.closed:
+            return {}
+        if self._decoder is None:
+            self._head = self._start_decoding(self._head)
+        new_emails = self._process(self._decode(self._head, final=True), final=True)
+        self._head = b''
+        self.closed = True
+        self.extractor._record_page(self.chars, self.cut_off)
+        if self.cut_off:
+            self.extractor.logger.warning(f"Extraction cut off after {self.deadline.elapsed():.2f}s on a streamed "
+                                          f"page; keeping {len(self.sources)} emails found so far")
+        return new_emails
+
+    def restart(self):
+        """
+        Start over with a new copy of the body (e.g. after a failed download
+        was retried). Emails already found are kept and not reported again.
+        """
+        self.closed = False
+        self._head = b''
+        self._decoder = None
+        self._strict_utf8 = False
+        self._markup = ''
+        self._text = ''
+        self._scanned = 0
+
+    @property
+    def emails(self):
+        """Every email found so far."""
+        return set(self.sources)
+
+    def _start_decoding(self, head: bytes) -> bytes:
+        """Pick the decoder from the start of the body; returns the body without its BOM."""
+        encoding, source = declared_encoding(head, self.content_type)
+        if source == 'bom':
+            for bom, _ in BOMS:
+                if head.startswith(bom):
+                    head = head[len(bom):]
+                    break
+        self._strict_utf8 = encoding is None
+        self._decoder = codecs.getincrementaldecoder(encoding or 'utf-8')('strict' if encoding is None else 'replace')
+        return head
+
+    def _decode(self, data: bytes, final: bool) -> str:
+        try:
+            return self._decoder.decode(data, final)
+        except UnicodeDecodeError:
+            if not self._strict_utf8:
+                raise
+            # Undeclared and not UTF-8: continue as windows-1252, like CharsetDecoder's last resort
+            self._strict_utf8 = False
+            self._decoder = codecs.getincrementaldecoder('cp1252')('replace')
+            return self._decoder.decode(data, final)
+
+    def _process(self, markup: str, final: bool) -> Dict[str, str]:
+        """Scan the complete part of the markup received so far."""
+        markup = self._markup + markup
+        cut = len(markup) if final else self._markup_cut(markup)
+        segment, self._markup = markup[:cut], markup[cut:]
+
+        new_emails: Dict[str, str] = {}
+        text = self._text
+        if segment:
+            scanned = self.extractor.byte_scanner.scan_markup(segment)
+            text += scanned.text
+            for emails, source in ((scanned.protected_text, "found"), (scanned.protected_links, "mailto_link")):
+                for email in emails:
+                    clean_email = email.strip().lower()
+                    if self.extractor._is_valid_email(clean_email):
+                        self._add(clean_email, source, new_emails)
+            for email in self.extractor.extract_emails_from_mailto_hrefs(scanned.mailto_links):
+                self._add(email, "mailto_link", new_emails)
+
+        # Scan up to the last whitespace, so no word is cut in two
+        end = len(text) if final else self._text_cut(text)
+        if not end and len(text) > self.max_carry:
+            end = len(text)
+        if end > self._scanned and not self.cut_off:
+            # Candidates within the part scanned before were found then, with more context
+            for email in self.extractor._scan_content(text[:end], self.deadline, self._scanned):
+                self._add(email, "found", new_emails)
+            self.cut_off = self.deadline is not None and self.deadline.expired()
+
+        if final:
+            self.chars += len(text)
+            self._text = ''
+        else:
+            start = self._overlap_start(text, end)
+            self.chars += start
+            self._text = text[start:]
+            self._scanned = max(end, self._scanned) - start
+        return new_emails
+
+    def _add(self, email: str, source: str, new_emails: Dict[str, str]):
+        """Record a valid email, reporting it if it is new."""
+        if email in self.sources:
+            # A mailto link outranks the same address found in the text
+            if source == "mailto_link":
+                self.sources[email] = source
+            return
+        self.sources[email] = source
+        new_emails[email] = source
+        if self.on_email is not None:
+            self.on_email(email, source)
+
+    def _markup_cut(self, markup: str) -> int:
+        """Return the length of markup that does not end inside a tag, element or entity."""
+        cut = len(markup)
+
+        # A tag still being received
+        tag_start = markup.rfind('<')
+        if tag_start >= 0 and markup.find('>', tag_start) < 0:
+            cut = tag_start
+
+        # A script, style or comment still being received
+        position = 0
+        while True:
+            block = _BLOCK_START.search(markup, position, cut)
+            if not block:
+                break
+            end = _BLOCK_END[block.group(1) and block.group(1).lower()].search(markup, block.end(), cut)
+            if not end:
+                cut = block.start()
+                break
+            position = end.end()
+
+        # A character reference still being received
+        entity_start = markup.rfind('&', max(0, cut - _MAX_ENTITY), cut)
+        if entity_start >= 0 and markup.find(';', entity_start, cut) < 0:
+            cut = entity_start
+
+        if len(markup) - cut > self.max_carry:
+            return len(markup)
+        return cut
+
+    @staticmethod
+    def _text_cut(text: str) -> int:
+        """Return the position of the last whitespace character (0 if none)."""
+        for position in range(len(text) - 1, -1, -1):
+            if text[position].isspace():
+                return position
+        return 0
+
+    def _overlap_start(self, text: str, end: int) -> int:
+        """
+        Return where the text kept for the next scan starts.
+
+        Preferably right after the last '@' before the overlap: the scanner
+        looks for a context keyword between consecutive '@'s, so the next
+        scan then sees the keywords a whole-page scan would. Otherwise at a
+        word boundary, so no address loses its start.
+        """
+        if end - self.overlap <= 0:
+            return 0
+        at = text.rfind('@', max(0, end - 2 * self.overlap), end - self.overlap)
+        if at >= 0:
+            return at + 1
+        for position in range(end - self.overlap, end):
+            if text[position].isspace():
+                return position + 1
+        return end
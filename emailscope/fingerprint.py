@@ -0,0 +1,216 @@
+"""
+Content fingerprinting module for EmailScope.
+Exact hashes and simhashes that spot duplicate and near-duplicate pages.
+"""
+
+import hashlib
+import re
+import threading
+import time
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+# Words, lowercased; punctuation and whitespace differences are ignored
+_TOKEN_PATTERN = re.compile(r'\w+')
+
+SIMHASH_BITS = 64
+_SIMHASH_MASK = (1 << SIMHASH_BITS) - 1
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+def content_hash(tokens: List[str]) -> str:
+    """Return a hash that is equal for pages with the same words."""
+    return hashlib.blake2b(' '.join(tokens).encode('utf-8'), digest_size=16).hexdigest()
+
+def simhash(tokens: List[str], shingle_size: int = 3) -> int:
+    """
+    Compute a 64-bit simhash over word shingles.
+
+    Similar texts get hashes that differ in few bits. Each distinct shingle
+    votes once per bit; a bit is set when most shingles have it set. Votes are
+    summed with a bit-sliced counter (one integer per binary digit of the
+    per-bit counts), so the cost is a few integer operations per shingle
+    rather than one per bit.
+
+    Args:
+        tokens: Word tokens of the text
+        shingle_size: Words per shingle
+
+    Returns:
+        Simhash as an int
+    """
+    if len(tokens) < shingle_size:
+        shingles = {tuple(tokens)}
+    else:
+        shingles = set(zip(*(tokens[i:] for i in range(shingle_size))))
+    # hash() is salted per process, which is fine for fingerprints that are
+    # only compared within one crawl
+    features = [hash(shingle) & _SIMHASH_MASK for shingle in shingles]
+
+    planes: List[int] = []
+    for feature in features:
+        carry = feature
+        for index, plane in enumerate(planes):
+            planes[index] = plane ^ carry
+            carry &= plane
+            if not carry:
+                break
+        if carry:
+            planes.append(carry)
+
+    threshold = len(features) / 2
+    result = 0
+    for bit in range(SIMHASH_BITS):
+        count = 0
+        for weight, plane in enumerate(planes):
+            count |= ((plane >> bit) & 1) << weight
+        if count > threshold:
+            result |= 1 << bit
+    return result
+
+def hamming_distance(a: int, b: int) -> int:
+    """Return the number of differing bits."""
+    return bin(a ^ b).count('1')
+
+def _line_hashes(text: str) -> FrozenSet[int]:
+    return frozenset(hash(line.strip()) for line in text.splitlines() if line.strip())
+
+class ContentDeduplicator:
+    """
+    Thread-safe duplicate detector for the pages of one crawl.
+
+    Pages with the same words are exact duplicates; pages whose simhashes
+    differ in at most `max_distance` bits are near-duplicates. Each duplicate
+    is matched to the first page it resembles, whose lines are kept so only
+    the lines the duplicate adds need to be scanned for emails.
+    """
+
+    def __init__(self, max_distance: int = 6, min_tokens: int = 30):
+        """
+        Initialize the detector.
+
+        Args:
+            max_distance: Largest simhash distance treated as a near-duplicate
+            min_tokens: Pages with fewer words are only matched exactly
+        """
+        self.max_distance = max_distance
+        self.min_tokens = min_tokens
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Forget all pages and counters."""
+        with self._lock:
+            self._by_hash: Dict[str, str] = {}
+            self._simhashes: List[Tuple[int, str]] = []
+            self._lines: Dict[str, FrozenSet[int]] = {}
+            self._stats = {
+                'pages': 0,
+                'exact_duplicates': 0,
+                'near_duplicates': 0,
+                'fingerprint_seconds': 0.0,
+                'chars_skipped': 0,
+                'chars_extracted': 0,
+                'extract_seconds': 0.0,
+            }
+
+    def add(self, url: str, text: str) -> Optional[str]:
+        """
+        Fingerprint a page and match it against the pages seen before.
+
+        Args:
+            url: Page URL
+            text: Visible page text
+
+        Returns:
+            URL of the page this one duplicates, or None if it is new
+        """
+        started = time.thread_time()
+        tokens = tokenize(text)
+        exact = content_hash(tokens)
+        fingerprint = simhash(tokens) if len(tokens) >= self.min_tokens else None
+
+        with self._lock:
+            original = self._by_hash.get(exact)
+            kind = 'exact_duplicates'
+            if original is None and fingerprint is not None:
+                kind = 'near_duplicates'
+                original = next((seen_url for seen_hash, seen_url in self._simhashes
+                                 if hamming_distance(fingerprint, seen_hash) <= self.max_distance), None)
+            if original == url:
+                # The same page parsed again (e.g., refetched after cache eviction)
+                return None
+            if original is None:
+                self._by_hash[exact] = url
+                if fingerprint is not None:
+                    self._simhashes.append((fingerprint, url))
+
+        # Line sets are only needed for originals; build them outside the lock
+        if original is None:
+            lines = _line_hashes(text)
+            with self._lock:
+                self._lines[url] = lines
+
+        with self._lock:
+            self._stats['pages'] += 1
+            if original is not None:
+                self._stats[kind] += 1
+            self._stats['fingerprint_seconds'] += time.thread_time() - started
+        return original
+
+    def novel_text(self, original: str, text: str) -> str:
+        """
+        Return the lines of a duplicate page that its original does not have.
+
+        Args:
+            original: URL returned by add() for the page
+            text: Visible text of the duplicate page
+
+        Returns:
+            Text left to scan ('' for an exact copy)
+        """
+        with self._lock:
+            seen = self._lines.get(original)
+        if seen is None:
+            return text
+        novel = '\n'.join(line for line in text.splitlines()
+                          if line.strip() and hash(line.strip()) not in seen)
+        self.record_skip(len(text) - len(novel))
+        return novel
+
+    def record_skip(self, chars: int):
+        """Count characters that did not have to be scanned."""
+        with self._lock:
+            self._stats['chars_skipped'] += chars
+
+    def record_extraction(self, chars: int, seconds: float):
+        """
+        Count an extraction that did run.
+
+        Args:
+            chars: Characters scanned
+            seconds: CPU seconds the extraction took
+        """
+        with self._lock:
+            self._stats['chars_extracted'] += chars
+            self._stats['extract_seconds'] += seconds
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get duplicate counters and the estimated extraction time saved.
+
+        The saving is the measured extraction cost per character applied to
+        the characters skipped, minus the time spent fingerprinting.
+
+        Returns:
+            Dict with pages fingerprinted, exact and near duplicates,
+            characters skipped and CPU seconds spent and saved
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        per_char = stats['extract_seconds'] / stats['chars_extracted'] if stats['chars_extracted'] else 0.0
+        stats['seconds_saved'] = round(stats['chars_skipped'] * per_char - stats['fingerprint_seconds'], 3)
+        stats['fingerprint_seconds'] = round(stats['fingerprint_seconds'], 3)
+        stats['extract_seconds'] = round(stats['extract_seconds'], 3)
+        return stats
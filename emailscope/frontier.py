@@ -0,0 +1,206 @@
+"""
+Crawl frontier module for EmailScope.
+Best-first URL scheduling, resumable checkpoints and early termination conditions.
+"""
+
+import heapq
+import itertools
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .page_cache import CrawledPage
+
+class CrawlFrontier:
+    """Heap-based best-first frontier; higher scores are crawled first."""
+
+    def __init__(self, score_fn: Callable[[str], float]):
+        """
+        Initialize the frontier.
+
+        Args:
+            score_fn: Function returning the relevance score of a URL
+        """
+        self.score_fn = score_fn
+        self._heap: List[Tuple[float, int, str, int]] = []
+        self._counter = itertools.count()
+        self.seen: Set[str] = set()
+
+    def push(self, url: str, depth: int, score: Optional[float] = None) -> bool:
+        """
+        Add a URL unless it was seen before.
+
+        Args:
+            url: URL to schedule
+            depth: Link depth from the homepage
+            score: Precomputed score (defaults to score_fn(url))
+
+        Returns:
+            True if the URL was added
+        """
+        if url in self.seen:
+            return False
+        self.seen.add(url)
+        self._push(url, depth, score)
+        return True
+    
+    def _push(self, url: str, depth: int, score: Optional[float] = None):
+        if score is None:
+            score = self.score_fn(url)
+        # Counter keeps insertion order for equal scores
+        heapq.heappush(self._heap, (-score, next(self._counter), url, depth))
+
+    def push_many(self, urls: Iterable[str], depth: int) -> int:
+        """Add several URLs at the same depth and return how many were new."""
+        return sum(1 for url in urls if self.push(url, depth))
+
+    def pop(self) -> Tuple[str, int]:
+        """
+        Remove and return the best URL.
+
+        Returns:
+            Tuple of (url, depth)
+        """
+        _, _, url, depth = heapq.heappop(self._heap)
+        return url, depth
+
+    def pending(self) -> List[Tuple[str, int]]:
+        """Return the queued (url, depth) pairs, best first, without removing them."""
+        return [(url, depth) for _, _, url, depth in sorted(self._heap)]
+
+    def restore(self, pending: Iterable[Tuple[str, int]], seen: Iterable[str] = ()):
+        """
+        Reload a frontier saved with pending().
+
+        Args:
+            pending: Queued (url, depth) pairs
+            seen: URLs already scheduled once, which are not queued again
+        """
+        self.seen.update(seen)
+        for url, depth in pending:
+            self.seen.add(url)
+            self._push(url, depth)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
+
+class CrawlCheckpoint:
+    """
+    Saved progress of a crawl, so a later job can continue it.
+
+    Pending URLs keep their link depth, which is all either crawl strategy
+    needs to rebuild its queue. A checkpoint with `urls` set belongs to a
+    finished crawl and records its result.
+    """
+
+    def __init__(self, start_url: str, pending: Iterable[Tuple[str, int]] = (),
+                 discovered: Iterable[str] = (), crawled: Iterable[str] = (),
+                 failed: Iterable[str] = (), urls: Optional[List[str]] = None):
+        """
+        Initialize a checkpoint.
+
+        Args:
+            start_url: Canonical start URL the crawl resolved to
+            pending: Queued (url, depth) pairs, in crawl order
+            discovered: URLs already scheduled once
+            crawled: URLs fetched and parsed
+            failed: URLs that could not be fetched
+            urls: Result of the finished crawl (None while it is in progress)
+        """
+        self.start_url = start_url
+        self.pending = [(url, int(depth)) for url, depth in pending]
+        self.discovered = set(discovered)
+        self.crawled = set(crawled)
+        self.failed = set(failed)
+        self.urls = list(urls) if urls is not None else None
+
+    @property
+    def complete(self) -> bool:
+        """True if the crawl finished and only its result is kept."""
+        return self.urls is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable copy of the checkpoint."""
+        return {
+            'start_url': self.start_url,
+            'pending': [[url, depth] for url, depth in self.pending],
+            'discovered': sorted(self.discovered),
+            'crawled': sorted(self.crawled),
+            'failed': sorted(self.failed),
+            'urls': self.urls,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CrawlCheckpoint':
+        """Rebuild a checkpoint saved with to_dict()."""
+        return cls(
+            data['start_url'],
+            pending=data.get('pending', ()),
+            discovered=data.get('discovered', ()),
+            crawled=data.get('crawled', ()),
+            failed=data.get('failed', ()),
+            urls=data.get('urls')
+        )
+
+class ContactPageStopCondition:
+    """
+    Stop a crawl once key pages were fetched and enough emails were seen.
+
+    The default condition is met when a contact, about or team page has been
+    fetched and at least `min_emails` distinct emails have appeared.
+    """
+
+    _email_pattern = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}')
+
+    def __init__(self, min_emails: int = 3, page_keywords: Iterable[str] = ('contact', 'about', 'team'),
+                 require_all_pages: bool = False,
+                 email_finder: Optional[Callable[[str], Iterable[str]]] = None):
+        """
+        Initialize the stop condition.
+
+        Args:
+            min_emails: Distinct emails that must be seen before stopping
+            page_keywords: URL keywords identifying key pages
+            require_all_pages: Require a page for every keyword instead of any one
+            email_finder: Function returning emails in page text (defaults to a simple regex)
+        """
+        self.min_emails = min_emails
+        self.page_keywords = [keyword.lower() for keyword in page_keywords]
+        self.require_all_pages = require_all_pages
+        self.email_finder = email_finder
+        self.reset()
+
+    def reset(self):
+        """Forget everything seen so far."""
+        self.pages_seen: Set[str] = set()
+        self.emails_seen: Set[str] = set()
+        # email_finder results per page URL, for reuse after the crawl
+        self.page_emails: Dict[str, Set[str]] = {}
+
+    def update(self, page: CrawledPage):
+        """Record a fetched page."""
+        url_lower = page.url.lower()
+        for keyword in self.page_keywords:
+            if keyword in url_lower:
+                self.pages_seen.add(keyword)
+
+        if self.email_finder:
+            emails = self.page_emails[page.url] = set(self.email_finder(page.text))
+        else:
+            emails = self._email_pattern.findall(page.text)
+        self.emails_seen.update(email.lower() for email in emails)
+
+        for href in page.mailto_links:
+            email = href[7:].split('?')[0].strip().lower()
+            if email:
+                self.emails_seen.add(email)
+
+    def should_stop(self) -> bool:
+        """Check whether the crawl can end early."""
+        if len(self.emails_seen) < self.min_emails:
+            return False
+        if self.require_all_pages:
+            return all(keyword in self.pages_seen for keyword in self.page_keywords)
+        return bool(self.pages_seen)
@@ -0,0 +1,229 @@
+"""
+HTTP cache module for EmailScope.
+Persistent page cache with ETag/Last-Modified revalidation for re-scrapes.
+"""
+
+import sqlite3
+import threading
+import time
+import logging
+from typing import Dict, Optional
+
+class CachedResponse:
+    """Cached page body and the validators needed to revalidate it."""
+
+    __slots__ = ('url', 'body', 'content_type', 'etag', 'last_modified')
+
+    def __init__(self, url: str, body: bytes, content_type: str,
+                 etag: Optional[str], last_modified: Optional[str]):
+        """
+        Initialize a cached response.
+
+        Args:
+            url: Canonical URL the response was stored under
+            body: Response body
+            content_type: Content-Type header
+            etag: ETag header, if any
+            last_modified: Last-Modified header, if any
+        """
+        self.url = url
+        self.body = body
+        self.content_type = content_type
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Return the request headers that revalidate this response."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+class HTTPCache:
+    """
+    On-disk HTTP cache keyed by canonical URL.
+
+    Only responses carrying an ETag or Last-Modified header are stored, since
+    the cache exists to revalidate them on the next crawl. When the total
+    body size exceeds `max_bytes`, the least recently used entries are
+    evicted.
+
+    The total is kept as a running count instead of being summed on every
+    store. It is recomputed from the table before anything is evicted, so
+    writes by other processes sharing the file are accounted for then.
+    """
+
+    def __init__(self, db_path: str = "http_cache.db", max_bytes: int = 100 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: Path to the SQLite cache file
+            max_bytes: Maximum total size of cached bodies
+        """
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._stats: Dict[str, int] = {}
+        self.reset_stats()
+        self._init_database()
+
+        # Running total of cached body sizes, updated on store and eviction
+        with sqlite3.connect(self.db_path) as conn:
+            self._total_bytes = self._sum_sizes(conn)
+
+    def _init_database(self):
+        """Initialize the cache table."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    url TEXT PRIMARY KEY,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    content_type TEXT,
+                    etag TEXT,
+                    last_modified TEXT,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_http_cache_accessed ON http_cache(accessed_at)')
+            conn.commit()
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """
+        Look up a cached response and count a hit or miss.
+
+        Args:
+            url: Canonical URL
+
+        Returns:
+            Cached response, or None if the URL is not cached
+        """
+        with self._lock, sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                'SELECT body, content_type, etag, last_modified FROM http_cache WHERE url = ?',
+                (url,)
+            ).fetchone()
+            self._stats['hits' if row else 'misses'] += 1
+        if not row:
+            return None
+        body, content_type, etag, last_modified = row
+        return CachedResponse(url, bytes(body), content_type or '', etag, last_modified)
+
+    def put(self, url: str, body: bytes, content_type: str,
+            etag: Optional[str], last_modified: Optional[str]) -> bool:
+        """
+        Store a response if it can be revalidated later.
+
+        Args:
+            url: Canonical URL
+            body: Complete response body
+            content_type: Content-Type header
+            etag: ETag header, if any
+            last_modified: Last-Modified header, if any
+
+        Returns:
+            True if the response was stored
+        """
+        if not (etag or last_modified) or len(body) > self.max_bytes:
+            return False
+
+        now = time.time()
+        with self._lock, sqlite3.connect(self.db_path) as conn:
+            replaced = conn.execute('SELECT size FROM http_cache WHERE url = ?', (url,)).fetchone()
+            conn.execute('''
+                INSERT OR REPLACE INTO http_cache
+                    (url, body, size, content_type, etag, last_modified, stored_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (url, sqlite3.Binary(body), len(body), content_type, etag, last_modified, now, now))
+            self._stats['stores'] += 1
+            self._total_bytes += len(body) - (replaced[0] if replaced else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict(conn)
+            conn.commit()
+        return True
+
+    def record_revalidation(self, url: str, not_modified: bool):
+        """
+        Record the outcome of a conditional request.
+
+        Args:
+            url: Canonical URL
+            not_modified: True if the server answered 304
+        """
+        with self._lock:
+            self._stats['revalidations'] += 1
+            if not not_modified:
+                self._stats['changed'] += 1
+                return
+            self._stats['not_modified'] += 1
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute('UPDATE http_cache SET accessed_at = ? WHERE url = ?', (time.time(), url))
+                conn.commit()
+
+    @staticmethod
+    def _sum_sizes(conn: sqlite3.Connection) -> int:
+        """Sum the sizes of all cached bodies."""
+        return conn.execute('SELECT COALESCE(SUM(size), 0) FROM http_cache').fetchone()[0]
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop least recently used entries until the cache fits in max_bytes."""
+        # Resynchronize the running total before deleting anything
+        total = self._total_bytes = self._sum_sizes(conn)
+        if total <= self.max_bytes:
+            return
+
+        rows = conn.execute('SELECT url, size FROM http_cache ORDER BY accessed_at').fetchall()
+        evicted = []
+        for url, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((url,))
+            total -= size
+        conn.executemany('DELETE FROM http_cache WHERE url = ?', evicted)
+        self._total_bytes = total
+        self._stats['evictions'] += len(evicted)
+        self.logger.debug(f"Evicted {len(evicted)} cached pages")
+
+    def clear(self):
+        """Remove all cached responses."""
+        with self._lock, sqlite3.connect(self.db_path) as conn:
+            conn.execute('DELETE FROM http_cache')
+            conn.commit()
+            self._total_bytes = 0
+
+    def size(self) -> int:
+        """Return the total size of cached bodies in bytes."""
+        with sqlite3.connect(self.db_path) as conn:
+            return self._sum_sizes(conn)
+
+    def __len__(self) -> int:
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute('SELECT COUNT(*) FROM http_cache').fetchone()[0]
+
+    def reset_stats(self):
+        """Reset cache counters."""
+        with self._lock:
+            self._stats = {
+                'hits': 0,
+                'misses': 0,
+                'revalidations': 0,
+                'not_modified': 0,
+                'changed': 0,
+                'stores': 0,
+                'evictions': 0,
+            }
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with lookup hits/misses, revalidation outcomes, stores and evictions
+        """
+        with self._lock:
+            return dict(self._stats)
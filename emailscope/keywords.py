@@ -0,0 +1,96 @@
+"""
+Keyword matching module for EmailScope.
+Finds every keyword of a fixed set that occurs in a string, for link
+scoring and industry detection.
+"""
+
+import re
+from typing import Iterable, Optional, Set
+
+# Below this many keywords, one C-level substring test per keyword beats the
+# regex's per-position overhead. Measured with benchmarks/bench_keywords.py
+# --sweep on 100k link-scoring URLs (~55 characters): 20 keywords (the
+# crawler's priority list) 0.35s per keyword vs 0.48s single pass, 30
+# keywords 0.49s vs 0.53s, 40 about even at 0.60s, 80 keywords 1.2s vs
+# 0.64s. So link scoring stays on the per-keyword path; industry detection
+# (38 keywords on short domains) takes the single pass, 1.4x faster.
+REGEX_MIN_KEYWORDS = 32
+
+def literal_alternation(words: Iterable[str]) -> str:
+    """
+    Build a regex alternation of literals factored by first character.
+
+    Factoring lets the engine pick one branch per position instead of trying
+    every literal in turn. Within a branch, longer literals come first.
+    """
+    groups = {}
+    for word in sorted(set(words), key=len, reverse=True):
+        groups.setdefault(word[0], []).append(re.escape(word[1:]))
+    return '|'.join(
+        f"{re.escape(first)}(?:{'|'.join(rests)})" for first, rests in groups.items()
+    )
+
+class KeywordMatcher:
+    """
+    Multi-keyword substring matcher built once per keyword set.
+
+    hits() returns exactly the keywords for which `keyword in text` holds.
+    Large sets are matched in a single pass with a compiled alternation
+    inside a lookahead, tried at every position so overlapping occurrences
+    are all seen; the longest keyword matching at a position stands for
+    every keyword that is a prefix of it. Small sets are tested one keyword
+    at a time, which is cheaper there.
+
+    Matching is case-sensitive; callers lowercase the text (and the
+    keywords) as they need.
+    """
+
+    def __init__(self, keywords: Iterable[str], single_pass: Optional[bool] = None):
+        """
+        Initialize the matcher.
+
+        Args:
+            keywords: Substrings to look for (empty strings are ignored)
+            single_pass: Force (True) or rule out (False) the compiled
+                single-pass match; by default it is used from
+                REGEX_MIN_KEYWORDS keywords on
+        """
+        self.keywords = tuple(dict.fromkeys(keyword for keyword in keywords if keyword))
+        if single_pass is None:
+            single_pass = len(self.keywords) >= REGEX_MIN_KEYWORDS
+        self._pattern = None
+        if single_pass and self.keywords:
+            self._pattern = re.compile(f'(?=({literal_alternation(self.keywords)}))')
+            # Keywords that also match wherever each keyword matches
+            self._prefixes = {
+                keyword: frozenset(other for other in self.keywords if keyword.startswith(other))
+                for keyword in self.keywords
+            }
+
+    @property
+    def single_pass(self) -> bool:
+        """True if keywords are matched in one pass of the compiled pattern."""
+        return self._pattern is not None
+
+    def hits(self, text: str) -> Set[str]:
+        """
+        Find every keyword that occurs in the text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Set of keywords found
+        """
+        if self._pattern is None:
+            return {keyword for keyword in self.keywords if keyword in text}
+        found = set()
+        for keyword in self._pattern.findall(text):
+            found |= self._prefixes[keyword]
+        return found
+
+    def count(self, text: str) -> int:
+        """Count the distinct keywords that occur in the text."""
+        if self._pattern is None:
+            return sum([keyword in text for keyword in self.keywords])
+        return len(self.hits(text))
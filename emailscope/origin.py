@@ -0,0 +1,183 @@
+"""
+Origin resolution module for EmailScope.
+Races scheme and www variants of a bare domain and caches the winner.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+# Head start each candidate gives the next one, in preference order
+DEFAULT_STAGGER = 0.25
+
+def origin_candidates(domain: str) -> List[str]:
+    """
+    List the origins a bare domain may be served from, most preferred first.
+
+    Args:
+        domain: Bare domain (e.g., 'example.com' or 'www.example.com')
+
+    Returns:
+        Candidate origin URLs
+    """
+    host = domain.strip().strip('/').lower()
+    apex = host[4:] if host.startswith('www.') else host
+    hosts = [host, apex if host != apex else f"www.{apex}"]
+    return [f"{scheme}://{name}/" for scheme in ('https', 'http') for name in hosts]
+
+class OriginResolver:
+    """
+    Happy-eyeballs style origin resolution.
+
+    Candidates are requested concurrently, each starting a short stagger
+    after the previous one so the preferred origin wins ties. The first
+    candidate to answer successfully (after redirects) decides the origin,
+    so resolution costs about one round trip instead of one timeout per
+    wrong guess. Results are cached in memory and, optionally, in a
+    persistent store with get_origin/set_origin methods.
+    """
+
+    def __init__(self, fetch: Callable[[str, float], requests.Response], timeout: float = 10,
+                 stagger: float = DEFAULT_STAGGER, store=None):
+        """
+        Initialize the resolver.
+
+        Args:
+            fetch: Function returning a streamed response for a URL (any
+                status), given the request timeout in seconds
+            timeout: Seconds to wait for any candidate to answer
+            stagger: Delay between starting consecutive candidates
+            store: Optional persistent cache with get_origin(domain) and
+                set_origin(domain, origin) (e.g., EmailScopeDB)
+        """
+        self.fetch = fetch
+        self.timeout = timeout
+        self.stagger = stagger
+        self.store = store
+        self.logger = logging.getLogger(__name__)
+        self._origins: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def cached(self, domain: str) -> Optional[str]:
+        """Return the cached origin for a domain, if any."""
+        domain = domain.lower()
+        with self._lock:
+            origin = self._origins.get(domain)
+        if origin is None and self.store is not None:
+            origin = self.store.get_origin(domain)
+            if origin:
+                with self._lock:
+                    self._origins[domain] = origin
+        return origin
+
+    def forget(self, domain: str):
+        """Drop a cached origin, e.g. after it stopped answering."""
+        domain = domain.lower()
+        with self._lock:
+            self._origins.pop(domain, None)
+        if self.store is not None:
+            self.store.set_origin(domain, None)
+
+    def resolve(self, domain: str, use_cache: bool = True, timeout: Optional[float] = None,
+                fetch: Optional[Callable[[str, float], requests.Response]] = None) -> Optional[str]:
+        """
+        Find the origin a bare domain is served from.
+
+        Probes run on their own threads; every request is given only the
+        time left of `timeout`, so resolution never outlasts it.
+
+        Args:
+            domain: Bare domain (e.g., 'example.com')
+            use_cache: Return a cached origin without any request
+            timeout: Seconds to wait for any candidate (defaults to the resolver's)
+            fetch: Request function for this resolution's probes (defaults
+                to the resolver's), e.g. one bound to a crawl job
+
+        Returns:
+            Origin URL such as 'https://www.example.com/', or None if no
+            candidate answered
+        """
+        domain = domain.lower()
+        if use_cache:
+            origin = self.cached(domain)
+            if origin:
+                return origin
+
+        start = time.monotonic()
+        origin = self._race(origin_candidates(domain), timeout or self.timeout, fetch or self.fetch)
+        if origin is None:
+            self.logger.warning(f"No origin answered for {domain}")
+            return None
+
+        self.logger.info(f"Resolved {domain} to {origin} in {time.monotonic() - start:.2f}s")
+        with self._lock:
+            self._origins[domain] = origin
+        if self.store is not None:
+            self.store.set_origin(domain, origin)
+        return origin
+
+    def _race(self, candidates: List[str], timeout: float,
+              fetch: Callable[[str, float], requests.Response]) -> Optional[str]:
+        """Request candidates with staggered starts and return the winning origin."""
+        cancelled = threading.Event()
+        deadline = time.monotonic() + timeout
+        executor = ThreadPoolExecutor(max_workers=len(candidates))
+        futures = [
+            executor.submit(self._probe, fetch, url, index * self.stagger, deadline, cancelled)
+            for index, url in enumerate(candidates)
+        ]
+        fallback = None
+
+        try:
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=max(0.0, deadline - time.monotonic()),
+                                     return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+
+                # Among candidates finishing together, keep preference order
+                for future in sorted(done, key=futures.index):
+                    result = future.result()
+                    if result is None:
+                        continue
+                    origin, ok = result
+                    if ok:
+                        return origin
+                    # Reachable but erroring (e.g. 403): better than nothing
+                    fallback = fallback or origin
+            return fallback
+        finally:
+            # Losers finish in the background; their results are ignored
+            cancelled.set()
+            executor.shutdown(wait=False)
+
+    def _probe(self, fetch: Callable[[str, float], requests.Response], url: str, delay: float,
+               deadline: float, cancelled: threading.Event):
+        """
+        Request one candidate after its stagger delay, within the race's time.
+
+        Returns:
+            Tuple of (final origin, success flag), or None on network errors
+            or if no time is left
+        """
+        if delay and cancelled.wait(delay):
+            return None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        try:
+            response = fetch(url, remaining)
+        except requests.RequestException as e:
+            self.logger.debug(f"Origin candidate {url} failed: {e}")
+            return None
+        try:
+            parts = urlsplit(response.url)
+            return f"{parts.scheme}://{parts.netloc.lower()}/", response.status_code < 400
+        finally:
+            response.close()
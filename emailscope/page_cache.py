@@ -0,0 +1,110 @@
+"""
+In-memory page cache for EmailScope.
+Keeps recently parsed pages so the extraction stage never refetches them.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set
+
+class CrawledPage:
+    """Parsed page emitted by the crawler."""
+
+    __slots__ = ('url', 'links', 'text', 'mailto_links', 'duplicate_of')
+
+    def __init__(self, url: str, links: Set[str], text: str, mailto_links: List[str],
+                 duplicate_of: Optional[str] = None):
+        """
+        Initialize a crawled page.
+
+        Args:
+            url: URL the page was fetched from
+            links: Internal links found on the page
+            text: Visible text with script and style removed
+            mailto_links: Raw href values of mailto links
+            duplicate_of: URL of an earlier page with the same or nearly the
+                same text, if any
+        """
+        self.url = url
+        self.links = links
+        self.text = text
+        self.mailto_links = mailto_links
+        self.duplicate_of = duplicate_of
+
+    @property
+    def size(self) -> int:
+        """Approximate in-memory size of the page in characters."""
+        return len(self.text) + sum(len(link) for link in self.links) + sum(len(href) for href in self.mailto_links)
+
+class PageCache:
+    """Thread-safe LRU cache of parsed pages bounded by entry count and size."""
+
+    def __init__(self, max_entries: int = 256, max_chars: int = 16 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of pages kept
+            max_chars: Maximum total page size kept, in characters
+        """
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self._pages: "OrderedDict[str, CrawledPage]" = OrderedDict()
+        self._total_chars = 0
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, url: str) -> Optional[CrawledPage]:
+        """Return the cached page for a URL, marking it recently used."""
+        with self._lock:
+            page = self._pages.get(url)
+            if page is None:
+                self.misses += 1
+                return None
+            self._pages.move_to_end(url)
+            self.hits += 1
+            return page
+
+    def put(self, page: CrawledPage):
+        """Add a page, evicting the least recently used pages when over budget."""
+        with self._lock:
+            old = self._pages.pop(page.url, None)
+            if old is not None:
+                self._total_chars -= old.size
+
+            self._pages[page.url] = page
+            self._total_chars += page.size
+
+            while self._pages and (len(self._pages) > self.max_entries or self._total_chars > self.max_chars):
+                _, evicted = self._pages.popitem(last=False)
+                self._total_chars -= evicted.size
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all cached pages."""
+        with self._lock:
+            self._pages.clear()
+            self._total_chars = 0
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return url in self._pages
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pages)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                'entries': len(self._pages),
+                'chars': self._total_chars,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
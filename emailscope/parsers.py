@@ -0,0 +1,163 @@
+"""
+HTML parser backends for EmailScope.
+The crawler only needs <a href> values and visible text, so backends return
+just that instead of a full document tree.
+"""
+
+import logging
+from typing import List, Union
+
+from bs4 import BeautifulSoup
+
+# Optional faster backends
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxHTMLParser
+except ImportError:
+    SelectolaxHTMLParser = None
+
+logger = logging.getLogger(__name__)
+
+Markup = Union[bytes, str]
+
+class ParsedDocument:
+    """Minimal parse result: link targets and visible text."""
+
+    __slots__ = ('hrefs', 'text')
+
+    def __init__(self, hrefs: List[str], text: str):
+        """
+        Initialize a parsed document.
+
+        Args:
+            hrefs: href values of all <a> elements, in document order
+            text: Visible text with script and style removed
+        """
+        self.hrefs = hrefs
+        self.text = text
+
+class HTMLParserBackend:
+    """Interface for HTML parser backends."""
+
+    name = 'base'
+
+    def parse(self, markup: Markup) -> ParsedDocument:
+        """
+        Parse HTML into hrefs and visible text.
+
+        Args:
+            markup: HTML as bytes or text
+
+        Returns:
+            Parsed document
+        """
+        raise NotImplementedError
+
+class BeautifulSoupBackend(HTMLParserBackend):
+    """Pure-Python reference backend using BeautifulSoup's html.parser."""
+
+    name = 'html.parser'
+
+    def parse(self, markup: Markup) -> ParsedDocument:
+        soup = BeautifulSoup(markup, 'html.parser')
+        hrefs = [link['href'] for link in soup.find_all('a', href=True)]
+
+        # Remove script and style elements
+        for script in soup(["script", "style"]):
+            script.decompose()
+
+        return ParsedDocument(hrefs, soup.get_text())
+
+class LxmlBackend(HTMLParserBackend):
+    """libxml2-based backend using lxml.html directly (no BeautifulSoup tree)."""
+
+    name = 'lxml'
+
+    def parse(self, markup: Markup) -> ParsedDocument:
+        if not markup or not markup.strip():
+            return ParsedDocument([], '')
+
+        # libxml2 assumes latin-1 for bytes without a meta charset, so try UTF-8 first
+        if isinstance(markup, bytes):
+            try:
+                markup = markup.decode('utf-8')
+            except UnicodeDecodeError:
+                pass
+        try:
+            root = lxml.html.document_fromstring(markup)
+        except ValueError:
+            # Text with an XML encoding declaration must be parsed as bytes
+            try:
+                root = lxml.html.document_fromstring(markup.encode('utf-8'))
+            except (etree.ParserError, ValueError):
+                return ParsedDocument([], '')
+        except etree.ParserError:
+            return ParsedDocument([], '')
+
+        hrefs = [str(href) for href in root.xpath('//a/@href')]
+
+        # Drop script and style content but keep the text that follows them
+        etree.strip_elements(root, 'script', 'style', with_tail=False)
+
+        return ParsedDocument(hrefs, root.text_content())
+
+class SelectolaxBackend(HTMLParserBackend):
+    """Lexbor-based backend using selectolax's streaming tokenizer."""
+
+    name = 'selectolax'
+
+    def parse(self, markup: Markup) -> ParsedDocument:
+        tree = SelectolaxHTMLParser(markup)
+        hrefs = [node.attributes.get('href') for node in tree.css('a[href]')]
+        hrefs = [href for href in hrefs if href is not None]
+
+        tree.strip_tags(['script', 'style'])
+        root = tree.root
+        text = root.text(deep=True, separator='') if root is not None else ''
+
+        return ParsedDocument(hrefs, text)
+
+PARSER_BACKENDS = {
+    BeautifulSoupBackend.name: BeautifulSoupBackend,
+    LxmlBackend.name: LxmlBackend,
+    SelectolaxBackend.name: SelectolaxBackend,
+}
+
+def available_parsers() -> List[str]:
+    """Return the names of backends whose dependencies are installed."""
+    names = [BeautifulSoupBackend.name]
+    if lxml is not None:
+        names.append(LxmlBackend.name)
+    if SelectolaxHTMLParser is not None:
+        names.append(SelectolaxBackend.name)
+    return names
+
+def get_parser(name: str = 'html.parser') -> HTMLParserBackend:
+    """
+    Create a parser backend by name.
+
+    Falls back to the html.parser backend when the requested backend's
+    dependency is not installed.
+
+    Args:
+        name: 'html.parser', 'lxml' or 'selectolax'
+
+    Returns:
+        Parser backend instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if name not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend: {name} (choose from {', '.join(PARSER_BACKENDS)})")
+
+    if name not in available_parsers():
+        logger.warning(f"Parser backend '{name}' is not installed, falling back to html.parser")
+        name = BeautifulSoupBackend.name
+
+    return PARSER_BACKENDS[name]()
@@ -0,0 +1,248 @@
+"""
+Rate limiting module for EmailScope.
+Per-host token buckets shared safely by threads and asyncio tasks.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+class TokenBucket:
+    """Token bucket that hands out reservations instead of blocking."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second (0 disables limiting)
+            burst: Maximum number of tokens that can accumulate
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+    def reserve(self, now: float) -> float:
+        """
+        Take one token, going into debt if none is available.
+
+        Args:
+            now: Current monotonic time
+
+        Returns:
+            Seconds the caller must wait before using the token
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+class WaitStats:
+    """Thread-safe request and wait-time counters, per host."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests: Dict[str, int] = {}
+        self._waits: Dict[str, int] = {}
+        self._wait_time: Dict[str, float] = {}
+
+        # Totals survive forget() so dropping a host keeps the overall counts
+        self._total_requests = 0
+        self._total_waits = 0
+        self._total_wait_time = 0.0
+
+    def record(self, host: str, wait: float):
+        """
+        Count one request to a host.
+
+        Args:
+            host: Bucket key of the host
+            wait: Seconds the request had to wait
+        """
+        with self._lock:
+            self._requests[host] = self._requests.get(host, 0) + 1
+            self._total_requests += 1
+            if wait > 0:
+                self._waits[host] = self._waits.get(host, 0) + 1
+                self._wait_time[host] = self._wait_time.get(host, 0.0) + wait
+                self._total_waits += 1
+                self._total_wait_time += wait
+
+    def forget(self, host: str):
+        """
+        Drop a host from the per-host breakdown, keeping it in the totals.
+
+        Args:
+            host: Bucket key of the host
+        """
+        with self._lock:
+            self._requests.pop(host, None)
+            self._waits.pop(host, None)
+            self._wait_time.pop(host, None)
+
+    def reset(self):
+        """Reset the counters."""
+        with self._lock:
+            self._requests.clear()
+            self._waits.clear()
+            self._wait_time.clear()
+            self._total_requests = 0
+            self._total_waits = 0
+            self._total_wait_time = 0.0
+
+    def get_stats(self) -> Dict[str, object]:
+        """
+        Get wait-time statistics.
+
+        Returns:
+            Dict with totals and a per-host breakdown
+        """
+        with self._lock:
+            hosts = {
+                host: {
+                    'requests': count,
+                    'waits': self._waits.get(host, 0),
+                    'wait_seconds': round(self._wait_time.get(host, 0.0), 3),
+                }
+                for host, count in self._requests.items()
+            }
+            return {
+                'requests': self._total_requests,
+                'waits': self._total_waits,
+                'wait_seconds': round(self._total_wait_time, 3),
+                'hosts': hosts,
+            }
+
+class HostRateLimiter:
+    """
+    Per-host token-bucket rate limiter.
+
+    Reservations are taken under a lock and the wait happens outside it, so
+    threads and asyncio tasks can share one limiter and hosts never block
+    each other.
+    """
+
+    def __init__(self, rate: float = 1.0, burst: int = 1, max_hosts: int = 1024):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Default requests per second for each host (0 disables limiting)
+            burst: Default number of requests a host may receive back to back
+            max_hosts: Maximum hosts whose buckets are kept (least recently used are dropped)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_hosts = max_hosts
+        self._buckets: 'OrderedDict[str, TokenBucket]' = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Wait-time counters for every request through this limiter
+        self.stats = WaitStats()
+
+    @staticmethod
+    def _host(url_or_host: str) -> str:
+        """Normalize a URL or bare host to a bucket key."""
+        if '//' in url_or_host:
+            return urlparse(url_or_host).netloc.lower()
+        return url_or_host.lower()
+
+    def _store(self, host: str, bucket: TokenBucket):
+        """Keep a host's bucket, dropping the least recently used ones (lock held)."""
+        self._buckets[host] = bucket
+        self._buckets.move_to_end(host)
+        while len(self._buckets) > self.max_hosts:
+            evicted, _ = self._buckets.popitem(last=False)
+            self.stats.forget(evicted)
+
+    def set_host_rate(self, url_or_host: str, rate: float, burst: Optional[int] = None):
+        """
+        Override the rate for one host (e.g., from robots.txt Crawl-delay).
+
+        Args:
+            url_or_host: URL or host name
+            rate: Requests per second for this host
+            burst: Burst size for this host (defaults to the limiter's burst)
+        """
+        host = self._host(url_or_host)
+        with self._lock:
+            self._store(host, TokenBucket(rate, burst if burst is not None else self.burst))
+
+    def reserve(self, url_or_host: str, stats: Optional[WaitStats] = None) -> float:
+        """
+        Reserve a request slot for a host.
+
+        Args:
+            url_or_host: URL or host name
+            stats: Extra counters to record the request in (e.g., one crawl job's)
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        host = self._host(url_or_host)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.burst)
+            self._store(host, bucket)
+            wait = bucket.reserve(time.monotonic())
+
+        self.stats.record(host, wait)
+        if stats is not None:
+            stats.record(host, wait)
+        return wait
+
+    def acquire(self, url_or_host: str, stats: Optional[WaitStats] = None) -> float:
+        """
+        Block the calling thread until a request to the host is allowed.
+
+        Args:
+            url_or_host: URL or host name
+            stats: Extra counters to record the request in
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve(url_or_host, stats)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, url_or_host: str, stats: Optional[WaitStats] = None) -> float:
+        """
+        Wait without blocking the event loop until a request to the host is allowed.
+
+        Args:
+            url_or_host: URL or host name
+            stats: Extra counters to record the request in
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve(url_or_host, stats)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def reset_stats(self):
+        """Reset wait-time counters."""
+        self.stats.reset()
+
+    def get_stats(self) -> Dict[str, object]:
+        """
+        Get wait-time statistics for every request through this limiter.
+
+        Returns:
+            Dict with totals and a per-host breakdown
+        """
+        return self.stats.get_stats()
@@ -0,0 +1,97 @@
+"""
+Regex engine selection for EmailScope.
+Compiles the extraction and verification patterns with Python's re module
+or, optionally, with RE2's linear-time engine.
+"""
+
+import logging
+import re
+from typing import List
+
+# Optional linear-time engine (pip install google-re2)
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+logger = logging.getLogger(__name__)
+
+class RegexEngine:
+    """Interface for regex engines."""
+
+    name = 'base'
+
+    def compile(self, pattern: str, ignorecase: bool = False):
+        """
+        Compile a pattern.
+
+        Args:
+            pattern: Regular expression (no lookarounds or backreferences, so
+                every engine accepts it)
+            ignorecase: Match case-insensitively
+
+        Returns:
+            Compiled pattern with the re.Pattern search/match/finditer/sub API
+        """
+        raise NotImplementedError
+
+class PythonRegexEngine(RegexEngine):
+    """Python's backtracking re module (the default)."""
+
+    name = 're'
+
+    def compile(self, pattern: str, ignorecase: bool = False):
+        return re.compile(pattern, re.I if ignorecase else 0)
+
+class RE2RegexEngine(RegexEngine):
+    """
+    Google RE2: matching time is linear in the input, whatever the pattern.
+
+    RE2 treats \\b, \\w and \\s as ASCII-only and $ as the end of the text
+    (re also accepts a trailing newline), so results can differ on inputs
+    that depend on those.
+    """
+
+    name = 're2'
+
+    def compile(self, pattern: str, ignorecase: bool = False):
+        options = re2.Options()
+        options.case_sensitive = not ignorecase
+        return re2.compile(pattern, options)
+
+REGEX_ENGINES = {
+    PythonRegexEngine.name: PythonRegexEngine,
+    RE2RegexEngine.name: RE2RegexEngine,
+}
+
+def available_regex_engines() -> List[str]:
+    """Return the names of engines whose dependencies are installed."""
+    names = [PythonRegexEngine.name]
+    if re2 is not None:
+        names.append(RE2RegexEngine.name)
+    return names
+
+def get_regex_engine(name: str = 're') -> RegexEngine:
+    """
+    Create a regex engine by name.
+
+    Falls back to the re engine when the requested engine's dependency is
+    not installed.
+
+    Args:
+        name: 're' or 're2'
+
+    Returns:
+        Regex engine instance
+
+    Raises:
+        ValueError: If the engine name is unknown
+    """
+    if name not in REGEX_ENGINES:
+        raise ValueError(f"Unknown regex engine: {name} (choose from {', '.join(REGEX_ENGINES)})")
+
+    if name not in available_regex_engines():
+        logger.warning(f"Regex engine '{name}' is not installed, falling back to re")
+        name = PythonRegexEngine.name
+
+    return REGEX_ENGINES[name]()
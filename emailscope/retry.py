@@ -0,0 +1,224 @@
+"""
+Retry module for EmailScope.
+Jittered exponential backoff with Retry-After support and per-host circuit breakers.
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+import requests
+
+# Statuses worth retrying: rate limited or temporarily unavailable
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+class RetryPolicy:
+    """Decides whether a failed request is retried and how long to wait first."""
+
+    def __init__(self, retries: int = 2, backoff: float = 0.5, max_backoff: float = 30.0,
+                 retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES):
+        """
+        Initialize the policy.
+
+        Args:
+            retries: Retries after the first attempt
+            backoff: Base delay in seconds, doubled on each retry
+            max_backoff: Longest delay worth waiting; a longer Retry-After gives up
+            retry_statuses: HTTP statuses that are retried
+        """
+        self.retries = max(0, retries)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def is_retryable(self, error: Exception) -> bool:
+        """
+        Check whether an error is transient.
+
+        Connection resets and refused connections are retried; timeouts are
+        not, since a slow host usually stays slow and each retry would cost
+        another full timeout.
+        """
+        if isinstance(error, CircuitOpenError) or isinstance(error, requests.Timeout):
+            return False
+        if isinstance(error, (requests.ConnectionError, requests.exceptions.ChunkedEncodingError)):
+            return True
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            return error.response.status_code in self.retry_statuses
+        return False
+
+    def get_delay(self, attempt: int, error: Exception) -> Optional[float]:
+        """
+        Get the wait before the next attempt.
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            error: The error it failed with
+
+        Returns:
+            Seconds to wait, or None if the request should not be retried
+        """
+        if attempt >= self.retries or not self.is_retryable(error):
+            return None
+
+        retry_after = self._retry_after(error)
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_backoff else None
+
+        # Full jitter keeps retries from many workers from synchronizing
+        return random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        """Parse a Retry-After header (seconds or HTTP date) from an error response."""
+        response = getattr(error, 'response', None)
+        value = response.headers.get('Retry-After') if response is not None else None
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    After `failure_threshold` consecutive timeouts or connection failures a
+    host's circuit opens and requests to it are refused for `reset_timeout`
+    seconds. Then one trial request is let through: success, or any HTTP
+    response (even an error status), closes the circuit; another failure
+    opens it again for `reset_timeout`.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 60.0):
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open a host's circuit
+                (0 disables the breaker)
+            reset_timeout: Seconds a circuit stays open before a trial request
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        # Start time of each host's trial request in flight
+        self._trial: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.trips = 0
+        self.rejected = 0
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    @staticmethod
+    def counts_as_failure(error: Exception) -> bool:
+        """Only errors that suggest a dead or hanging host trip the breaker."""
+        return isinstance(error, (requests.Timeout, requests.ConnectionError))
+
+    def allow(self, url: str) -> bool:
+        """
+        Check whether a request to the URL's host may be sent.
+
+        Args:
+            url: URL about to be requested
+
+        Returns:
+            False while the host's circuit is open
+        """
+        if self.failure_threshold <= 0:
+            return True
+        host = self._host(url)
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+            if opened_at is None:
+                return True
+            now = time.monotonic()
+            trial_at = self._trial.get(host)
+            # A trial whose outcome was never recorded (e.g. a cancelled
+            # fetch) is given up after reset_timeout
+            if now - opened_at >= self.reset_timeout and (trial_at is None or now - trial_at >= self.reset_timeout):
+                # Half-open: let a single trial request through
+                self._trial[host] = now
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self, url: str):
+        """Close the host's circuit after a successful request."""
+        host = self._host(url)
+        with self._lock:
+            self._failures.pop(host, None)
+            self._opened_at.pop(host, None)
+            self._trial.pop(host, None)
+
+    def record_failure(self, url: str, error: Exception):
+        """
+        Count a failed request against the host.
+
+        An error carrying an HTTP response (e.g. a 404 or 500) shows the host
+        is up and closes its circuit like a success. Other errors that do not
+        count as failures leave the count alone, but still end a trial: the
+        circuit stays open for another `reset_timeout`.
+
+        Args:
+            url: URL that failed
+            error: The error it failed with
+        """
+        if self.failure_threshold <= 0:
+            return
+        if getattr(error, 'response', None) is not None:
+            self.record_success(url)
+            return
+        host = self._host(url)
+        with self._lock:
+            trial = self._trial.pop(host, None) is not None
+            if not self.counts_as_failure(error):
+                if trial:
+                    self._opened_at[host] = time.monotonic()
+                return
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            if trial or (failures >= self.failure_threshold and host not in self._opened_at):
+                self._opened_at[host] = time.monotonic()
+                self.trips += 1
+
+    def is_open(self, url: str) -> bool:
+        """Check whether the URL's host is currently refused."""
+        with self._lock:
+            return self._host(url) in self._opened_at
+
+    def reset(self):
+        """Close every circuit and reset counters."""
+        with self._lock:
+            self._failures.clear()
+            self._opened_at.clear()
+            self._trial.clear()
+            self.trips = 0
+            self.rejected = 0
+
+    def get_stats(self) -> Dict[str, object]:
+        """
+        Get breaker statistics.
+
+        Returns:
+            Dict with circuits opened, requests refused and currently open hosts
+        """
+        with self._lock:
+            return {
+                'trips': self.trips,
+                'rejected': self.rejected,
+                'open_hosts': sorted(self._opened_at),
+            }
@@ -0,0 +1,252 @@
+"""
+Robots.txt module for EmailScope.
+RFC 9309 parsing and matching with a per-host TTL cache and Crawl-delay.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+import requests
+
+# RFC 9309 requires parsing at least the first 500 KiB
+MAX_ROBOTS_BYTES = 512 * 1024
+
+class RobotsRules:
+    """Parsed robots.txt for one origin, resolved for one user agent."""
+
+    def __init__(self, rules: Optional[List[Tuple[bool, str]]] = None, crawl_delay: Optional[float] = None,
+                 sitemaps: Optional[List[str]] = None, disallow_all: bool = False):
+        """
+        Initialize the rules.
+
+        Args:
+            rules: (allow, pattern) pairs from the matching group(s)
+            crawl_delay: Crawl-delay of the matching group in seconds
+            sitemaps: Sitemap URLs declared anywhere in the file
+            disallow_all: Block every path (robots.txt unreachable)
+        """
+        self.crawl_delay = crawl_delay
+        self.sitemaps = sitemaps or []
+        self.disallow_all = disallow_all
+
+        # Longest pattern first; allow before disallow on equal length
+        self._rules = sorted(
+            ((len(pattern), allow, self._compile(pattern)) for allow, pattern in (rules or [])),
+            key=lambda rule: (-rule[0], not rule[1])
+        )
+
+    @staticmethod
+    def _compile(pattern: str) -> 're.Pattern':
+        """Compile a path pattern with '*' wildcards and a '$' end anchor."""
+        anchored = pattern.endswith('$')
+        if anchored:
+            pattern = pattern[:-1]
+        regex = '.*'.join(re.escape(part) for part in pattern.split('*'))
+        return re.compile(regex + ('$' if anchored else ''))
+
+    @classmethod
+    def parse(cls, content: str, user_agent: str) -> 'RobotsRules':
+        """
+        Parse robots.txt and keep the group(s) that apply to a user agent.
+
+        The group whose user-agent value is the longest prefix of the product
+        token wins; groups with the same value are merged. Without a match the
+        '*' group applies.
+
+        Args:
+            content: robots.txt text
+            user_agent: Crawler product token (e.g., 'EmailScope')
+
+        Returns:
+            Rules for the user agent
+        """
+        token = user_agent.split('/')[0].strip().lower()
+        groups: Dict[str, Tuple[List[Tuple[bool, str]], List[float]]] = {}
+        sitemaps = []
+        current_agents: List[str] = []
+        in_rules = False
+
+        for line in content.splitlines():
+            line = line.split('#', 1)[0].strip()
+            key, sep, value = line.partition(':')
+            if not sep:
+                continue
+            key = key.strip().lower()
+            value = value.strip()
+
+            if key == 'user-agent':
+                if in_rules:
+                    # A user-agent line after rules starts a new group
+                    current_agents = []
+                    in_rules = False
+                agent = value.split('/')[0].strip().lower()
+                if not agent:
+                    # An empty value names no crawler (and would prefix-match every token)
+                    continue
+                current_agents.append(agent)
+                groups.setdefault(agent, ([], []))
+            elif key in ('allow', 'disallow'):
+                in_rules = True
+                if not value:
+                    # An empty Disallow allows everything
+                    continue
+                for agent in current_agents:
+                    groups[agent][0].append((key == 'allow', value))
+            elif key == 'crawl-delay':
+                in_rules = True
+                try:
+                    delay = float(value)
+                except ValueError:
+                    continue
+                for agent in current_agents:
+                    groups[agent][1].append(delay)
+            elif key == 'sitemap' and value:
+                sitemaps.append(value)
+
+        matches = [agent for agent in groups if agent != '*' and token.startswith(agent)]
+        chosen = max(matches, key=len) if matches else ('*' if '*' in groups else None)
+        if chosen is None:
+            return cls(sitemaps=sitemaps)
+
+        rules, delays = groups[chosen]
+        return cls(rules, crawl_delay=max(delays) if delays else None, sitemaps=sitemaps)
+
+    def can_fetch(self, url: str) -> bool:
+        """
+        Check whether a URL may be crawled.
+
+        Args:
+            url: Absolute URL or path
+
+        Returns:
+            True if no rule blocks the URL
+        """
+        parts = urlsplit(url)
+        path = parts.path or '/'
+        if path == '/robots.txt':
+            return True
+        if self.disallow_all:
+            return False
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        for _, allow, regex in self._rules:
+            if regex.match(path):
+                return allow
+        return True
+
+class RobotsCache:
+    """
+    Thread-safe per-origin robots.txt cache with a TTL.
+
+    One cache can be shared by several crawlers so robots.txt is fetched
+    once per origin per TTL instead of once per job.
+    """
+
+    def __init__(self, fetch: Callable[[str], requests.Response], user_agent: str = 'EmailScope',
+                 ttl: float = 3600, error_ttl: float = 300, max_hosts: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            fetch: Function returning a streamed response for a URL (any status)
+            user_agent: Product token matched against User-agent lines
+            ttl: Seconds a fetched robots.txt stays valid
+            error_ttl: Seconds an unreachable robots.txt stays cached
+            max_hosts: Maximum origins kept (least recently used are dropped)
+        """
+        self.fetch = fetch
+        self.user_agent = user_agent
+        self.ttl = ttl
+        self.error_ttl = error_ttl
+        self.max_hosts = max_hosts
+        self.logger = logging.getLogger(__name__)
+
+        self._entries: 'OrderedDict[str, Tuple[float, RobotsRules]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _origin(url: str) -> str:
+        """Return scheme://host[:port] for a URL."""
+        parts = urlsplit(url)
+        return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+    def get(self, url: str) -> RobotsRules:
+        """
+        Get the robots.txt rules for a URL's origin, fetching them if needed.
+
+        Args:
+            url: Any URL on the origin
+
+        Returns:
+            Rules for the origin
+        """
+        origin = self._origin(url)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(origin)
+            if entry and entry[0] > now:
+                self._entries.move_to_end(origin)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        rules, ttl = self._load(origin)
+
+        with self._lock:
+            self._entries[origin] = (time.monotonic() + ttl, rules)
+            self._entries.move_to_end(origin)
+            while len(self._entries) > self.max_hosts:
+                self._entries.popitem(last=False)
+        return rules
+
+    def _load(self, origin: str) -> Tuple[RobotsRules, float]:
+        """
+        Fetch and parse robots.txt, following RFC 9309 status handling.
+
+        Returns:
+            Tuple of (rules, seconds to cache them)
+        """
+        robots_url = urljoin(origin, '/robots.txt')
+        try:
+            response = self.fetch(robots_url)
+            try:
+                if 400 <= response.status_code < 500:
+                    # Unavailable: no restrictions
+                    return RobotsRules(), self.ttl
+                if response.status_code >= 500:
+                    raise requests.HTTPError(f"{response.status_code} for {robots_url}")
+
+                chunks = []
+                size = 0
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= MAX_ROBOTS_BYTES:
+                        break
+                content = b''.join(chunks)[:MAX_ROBOTS_BYTES].decode('utf-8', 'replace')
+            finally:
+                response.close()
+        except requests.RequestException as e:
+            # Unreachable: assume complete disallow, and retry sooner
+            self.logger.warning(f"robots.txt unreachable for {origin}: {e}")
+            return RobotsRules(disallow_all=True), self.error_ttl
+
+        return RobotsRules.parse(content, self.user_agent), self.ttl
+
+    def clear(self):
+        """Forget all cached robots.txt files."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache hit/miss counters and the number of cached origins."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'hosts': len(self._entries)}
@@ -0,0 +1,247 @@
+"""
+Email scanning module for EmailScope.
+Finds plain, spaced, parenthesized, obfuscated and keyword-context email
+candidates in a single linear pass.
+"""
+
+import re
+import string
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .budget import Deadline
+from .regex_engine import RegexEngine, get_regex_engine
+
+# Character classes of the email forms (the '|' in the TLD class is
+# historical; candidates containing it fail validation)
+_DOMAIN = r'[A-Za-z0-9.-]'
+_TLD = r'[A-Z|a-z]'
+
+LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + '._%+-')
+
+# With IGNORECASE, the ASCII letter ranges also match these four letters
+LOCAL_CHARS_IGNORECASE = LOCAL_CHARS | frozenset('İıſK')
+
+# Letters that IGNORECASE matches against ASCII letters but str.lower()
+# does not map to them
+_UNLOWERED_LETTERS = 'İıſ'
+
+# The characters re's \s matches in str patterns, spelled out so other
+# engines match the same whitespace
+_WHITESPACE = ('[\t\n\x0b\x0c\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a'
+               '\u2028\u2029\u202f\u205f\u3000]')
+
+# Every candidate contains one of these: '@', '[at]' or whitespace + 'at'
+# (the whitespace after 'at' is checked separately so that 'at at' yields
+# two anchors). Nothing else is looked at twice.
+_ANCHOR_PATTERN = rf'@|\[at\]|{_WHITESPACE}at'
+
+# What has to follow an anchor, matched in place
+_PLAIN_DOMAIN = re.compile(rf'{_DOMAIN}+\.{_TLD}{{2,}}\b')
+_SPACED_DOMAIN = re.compile(rf'\s*{_DOMAIN}+\.{_TLD}{{2,}}\b')
+_PAREN_DOMAIN = re.compile(rf'{_DOMAIN}+\.{_TLD}{{2,}}\)')
+_CONTEXT_DOMAIN = re.compile(rf'{_DOMAIN}+\.{_TLD}{{2,}}', re.I)
+_AT_DOT_REST = re.compile(rf'\s+at\s+({_DOMAIN}+)\s+dot\s+({_TLD}{{2,}})\b', re.I)
+_BRACKET_REST = re.compile(rf'\s*\[at\]\s*({_DOMAIN}+)\s*\[dot\]\s*({_TLD}{{2,}})\b', re.I)
+
+_BOUNDARY = re.compile(r'\b')
+
+def _run_start(text: str, end: int, chars: frozenset, floor: int = 0) -> int:
+    """Return where the run of `chars` ending at `end` starts (not before floor)."""
+    start = end
+    while start > floor and text[start - 1] in chars:
+        start -= 1
+    return start
+
+def _space_start(text: str, end: int) -> int:
+    """Return where the whitespace ending at `end` starts."""
+    start = end
+    while start > 0 and text[start - 1].isspace():
+        start -= 1
+    return start
+
+def _word_start(text: str, start: int, end: int) -> int:
+    """Return the first word boundary in [start, end), or -1."""
+    if start >= end:
+        return -1
+    match = _BOUNDARY.search(text, start, end)
+    return match.start() if match and match.start() < end else -1
+
+class EmailScanner:
+    """
+    Single-pass email candidate scanner.
+
+    Recognizes the forms EmailExtractor has always searched for:
+
+    - plain addresses (user@example.com), also with spaces around the @
+      or wrapped in parentheses
+    - 'user at example dot com' and 'user[at]example[dot]com'
+    - addresses following a context keyword such as 'email' or 'contact'
+      (these may start right after the keyword, e.g. 'emailjoe@x.com'
+      gives 'joe@x.com')
+
+    Each form used to be a separate regex run over the whole page; keyword
+    context patterns in particular rescanned the text after every keyword,
+    which is quadratic on long pages without an @. Here one precompiled
+    regex finds the anchors every candidate must contain ('@', ' at ',
+    '[at]'). Each anchor is resolved with anchored matches of its
+    surroundings, and each form keeps its own scan position, so the
+    candidates are exactly those the separate patterns produced.
+
+    The page-wide anchor search can run on RE2. The matches around each
+    anchor only read that anchor's neighbourhood and have no nested
+    quantifiers, so they stay on re and stay linear.
+    """
+
+    def __init__(self, context_keywords: Iterable[str] = (), engine: Optional[RegexEngine] = None):
+        """
+        Initialize the scanner.
+
+        Args:
+            context_keywords: Words after which the next address is taken
+            engine: Regex engine for the page-wide anchor search (default re)
+        """
+        self.engine = engine or get_regex_engine()
+        self._anchor = self.engine.compile(_ANCHOR_PATTERN, ignorecase=True)
+        self.context_keywords = list(context_keywords)
+        self._keywords = [re.compile(re.escape(keyword), re.I) for keyword in self.context_keywords]
+        # Lowercased keywords for str.find on lowercased text, which is
+        # several times faster than case-insensitive regex searches
+        self._lowered_keywords = ([keyword.lower() for keyword in self.context_keywords]
+                                  if all(keyword.isascii() for keyword in self.context_keywords) else None)
+
+    def scan(self, text: str, deadline: Optional[Deadline] = None, min_end: int = 0) -> Iterator[Tuple[str, bool]]:
+        """
+        Find email candidates.
+
+        Args:
+            text: Text to scan
+            deadline: Optional time limit; the scan stops at the first anchor
+                found after it expires
+            min_end: Only yield candidates ending after this position (text
+                up to it was scanned before, e.g. by an incremental feeder)
+
+        Yields:
+            Tuples of (candidate, obfuscated). Plain candidates are raw text
+            still to be normalized; obfuscated ones are already rewritten as
+            'user@domain.tld'.
+        """
+        if not text:
+            return
+
+        # Where each form's previous match ended, as its own findall would
+        ends = dict.fromkeys(('plain', 'spaced', 'paren', 'at_dot', 'bracket'), 0)
+        keyword_ends = [0] * len(self._keywords)
+        lowered = self._lowered(text)
+
+        for anchor in self._anchor.finditer(text):
+            if deadline is not None and deadline.expired():
+                return
+            position = anchor.start()
+            token = anchor.group()
+
+            if token == '@':
+                for candidate, end in self._scan_at(text, lowered, position, ends, keyword_ends):
+                    if end > min_end:
+                        yield candidate, False
+                continue
+
+            # 'user at domain dot tld' / 'user[at]domain[dot]tld'
+            if token[0] == '[':
+                form, rest_pattern = 'bracket', _BRACKET_REST
+            else:
+                after = anchor.end()
+                if after == len(text) or not text[after].isspace():
+                    continue
+                form, rest_pattern = 'at_dot', _AT_DOT_REST
+                position += 1
+            local_end = _space_start(text, position)
+            local_start = _run_start(text, local_end, LOCAL_CHARS_IGNORECASE, ends[form])
+            if local_start == local_end:
+                continue
+            rest = rest_pattern.match(text, local_end)
+            if not rest:
+                continue
+            start = _word_start(text, local_start, local_end)
+            if start >= 0:
+                ends[form] = rest.end()
+                if rest.end() > min_end:
+                    yield f"{text[start:local_end]}@{rest.group(1)}.{rest.group(2)}", True
+
+    def _lowered(self, text: str) -> Optional[str]:
+        """Lowercase the text for keyword search, if that matches IGNORECASE."""
+        if self._lowered_keywords is None:
+            return None
+        if not text.isascii() and any(letter in text for letter in _UNLOWERED_LETTERS):
+            return None
+        return text.lower()
+
+    def _scan_at(self, text: str, lowered: Optional[str], at: int, ends: Dict[str, int],
+                 keyword_ends: List[int]) -> List[Tuple[str, int]]:
+        """
+        Resolve the candidates around one '@'.
+
+        Args:
+            text: Text being scanned
+            lowered: The text lowercased for keyword search, or None
+            at: Position of the '@'
+            ends: Where each form's previous match ended (updated in place)
+            keyword_ends: Where each context keyword's previous match ended
+                (updated in place)
+
+        Returns:
+            Raw candidates with their end positions
+        """
+        candidates = []
+        local_start = _run_start(text, at, LOCAL_CHARS)
+        domain_start = at + 1
+
+        if local_start < at:
+            # user@example.com
+            domain = _PLAIN_DOMAIN.match(text, domain_start)
+            if domain:
+                start = _word_start(text, max(ends['plain'], local_start), at)
+                if start >= 0:
+                    ends['plain'] = domain.end()
+                    candidates.append((text[start:domain.end()], domain.end()))
+
+            # (user@example.com)
+            if local_start > ends['paren'] and text[local_start - 1] == '(':
+                domain = _PAREN_DOMAIN.match(text, domain_start)
+                if domain:
+                    ends['paren'] = domain.end()
+                    candidates.append((text[local_start - 1:domain.end()], domain.end()))
+
+        # user @ example.com
+        spaced_local_end = _space_start(text, at)
+        spaced_local_start = (local_start if spaced_local_end == at
+                              else _run_start(text, spaced_local_end, LOCAL_CHARS))
+        if spaced_local_start < spaced_local_end:
+            domain = _SPACED_DOMAIN.match(text, domain_start)
+            if domain:
+                start = _word_start(text, max(ends['spaced'], spaced_local_start), spaced_local_end)
+                if start >= 0:
+                    ends['spaced'] = domain.end()
+                    candidates.append((text[start:domain.end()], domain.end()))
+
+        # 'email: user@example.com' - the address after the keyword's first
+        # occurrence since its previous match, with no other '@' in between
+        context_start = context_domain = None
+        for index, keyword in enumerate(self._keywords):
+            if lowered is not None:
+                found = lowered.find(self._lowered_keywords[index], keyword_ends[index], at)
+                keyword_end = found + len(self._lowered_keywords[index]) if found >= 0 else -1
+            else:
+                occurrence = keyword.search(text, keyword_ends[index], at)
+                keyword_end = occurrence.end() if occurrence else -1
+            keyword_ends[index] = at + 1
+            if keyword_end < 0:
+                continue
+            if context_start is None:
+                context_start = _run_start(text, at, LOCAL_CHARS_IGNORECASE)
+                context_domain = _CONTEXT_DOMAIN.match(text, domain_start)
+            start = max(keyword_end, context_start)
+            if start < at and context_domain:
+                keyword_ends[index] = context_domain.end()
+                candidates.append((text[start:context_domain.end()], context_domain.end()))
+
+        return candidates
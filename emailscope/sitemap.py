@@ -0,0 +1,227 @@
+"""
+Sitemap discovery module for EmailScope.
+Streams robots.txt Sitemap entries, sitemap indexes and gzipped sitemaps
+without holding whole documents in memory.
+"""
+
+import gzip
+import logging
+import xml.etree.ElementTree as ET
+import zlib
+from collections import deque
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urljoin
+
+import requests
+
+# Sitemaps are capped at 50MB uncompressed by the sitemaps.org protocol
+DEFAULT_MAX_SITEMAP_BYTES = 50 * 1024 * 1024
+
+# Conventional locations tried when robots.txt lists no sitemap
+DEFAULT_SITEMAP_PATHS = ('/sitemap.xml', '/sitemap_index.xml')
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+# Size of the chunks pulled from a streamed response
+READ_CHUNK_SIZE = 64 * 1024
+
+class _ChunkReader:
+    """File-like reader over an iterator of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self.chunks = iter(chunks)
+        self.buffer = b''
+
+    def peek(self, size: int) -> bytes:
+        """Return up to `size` bytes without consuming them."""
+        while len(self.buffer) < size:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            self.buffer += chunk
+        return self.buffer[:size]
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            data = self.buffer + b''.join(self.chunks)
+            self.buffer = b''
+            return data
+        if not self.buffer:
+            self.buffer = next(self.chunks, b'')
+        data, self.buffer = self.buffer[:size], self.buffer[size:]
+        return data
+
+class _LimitedReader:
+    """File-like wrapper that reports EOF after a byte limit."""
+
+    def __init__(self, stream, limit: int):
+        self.stream = stream
+        self.remaining = limit
+        self.truncated = False
+
+    def read(self, size: int = -1) -> bytes:
+        if self.remaining <= 0:
+            # Probe one byte so a body that ends exactly at the limit is not flagged
+            if not self.truncated and self.stream.read(1):
+                self.truncated = True
+            return b''
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.stream.read(size)
+        self.remaining -= len(data)
+        return data
+
+class SitemapDiscovery:
+    """
+    Discover page URLs from a site's sitemaps.
+
+    Sitemaps are fetched through a caller-supplied function (so the crawler's
+    rate limiting and headers apply), decompressed on the fly when gzipped
+    and parsed incrementally, so memory stays bounded by the XML parser's
+    buffer rather than the sitemap size.
+    """
+
+    def __init__(self, fetch: Callable[[str], requests.Response], max_sitemaps: int = 10,
+                 max_urls: int = 50000, max_bytes: int = DEFAULT_MAX_SITEMAP_BYTES):
+        """
+        Initialize sitemap discovery.
+
+        Args:
+            fetch: Function returning a streamed, successful response for a URL
+            max_sitemaps: Maximum number of sitemap documents fetched per site
+            max_urls: Maximum number of page URLs yielded per site
+            max_bytes: Maximum uncompressed bytes read from one document
+        """
+        self.fetch = fetch
+        self.max_sitemaps = max_sitemaps
+        self.max_urls = max_urls
+        self.max_bytes = max_bytes
+        self.logger = logging.getLogger(__name__)
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Reset discovery counters."""
+        self.stats: Dict[str, int] = {'sitemaps': 0, 'urls': 0, 'errors': 0}
+
+    def find_sitemaps(self, base_url: str) -> List[str]:
+        """
+        List sitemap URLs declared in robots.txt, or the conventional locations.
+
+        Args:
+            base_url: Site root URL
+
+        Returns:
+            Sitemap URLs to try, in order
+        """
+        sitemaps = []
+        try:
+            response = self.fetch(urljoin(base_url, '/robots.txt'))
+            try:
+                robots = self._open_body(response, limit=512 * 1024).read()
+            finally:
+                response.close()
+            for line in robots.decode('utf-8', 'replace').splitlines():
+                key, _, value = line.partition(':')
+                if key.strip().lower() == 'sitemap' and value.strip():
+                    sitemaps.append(urljoin(base_url, value.strip()))
+        except (requests.RequestException, OSError, zlib.error) as e:
+            self.logger.debug(f"No robots.txt sitemaps for {base_url}: {e}")
+
+        return sitemaps or [urljoin(base_url, path) for path in DEFAULT_SITEMAP_PATHS]
+
+    def iter_urls(self, base_url: str, declared: Optional[List[str]] = None) -> Iterator[str]:
+        """
+        Yield page URLs from the site's sitemaps, following sitemap indexes.
+
+        Args:
+            base_url: Site root URL
+            declared: Sitemap URLs already read from robots.txt (None fetches
+                robots.txt; an empty list goes straight to the default paths)
+
+        Yields:
+            Page URLs in sitemap order
+        """
+        if declared is None:
+            sitemaps = self.find_sitemaps(base_url)
+        else:
+            sitemaps = [urljoin(base_url, url) for url in declared]
+            sitemaps = sitemaps or [urljoin(base_url, path) for path in DEFAULT_SITEMAP_PATHS]
+        queue = deque(sitemaps)
+        seen: Set[str] = set()
+        found_sitemap = False
+
+        while queue and self.stats['sitemaps'] < self.max_sitemaps:
+            sitemap_url = queue.popleft()
+            if sitemap_url in seen:
+                continue
+            seen.add(sitemap_url)
+
+            try:
+                response = self.fetch(sitemap_url)
+            except requests.RequestException as e:
+                self.logger.debug(f"Skipping sitemap {sitemap_url}: {e}")
+                continue
+
+            self.stats['sitemaps'] += 1
+            found_sitemap = True
+            try:
+                for kind, loc in self._iter_locs(response):
+                    if kind == 'sitemap':
+                        queue.append(urljoin(sitemap_url, loc))
+                    else:
+                        self.stats['urls'] += 1
+                        yield urljoin(sitemap_url, loc)
+                        if self.stats['urls'] >= self.max_urls:
+                            return
+            except (ET.ParseError, OSError, EOFError, zlib.error, requests.RequestException) as e:
+                # Keep the URLs read before the error
+                self.stats['errors'] += 1
+                self.logger.debug(f"Stopped reading sitemap {sitemap_url}: {e}")
+            finally:
+                response.close()
+
+        if not found_sitemap:
+            self.logger.debug(f"No sitemap found for {base_url}")
+
+    def _open_body(self, response: requests.Response, limit: int) -> _LimitedReader:
+        """Return a size-limited reader over the body, gunzipping it if needed."""
+        # iter_content undoes Content-Encoding: gzip
+        chunks = _ChunkReader(response.iter_content(chunk_size=READ_CHUNK_SIZE))
+
+        # .xml.gz files are served gzipped without a Content-Encoding header
+        stream = gzip.GzipFile(fileobj=chunks) if chunks.peek(2) == GZIP_MAGIC else chunks
+        return _LimitedReader(stream, limit)
+
+    def _iter_locs(self, response: requests.Response) -> Iterator[Tuple[str, str]]:
+        """
+        Parse a sitemap or sitemap index incrementally.
+
+        Yields:
+            Tuples of ('url' or 'sitemap', location)
+        """
+        reader = self._open_body(response, self.max_bytes)
+        root = None
+        namespace = ''
+        parent = None
+
+        for event, elem in ET.iterparse(reader, events=('start', 'end')):
+            tag = elem.tag.rsplit('}', 1)[-1]
+            if event == 'start':
+                if root is None:
+                    root = elem
+                    namespace = elem.tag[:-len(tag)]
+                if tag in ('url', 'sitemap'):
+                    parent = tag
+                continue
+
+            # Extension elements such as image:loc live in other namespaces
+            in_namespace = elem.tag[:-len(tag)] == namespace
+            if tag == 'loc' and in_namespace and parent and elem.text and elem.text.strip():
+                yield parent, elem.text.strip()
+            elif tag in ('url', 'sitemap'):
+                parent = None
+                # Drop finished entries so the tree does not grow with the document
+                root.clear()
+
+        if reader.truncated:
+            self.logger.debug(f"Sitemap truncated at {self.max_bytes} bytes")
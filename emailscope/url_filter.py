@@ -0,0 +1,154 @@
+"""
+URL filtering module for EmailScope.
+Precompiled link classification and URL canonicalization for the crawl loop.
+"""
+
+import re
+from typing import Iterable, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from .keywords import literal_alternation
+
+# Common non-content URL fragments
+DEFAULT_SKIP_PATTERNS = [
+    '/wp-admin/', '/admin/', '/login/', '/register/', '/signup/',
+    '/logout/', '/api/', '/ajax/', '/static/', '/assets/', '/css/',
+    '/js/', '/images/', '/img/', '/photos/', '/videos/', '/media/',
+    '/download/', '/files/', '/documents/', '/pdf/', '/doc/',
+    '/search/', '/filter/', '/sort/', '/page/', '/tag/', '/category/',
+    '/archive/', '/feed/', '/rss/', '/sitemap', '/robots.txt',
+    '/favicon.ico', '/apple-touch-icon', '/manifest.json'
+]
+
+# File extensions that never contain crawlable HTML
+DEFAULT_SKIP_EXTENSIONS = [
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+    '.zip', '.rar', '.tar', '.gz', '.jpg', '.jpeg', '.png', '.gif',
+    '.svg', '.ico', '.css', '.js', '.xml', '.json', '.txt'
+]
+
+# Query parameters that only carry tracking information (generic names
+# such as 'ref' are left alone: sites also use them to select content)
+TRACKING_PARAMS = frozenset([
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content', 'utm_id',
+    'gclid', 'dclid', 'fbclid', 'msclkid', 'yclid', 'mc_cid', 'mc_eid',
+    '_ga', '_gl', '_hsenc', '_hsmi', 'igshid'
+])
+
+DEFAULT_PORTS = {'http': '80', 'https': '443'}
+
+# Host of an absolute URL, without userinfo, port or leading 'www.'
+# (IPv6 literals keep their brackets)
+HOST_PATTERN = re.compile(r'^[a-z][a-z0-9+.-]*://(?:[^@/?#]*@)?(?:www\.)?(\[[^\]/?#]*\]|[^:/?#]*)', re.I)
+
+def canonicalize_url(url: str, strip_tracking: bool = True) -> str:
+    """
+    Canonicalize a URL so equivalent spellings compare equal.
+
+    Lowercases scheme and host, drops default ports and fragments, drops
+    tracking query parameters and sorts the remaining ones. The path is
+    kept as spelled, trailing slash included: the canonical URL is also the
+    one fetched, and servers redirect between '/about' and '/about/'.
+
+    Args:
+        url: Absolute URL
+        strip_tracking: Whether to drop tracking query parameters
+
+    Returns:
+        Canonical URL
+    """
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if ':' in host:
+        # hostname strips an IPv6 literal's brackets
+        host = f"[{host}]"
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host
+    if port is not None and str(port) != DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{port}"
+
+    path = parts.path or '/'
+
+    query = ''
+    if parts.query:
+        params = parse_qsl(parts.query, keep_blank_values=True)
+        if strip_tracking:
+            params = [(key, value) for key, value in params if key.lower() not in TRACKING_PARAMS]
+        query = urlencode(sorted(params))
+
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+def site_host(url_or_host: str) -> str:
+    """Return the lowercase host of a URL without port or leading 'www.'."""
+    match = HOST_PATTERN.match(url_or_host)
+    if match:
+        return match.group(1).lower()
+    host = url_or_host.split('/')[0].split(':')[0].lower()
+    return host[4:] if host.startswith('www.') else host
+
+class URLClassifier:
+    """
+    Precompiled link filter built once per crawler.
+
+    Skip patterns and skip extensions are folded into one regular
+    expression, so each link costs a single scan instead of one substring
+    test per pattern.
+    """
+
+    def __init__(self, skip_patterns: Optional[Iterable[str]] = None,
+                 skip_extensions: Optional[Iterable[str]] = None):
+        """
+        Initialize the classifier.
+
+        Args:
+            skip_patterns: URL substrings marking non-content pages
+            skip_extensions: File extensions marking non-HTML resources
+        """
+        patterns = list(skip_patterns if skip_patterns is not None else DEFAULT_SKIP_PATTERNS)
+        extensions = list(skip_extensions if skip_extensions is not None else DEFAULT_SKIP_EXTENSIONS)
+
+        # Patterns match anywhere; extensions only at the end of the path
+        branches = []
+        if patterns:
+            branches.append(literal_alternation(pattern.lower() for pattern in patterns))
+        if extensions:
+            branches.append(f"(?:{literal_alternation(ext.lower() for ext in extensions)})(?=[?#]|$)")
+        self._skip_re = re.compile('|'.join(branches)) if branches else None
+
+    def is_same_site(self, url: str, host: str) -> bool:
+        """
+        Check that a URL belongs to the given site.
+
+        Args:
+            url: Absolute URL
+            host: Site host as returned by site_host()
+
+        Returns:
+            True if the URL host equals the site host (ignoring 'www.')
+        """
+        return site_host(url) == host
+
+    def is_skipped(self, url: str) -> bool:
+        """Check whether a URL points at a non-content page or file."""
+        return self._skip_re is not None and self._skip_re.search(url.lower()) is not None
+
+    def accept(self, url: str, host: str) -> bool:
+        """
+        Check whether a link should be crawled.
+
+        Args:
+            url: Absolute URL
+            host: Site host as returned by site_host()
+
+        Returns:
+            True if the link is on the site and looks like content
+        """
+        return self.is_same_site(url, host) and not self.is_skipped(url)
@@ -6,31 +6,46 @@ Performs MX and SMTP checks to verify email addresses.
 import dns.resolver
 import logging
 import socket
-import re
 import json
 import urllib.request
 from typing import List, Tuple, Optional, Dict
 
+from .budget import Deadline
+from .regex_engine import get_regex_engine
+
 class EmailVerifier:
     """Verifies email addresses using MX and SMTP checks."""
     
-    def __init__(self, timeout: int = 1, mock_dns: bool = False):
+    def __init__(self, timeout: int = 1, mock_dns: bool = False, regex_engine: str = 're'):
         """
         Initialize the verifier.
         
         Args:
             timeout: Timeout for network operations
             mock_dns: If True, skip DNS checks for testing
+            regex_engine: 're' or 're2' (linear-time, needs google-re2;
+                falls back to re when missing)
         """
         self.timeout = timeout
         self.mock_dns = mock_dns
         self.logger = logging.getLogger(__name__)
+        self.regex_engine = get_regex_engine(regex_engine)
         
         # Enhanced email validation patterns (allows + in local part)
-        self.email_pattern = re.compile(
+        self.email_pattern = self.regex_engine.compile(
             r'^[a-zA-Z0-9]([a-zA-Z0-9._+-]*[a-zA-Z0-9])?@[a-zA-Z0-9]([a-zA-Z0-9.-]*[a-zA-Z0-9])?\.[a-zA-Z]{2,}$'
         )
         
+        # Disposable service names and suspicious domain shapes
+        self.disposable_pattern = self.regex_engine.compile(
+            r'temp.*mail|throw.*away|fake.*mail|test.*mail|no.*reply|noreply|do.*not.*reply', ignorecase=True
+        )
+        self.suspicious_patterns = [
+            self.regex_engine.compile(r'[0-9]{4,}'),  # Many numbers
+            self.regex_engine.compile(r'[a-z]{1,2}[0-9]{3,}'),  # Short letters + many numbers
+            self.regex_engine.compile(r'[0-9]{3,}[a-z]{1,2}'),  # Many numbers + short letters
+        ]
+        
         # Disposable email domains (common ones)
         self.disposable_domains = {
             '10minutemail.com', 'tempmail.org', 'guerrillamail.com', 'mailinator.com',
@@ -44,12 +59,14 @@ class EmailVerifier:
             'aol.com', 'protonmail.com', 'zoho.com', 'fastmail.com'
         }
     
-    def verify_email(self, email: str) -> Tuple[bool, int, str]:
+    def verify_email(self, email: str, deadline: Optional[Deadline] = None) -> Tuple[bool, int, str]:
         """
         Verify an email address using enhanced validation methods.
         
         Args:
             email: Email address to verify
+            deadline: Optional time budget; DNS lookups are capped to the
+                time left and skipped once it has expired
             
         Returns:
             Tuple of (is_valid, confidence_score, reason)
@@ -74,8 +91,11 @@ class EmailVerifier:
             # Mock DNS for testing - assume valid for all domains in test
             mx_valid = True
             mx_reason = "Mock DNS - assumed valid"
+        elif deadline is not None and deadline.expired():
+            return False, 0, "Not verified: time budget exhausted"
         else:
-            mx_valid, mx_reason = self._check_mx_record(domain)
+            lifetime = deadline.timeout() if deadline is not None else None
+            mx_valid, mx_reason = self._check_mx_record(domain, lifetime)
             if not mx_valid:
                 return False, 0, f"MX check failed: {mx_reason}"
         
@@ -169,14 +189,8 @@ class EmailVerifier:
             return True, f"Known disposable domain: {domain}"
         
         # Check for common disposable patterns
-        disposable_patterns = [
-            r'temp.*mail', r'throw.*away', r'fake.*mail', r'test.*mail',
-            r'no.*reply', r'noreply', r'do.*not.*reply'
-        ]
-        
-        for pattern in disposable_patterns:
-            if re.search(pattern, domain, re.IGNORECASE):
-                return True, f"Disposable pattern detected: {domain}"
+        if self.disposable_pattern.search(domain):
+            return True, f"Disposable pattern detected: {domain}"
         
         return False, "Not disposable"
     
@@ -195,14 +209,8 @@ class EmailVerifier:
             return 90, f"High reputation domain: {domain}"
         
         # Check for suspicious patterns
-        suspicious_patterns = [
-            r'[0-9]{4,}',  # Many numbers
-            r'[a-z]{1,2}[0-9]{3,}',  # Short letters + many numbers
-            r'[0-9]{3,}[a-z]{1,2}',  # Many numbers + short letters
-        ]
-        
-        for pattern in suspicious_patterns:
-            if re.search(pattern, domain):
+        for pattern in self.suspicious_patterns:
+            if pattern.search(domain):
                 return 20, f"Suspicious pattern: {domain}"
         
         # Check domain length (very short or very long domains are suspicious)
@@ -261,18 +269,19 @@ class EmailVerifier:
         
         return min(max(base_score, 0), 100)
     
-    def _check_mx_record(self, domain: str) -> Tuple[bool, str]:
+    def _check_mx_record(self, domain: str, lifetime: Optional[float] = None) -> Tuple[bool, str]:
         """
         Check if domain has valid MX record.
         
         Args:
             domain: Domain to check
+            lifetime: Seconds the lookup may take (None for the resolver default)
             
         Returns:
             Tuple of (is_valid, reason)
         """
         try:
-            mx_records = dns.resolver.resolve(domain, 'MX')
+            mx_records = dns.resolver.resolve(domain, 'MX', lifetime=lifetime)
             if mx_records:
                 return True, f"Found {len(mx_records)} MX records"
             else:
@@ -65,19 +65,33 @@ def get_free_render_config():
             'max_depth': 1,         # Only 1 level deep
             'max_pages': 5,         # More pages (5 vs 3)
             'rate_limit': 2.5,      # Moderate rate (2.5s vs 5s)
+            'rate_burst': 2,        # Allow 2 back-to-back requests per host
+            'crawl_strategy': 'best_first',  # Most relevant pages first
+            'early_stop_emails': 2,  # Stop once a contact/about/team page yields 2 emails
+            'parser': 'lxml',       # Fast HTML parser (falls back to html.parser if missing)
+            'max_page_bytes': 1024 * 1024,  # Cap each page at 1MB on the 512MB instance
+            'http_cache_path': 'http_cache.db',      # Revalidate pages on monthly re-scrapes
+            'http_cache_max_bytes': 50 * 1024 * 1024,  # Keep the on-disk cache under 50MB
+            'use_sitemaps': True,   # Seed the crawl from robots.txt/sitemap.xml
+            'regex_engine': 're2',  # Linear-time regexes (google-re2 is pinned in the requirements)
+            'max_extract_seconds': 2,  # Cut off pathological pages instead of stalling the job
+            'extract_processes': 0,  # Extract on the threads: worker processes would not fit in 512MB
+            'scan_bytes': True,     # Refetched pages are scanned as bytes, without a parse tree
             
             # Email verification settings
             'verification_timeout': 10,  # Longer DNS timeout for cloud (10s vs 5s)
             'mock_dns': True,           # Skip DNS checks for free tier (needed for results)
             
             # Process management
-            'max_workers': 1,       # Single worker
+            'max_workers': 1,       # Single worker (also sizes the connection pool)
             'request_retries': 3,   # More retries (3 vs 2)
+            'crawl_concurrency': 2, # Async crawl with 2 fetches in flight
             
             # Free tier specific settings
             'max_emails_per_page': 10,   # More emails per page (10 vs 5)
             'max_total_emails': 20,      # More total emails (20 vs 10)
             'enable_timeout_protection': True,  # Enable timeout protection
+            'job_budget': 25,        # Seconds shared by crawl, extraction and verification
         }
     else:
         print("💻 Local development mode")
@@ -89,10 +103,23 @@ def get_free_render_config():
             'max_depth': 2,
             'max_pages': 15,
             'rate_limit': 1.5,
+            'rate_burst': 3,
+            'crawl_strategy': 'best_first',
+            'early_stop_emails': 3,
+            'parser': 'lxml',
+            'max_page_bytes': 5 * 1024 * 1024,
+            'http_cache_path': 'http_cache.db',
+            'http_cache_max_bytes': 200 * 1024 * 1024,
+            'use_sitemaps': True,
+            'regex_engine': 're',
+            'max_extract_seconds': 5,
+            'extract_processes': 2,
+            'scan_bytes': True,
             'verification_timeout': 3,
             'mock_dns': False,
             'max_workers': 3,
             'request_retries': 3,
+            'crawl_concurrency': 4,
             'max_emails_per_page': 50,
             'max_total_emails': 100,
             'enable_timeout_protection': False,
@@ -0,0 +1,84 @@
+"""
+Tests for crawl checkpoints and the page emails saved with them.
+
+Run with:
+    python -m pytest tests
+"""
+
+import os
+import sqlite3
+import sys
+import time
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from fixture_site import FixtureSite
+from emailscope.crawler import WebCrawler
+from emailscope.database import EmailScopeDB
+
+DOMAIN = 'example.com'
+
+@pytest.fixture
+def db(tmp_path):
+    return EmailScopeDB(str(tmp_path / 'emailscope.db'))
+
+def age_rows(db, table, seconds):
+    with sqlite3.connect(db.db_path) as conn:
+        conn.execute(f'UPDATE {table} SET updated_at = updated_at - ?', (seconds,))
+        conn.commit()
+
+def test_page_emails_expire_after_max_age(db):
+    db.save_page_emails(DOMAIN, 'https://example.com/contact', ['info@example.com'])
+    assert db.get_page_emails(DOMAIN, max_age=60) == {'https://example.com/contact': ['info@example.com']}
+
+    age_rows(db, 'checkpoint_pages', 120)
+    assert db.get_page_emails(DOMAIN, max_age=60) == {}
+    assert db.get_page_emails(DOMAIN) == {'https://example.com/contact': ['info@example.com']}
+
+def test_stale_crawl_checkpoint_drops_page_emails(db):
+    db.save_crawl_checkpoint(DOMAIN, {'start_url': 'https://example.com/'})
+    db.save_page_emails(DOMAIN, 'https://example.com/contact', ['info@example.com'])
+    assert db.load_crawl_checkpoint(DOMAIN, max_age=60) is not None
+
+    age_rows(db, 'crawl_checkpoints', 120)
+    assert db.load_crawl_checkpoint(DOMAIN, max_age=60) is None
+    assert db.load_crawl_checkpoint(DOMAIN) is None
+    assert db.get_page_emails(DOMAIN) == {}
+
+def test_page_emails_from_before_updated_at_count_as_stale(tmp_path):
+    path = str(tmp_path / 'old.db')
+    with sqlite3.connect(path) as conn:
+        conn.execute('CREATE TABLE checkpoint_pages (domain TEXT NOT NULL, url TEXT NOT NULL, '
+                     'emails TEXT NOT NULL, PRIMARY KEY (domain, url))')
+        conn.execute("INSERT INTO checkpoint_pages VALUES ('example.com', 'https://example.com/', '[\"a@example.com\"]')")
+        conn.commit()
+
+    db = EmailScopeDB(path)
+    assert db.get_page_emails(DOMAIN, max_age=24 * 3600) == {}
+    db.save_page_emails(DOMAIN, 'https://example.com/', ['b@example.com'])
+    assert db.get_page_emails(DOMAIN, max_age=24 * 3600) == {'https://example.com/': ['b@example.com']}
+
+def test_crawl_reports_whether_it_resumed(db):
+    with FixtureSite(latency=0) as site:
+        def crawl(max_age):
+            crawler = WebCrawler(delay=0, rate_limit=0, resolve_origin=False, max_pages=10,
+                                 checkpoint_store=db, checkpoint_max_age=max_age)
+            urls = crawler.crawl_company_website(site.url)
+            return urls, crawler.job.resumed
+
+        urls, resumed = crawl(3600)
+        assert urls and not resumed
+
+        again, resumed = crawl(3600)
+        assert resumed and again == urls
+        requests_before = site.request_count
+
+        # A checkpoint past max_age is dropped and the site crawled afresh
+        time.sleep(0.01)
+        fresh, resumed = crawl(0.001)
+        assert not resumed and fresh
+        assert site.request_count > requests_before
@@ -0,0 +1,40 @@
+"""
+Tests for the crawler against the local fixture site.
+
+Run with:
+    python -m pytest tests
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from fixture_site import FixtureSite
+from emailscope.async_crawler import AsyncWebCrawler
+from emailscope.crawler import WebCrawler
+from emailscope.url_filter import canonicalize_url
+
+@pytest.fixture
+def site():
+    with FixtureSite(latency=0) as fixture:
+        yield fixture
+
+@pytest.mark.parametrize('crawler_class', [WebCrawler, AsyncWebCrawler])
+def test_crawl_fetches_directory_pages_without_redirects(site, crawler_class):
+    crawler = crawler_class(delay=0, rate_limit=0, resolve_origin=False, max_pages=50)
+    urls = crawler.crawl_company_website(site.url)
+
+    assert f"{site.url}/about/" in crawler.crawled_urls
+    assert len(crawler.crawled_urls) > 10
+    assert site.redirect_count == 0
+    assert len(urls) == len(set(urls))
+
+def test_canonical_url_keeps_trailing_slash():
+    assert canonicalize_url('HTTP://Example.com:80/About/?b=2&a=1#team') == 'http://example.com/About/?a=1&b=2'
+    assert canonicalize_url('https://example.com') == 'https://example.com/'
+    assert canonicalize_url('https://example.com/about') == 'https://example.com/about'
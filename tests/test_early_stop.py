@@ -0,0 +1,44 @@
+"""
+Tests for the early-stop condition and reuse of its crawl-time scans.
+
+Run with:
+    python -m pytest tests
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from fixture_site import FixtureSite
+from emailscope.crawler import WebCrawler
+from emailscope.extractor import EmailExtractor
+from emailscope.frontier import ContactPageStopCondition
+
+def test_crawl_time_scans_are_reused_for_extraction():
+    extractor = EmailExtractor()
+    stop_condition = ContactPageStopCondition(min_emails=1000, email_finder=extractor.extract_emails_from_content)
+    with FixtureSite(latency=0) as site:
+        crawler = WebCrawler(delay=0, rate_limit=0, resolve_origin=False, max_pages=12)
+        crawler.crawl_company_website(site.url, stop_condition=stop_condition)
+
+    assert set(stop_condition.page_emails) == crawler.crawled_urls
+    for url, content_emails in stop_condition.page_emails.items():
+        page = crawler.page_cache.get(url)
+        expected = extractor.extract_page_emails(page.text, mailto_links=page.mailto_links)
+        extractor.reset_stats()
+        reused = extractor.extract_page_emails(page.text, mailto_links=page.mailto_links,
+                                               content_emails=content_emails)
+        assert reused == expected
+        # The text was not scanned again
+        assert extractor.get_stats()['pages'] == 0
+
+def test_stop_condition_needs_key_page_and_enough_emails():
+    stop_condition = ContactPageStopCondition(min_emails=2)
+    assert not stop_condition.should_stop()
+    stop_condition.emails_seen.update({'a@x.com', 'b@x.com'})
+    assert not stop_condition.should_stop()
+    stop_condition.pages_seen.add('contact')
+    assert stop_condition.should_stop()
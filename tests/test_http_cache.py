@@ -0,0 +1,83 @@
+"""
+Tests for the persistent HTTP cache, against the local fixture site.
+
+Run with:
+    python -m pytest tests
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from fixture_site import LAST_MODIFIED, FixtureSite
+from emailscope.crawler import WebCrawler
+from emailscope.http_cache import HTTPCache
+
+@pytest.fixture
+def site():
+    with FixtureSite(latency=0) as fixture:
+        yield fixture
+
+def make_crawler(cache):
+    return WebCrawler(delay=0, rate_limit=0, retries=0, resolve_origin=False, http_cache=cache)
+
+def test_revalidation_sends_validators_and_reuses_body_on_304(site, tmp_path):
+    cache = HTTPCache(str(tmp_path / 'cache.db'))
+    url = f"{site.url}/contact/"
+
+    body, _ = make_crawler(cache).fetch_body(url)
+    first_request = site.last_headers['/contact/']
+    assert 'If-None-Match' not in first_request
+    assert 'If-Modified-Since' not in first_request
+    assert len(cache) == 1
+
+    sent = site.bytes_sent
+    cached_body, content_type = make_crawler(cache).fetch_body(url)
+    second_request = site.last_headers['/contact/']
+    assert second_request['If-None-Match'].startswith('"')
+    assert second_request['If-Modified-Since'] == LAST_MODIFIED
+
+    assert site.not_modified_count == 1
+    assert site.bytes_sent == sent
+    assert cached_body == body
+    assert content_type.startswith('text/html')
+    assert cache.get_stats()['not_modified'] == 1
+
+def test_eviction_keeps_cache_under_max_bytes(site, tmp_path):
+    paths = ['/', '/about/', '/contact/', '/team/', '/news/', '/careers/']
+    sizes = [len(site.pages[path].encode('utf-8')) for path in paths]
+    max_bytes = sizes[-1] + sizes[-2] + sizes[-3]
+    cache = HTTPCache(str(tmp_path / 'cache.db'), max_bytes=max_bytes)
+    crawler = make_crawler(cache)
+
+    for path in paths:
+        assert crawler.fetch_body(f"{site.url}{path}") is not None
+        assert cache.size() <= max_bytes
+
+    stats = cache.get_stats()
+    assert stats['stores'] == len(paths)
+    assert stats['evictions'] == len(paths) - len(cache)
+    assert stats['evictions'] > 0
+    # The most recently stored pages survive
+    assert len(cache) >= 3
+    assert cache.size() == sum(sizes[-len(cache):])
+
+def test_running_total_tracks_replacements(tmp_path):
+    cache = HTTPCache(str(tmp_path / 'cache.db'), max_bytes=100)
+    cache.put('http://a.test/', b'x' * 60, 'text/html', '"1"', None)
+    cache.put('http://a.test/', b'x' * 30, 'text/html', '"2"', None)
+    cache.put('http://b.test/', b'y' * 60, 'text/html', '"3"', None)
+
+    # Replacing a page counts only its new size, so nothing was evicted
+    assert cache.get_stats()['evictions'] == 0
+    assert cache.size() == 90
+
+    cache.put('http://c.test/', b'z' * 40, 'text/html', '"4"', None)
+    assert cache.get_stats()['evictions'] == 1
+    assert cache.get('http://a.test/') is None
+    assert cache.size() == 100
@@ -0,0 +1,91 @@
+"""
+Tests for origin resolution, alone and inside a crawl job.
+
+Run with:
+    python -m pytest tests
+"""
+
+import io
+import os
+import sys
+import threading
+import time
+
+import pytest
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from fixture_site import FixtureSite
+from emailscope.budget import Deadline
+from emailscope.crawler import WebCrawler
+from emailscope.origin import OriginResolver, origin_candidates
+
+def test_candidates_cover_schemes_and_www():
+    assert origin_candidates('Example.com') == [
+        'https://example.com/', 'https://www.example.com/', 'http://example.com/', 'http://www.example.com/'
+    ]
+
+def test_probes_are_given_only_the_time_left():
+    timeouts = []
+
+    def hanging_fetch(url, timeout):
+        timeouts.append(timeout)
+        time.sleep(timeout)
+        raise requests.Timeout(url)
+
+    resolver = OriginResolver(hanging_fetch, timeout=10, stagger=0.05)
+    start = time.monotonic()
+    assert resolver.resolve('example.com', timeout=0.3) is None
+    assert time.monotonic() - start < 0.6
+    assert timeouts and all(0 < timeout <= 0.3 for timeout in timeouts)
+
+def test_preferred_candidate_wins_and_is_cached():
+    def fetch(url, timeout):
+        response = requests.Response()
+        response.url = url
+        response.raw = io.BytesIO()
+        response.status_code = 200 if url.startswith('http://www.') else 403
+        return response
+
+    resolver = OriginResolver(fetch, stagger=0.01)
+    assert resolver.resolve('example.com') == 'http://www.example.com/'
+    assert resolver.cached('example.com') == 'http://www.example.com/'
+
+def test_crawl_resolves_origin_within_the_job():
+    with FixtureSite(latency=0) as site:
+        crawler = WebCrawler(delay=0, rate_limit=0, max_pages=3, retries=0)
+        probes = []
+        get = crawler.session.get
+
+        def recording_get(url, **kwargs):
+            if threading.current_thread() is not threading.main_thread():
+                probes.append(kwargs['timeout'])
+            return get(url, **kwargs)
+
+        crawler.session.get = recording_get
+        host = site.url.split('://')[1]
+        urls = crawler.crawl_company_website(host, deadline=Deadline(2.0))
+
+        assert urls and urls[0].startswith(f"http://{host}/")
+        # Probes ran on resolver threads, capped to the job's budget, and
+        # were counted in the job's rate-limit stats
+        assert probes and all(timeout <= 2.0 for timeout in probes)
+        assert crawler.get_rate_limit_stats(crawler.job)['requests'] >= len(probes) + len(crawler.crawled_urls)
+
+def test_job_state_is_not_created_implicitly_on_worker_threads():
+    crawler = WebCrawler()
+    errors = []
+
+    def worker():
+        try:
+            crawler._fetch_any_status('http://127.0.0.1:9/')
+        except RuntimeError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert errors
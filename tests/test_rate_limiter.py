@@ -0,0 +1,43 @@
+"""
+Tests for the per-host rate limiter.
+
+Run with:
+    python -m pytest tests
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from emailscope.rate_limiter import HostRateLimiter
+
+def test_buckets_are_bounded_least_recently_used_first():
+    limiter = HostRateLimiter(rate=1.0, burst=1, max_hosts=2)
+    limiter.reserve('http://a.test/')
+    limiter.reserve('http://b.test/')
+    limiter.reserve('http://a.test/page')
+    limiter.reserve('http://c.test/')
+
+    assert list(limiter._buckets) == ['a.test', 'c.test']
+    assert set(limiter.get_stats()['hosts']) == {'a.test', 'c.test'}
+    # Totals still count the dropped host
+    assert limiter.get_stats()['requests'] == 4
+
+def test_dropped_host_starts_with_a_full_bucket():
+    limiter = HostRateLimiter(rate=1.0, burst=1, max_hosts=1)
+    assert limiter.reserve('a.test') == 0
+    assert limiter.reserve('a.test') > 0
+
+    limiter.reserve('b.test')
+    assert limiter.reserve('a.test') == 0
+
+def test_host_override_counts_as_use():
+    limiter = HostRateLimiter(rate=10.0, burst=1, max_hosts=2)
+    limiter.reserve('a.test')
+    limiter.set_host_rate('b.test', 0.5)
+    limiter.reserve('c.test')
+
+    assert list(limiter._buckets) == ['b.test', 'c.test']
+    assert limiter._buckets['b.test'].rate == 0.5
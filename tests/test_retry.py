@@ -0,0 +1,90 @@
+"""
+Tests for the per-host circuit breaker.
+
+Run with:
+    python -m pytest tests
+"""
+
+import os
+import sys
+import time
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from emailscope.retry import CircuitBreaker
+
+URL = 'http://host.test/page'
+
+def http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"{status} error", response=response)
+
+@pytest.fixture
+def breaker():
+    return CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+
+def trip(breaker):
+    breaker.record_failure(URL, requests.Timeout())
+    breaker.record_failure(URL, requests.Timeout())
+    assert breaker.is_open(URL)
+    assert not breaker.allow(URL)
+
+def test_opens_after_consecutive_failures_and_closes_on_trial_success(breaker):
+    trip(breaker)
+    time.sleep(0.06)
+    assert breaker.allow(URL)
+    # Only one trial at a time
+    assert not breaker.allow(URL)
+    breaker.record_success(URL)
+    assert not breaker.is_open(URL)
+    assert breaker.allow(URL)
+
+def test_trial_timeout_reopens_for_another_reset_timeout(breaker):
+    trip(breaker)
+    time.sleep(0.06)
+    assert breaker.allow(URL)
+    breaker.record_failure(URL, requests.Timeout())
+    assert breaker.is_open(URL)
+    assert not breaker.allow(URL)
+    time.sleep(0.06)
+    assert breaker.allow(URL)
+    assert breaker.get_stats()['trips'] == 2
+
+@pytest.mark.parametrize('status', [404, 500])
+def test_trial_ending_in_http_error_closes_circuit(breaker, status):
+    trip(breaker)
+    time.sleep(0.06)
+    assert breaker.allow(URL)
+    breaker.record_failure(URL, http_error(status))
+    assert not breaker.is_open(URL)
+    assert breaker.allow(URL)
+    assert breaker.allow(URL)
+
+def test_trial_ending_in_other_non_counting_error_gets_a_new_trial(breaker):
+    trip(breaker)
+    time.sleep(0.06)
+    assert breaker.allow(URL)
+    breaker.record_failure(URL, requests.TooManyRedirects())
+    assert breaker.is_open(URL)
+    assert not breaker.allow(URL)
+    time.sleep(0.06)
+    assert breaker.allow(URL)
+
+def test_trial_without_recorded_outcome_is_given_up(breaker):
+    trip(breaker)
+    time.sleep(0.06)
+    assert breaker.allow(URL)
+    # The trial fetch was cancelled and never reported back
+    assert not breaker.allow(URL)
+    time.sleep(0.06)
+    assert breaker.allow(URL)
+
+def test_http_error_resets_consecutive_failures(breaker):
+    breaker.record_failure(URL, requests.Timeout())
+    breaker.record_failure(URL, http_error(503))
+    breaker.record_failure(URL, requests.Timeout())
+    assert not breaker.is_open(URL)